@@ -1,10 +1,115 @@
+import re
 import logging
-from typing import List
+from typing import Dict, List, Optional
 from crewai import Agent
-from ..models.schemas import ParsedJobDescription, JobRequirement, JobPlatform
+from ..core.llm_gateway import get_agent_llm
+from ..models.schemas import ParsedJobDescription, JobRequirement, JobSource
+from ..utils.job_posting_parsers import parse_structured_posting
+from ..utils.skill_taxonomy import get_skill_matcher
 
 logger = logging.getLogger(__name__)
 
+# Lines that open a requirements block ("Skills:", "Requirements") or state one ("Experience with Kafka")
+_TRIGGER = re.compile(r"skills|requirements|qualifications|proficient in|experience with", re.IGNORECASE)
+# Words that make a short line a section header even without a trailing ':'
+_HEADER = re.compile(r"skills|requirements|qualifications", re.IGNORECASE)
+_SKILL = re.compile(r"skill", re.IGNORECASE)
+_PREFERRED = re.compile(r"\b(?:preferred|nice to have|plus|advantage)", re.IGNORECASE)
+# "- item", "• item", "* item", "1. item", "2) item"
+_BULLET = re.compile(r"^(?:[-•*▪◦]|\d{1,2}[.)])\s*")
+
+# Requirements collected after a header before the block is considered over
+MAX_BLOCK_REQUIREMENTS = 10
+# Header-word lines at most this long (or trigger lines ending in ':') are headers rather than requirements
+MAX_HEADER_LENGTH = 40
+
+
+def _requirement(description: str, category: str) -> JobRequirement:
+    is_required = not _PREFERRED.search(description)
+    return JobRequirement(
+        category=category,
+        description=description,
+        importance=1.0 if is_required else 0.5,
+        required=is_required
+    )
+
+
+def extract_requirements(lines: List[str]) -> List[JobRequirement]:
+    """
+    Extract requirements in one pass over the job description's lines
+
+    A small state machine: a header line ("Requirements:", "Key Skills")
+    opens a block whose next MAX_BLOCK_REQUIREMENTS content lines are
+    requirements, categorized by the header ("skill" for skill headers,
+    else "experience"); any other header ending in ':' closes it. Bullet
+    lines are collected along the way and used as "general" requirements
+    when the posting has no recognizable block.
+    Each line is looked at once and every description is emitted once.
+
+    Args:
+        lines: Lines of the job description
+
+    Returns:
+        Requirements in posting order
+    """
+    requirements: List[JobRequirement] = []
+    bullets: List[JobRequirement] = []
+    seen = set()
+    seen_bullets = set()
+    category: Optional[str] = None  # None outside a requirements block
+    remaining = 0
+
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        bullet = _BULLET.match(line)
+        if bullet:
+            item = line[bullet.end():].strip()
+            if item and item.lower() not in seen_bullets:
+                seen_bullets.add(item.lower())
+                bullets.append(_requirement(item, "general"))
+
+        trigger = _TRIGGER.search(line)
+        if trigger and not bullet and (
+            line.endswith(":") or (len(line) <= MAX_HEADER_LENGTH and _HEADER.search(line))
+        ):
+            # Header: open a new block
+            category = "skill" if _SKILL.search(line) else "experience"
+            remaining = MAX_BLOCK_REQUIREMENTS
+            continue
+        if not trigger and not bullet and line.endswith(":"):
+            # Any other header ("About us:", "Benefits:") closes the block
+            category = None
+            continue
+
+        if category is not None and remaining > 0:
+            if len(line) > 10:
+                description = line[bullet.end():].strip() if bullet else line
+                if description.lower() not in seen:
+                    seen.add(description.lower())
+                    requirements.append(_requirement(description, category))
+                remaining -= 1
+            if trigger:
+                # A requirement that names a skill area keeps the block going
+                remaining = MAX_BLOCK_REQUIREMENTS
+        elif trigger:
+            # Requirement-like sentence outside a block: the lines after it are requirements
+            category = "skill" if _SKILL.search(line) else "experience"
+            remaining = MAX_BLOCK_REQUIREMENTS
+
+    return requirements or bullets
+
+
+def structured_requirements(requirements: Dict[str, List[str]]) -> List[JobRequirement]:
+    """Requirements from a structured posting parser's skill, experience and education lists."""
+    return [
+        _requirement(description, category)
+        for key, category in (("skills", "skill"), ("experience", "experience"), ("education", "education"))
+        for description in requirements.get(key, [])
+    ]
+
 
 class JobDescriptionParser:
     """Agent responsible for parsing job descriptions and extracting key requirements."""
@@ -15,18 +120,31 @@ class JobDescriptionParser:
             goal="Extract structured requirements from job postings",
             backstory="I specialize in analyzing job descriptions to identify key skills, qualifications, and requirements.",
             verbose=True,
-            allow_delegation=False
+            allow_delegation=False,
+            llm=get_agent_llm()
         )
     
-    async def parse_job_description(self, job_description: str, platform: JobPlatform) -> ParsedJobDescription:
-        """Parse a job description and extract structured requirements."""
+    async def parse_job_description(self, job_description: str, platform: JobSource) -> ParsedJobDescription:
+        """
+        Parse a job description and extract structured requirements.
+        
+        LinkedIn and Naukri postings that follow their platform's template are
+        read from its skill, qualification and education blocks; other
+        postings go through the generic line-based extractor.
+        """
         logger.info(f"Parsing job description from {platform}")
         
         try:
-            title = self._extract_job_title(job_description)
-            company = self._extract_company(job_description)
-            requirements = self._extract_requirements(job_description)
-            keywords = self._extract_keywords(job_description)
+            lines = job_description.split('\n')
+            title = self._extract_job_title(lines)
+            company = self._extract_company(lines)
+            structured = parse_structured_posting(job_description, platform)
+            if structured is not None:
+                requirements = structured_requirements(structured)
+                keywords = list(structured["skills"])
+            else:
+                requirements = self._extract_requirements(lines)
+                keywords = self._extract_keywords(job_description)
             
             return ParsedJobDescription(
                 title=title,
@@ -34,106 +152,48 @@ class JobDescriptionParser:
                 description=job_description,
                 requirements=requirements,
                 keywords=keywords,
-                metadata={"platform": platform}
+                metadata={"platform": platform, "structured": structured is not None}
             )
         except Exception as e:
             logger.error(f"Error parsing job description: {str(e)}")
             raise
     
-    def _extract_job_title(self, job_description: str) -> str:
-        """Extract job title from job description."""
+    def _extract_job_title(self, lines: List[str]) -> str:
+        """Extract job title from the first lines of the job description."""
         # This is a simplified implementation
         # In a real system, this would use more sophisticated NLP techniques
-        lines = job_description.split('\n')
         for line in lines[:5]:  # Check first few lines for title
             if len(line.strip()) < 50 and any(word in line.lower() for word in ["engineer", "developer", "manager", "specialist", "analyst"]):
                 return line.strip()
         
         return "Unknown Position"
     
-    def _extract_company(self, job_description: str) -> str:
-        """Extract company name from job description."""
+    def _extract_company(self, lines: List[str]) -> str:
+        """Extract company name from the first lines of the job description."""
         # This is a simplified implementation
-        lines = job_description.split('\n')
         for line in lines[:10]:  # Check first few lines for company
             if "company" in line.lower() or "organization" in line.lower() or "at" in line.lower():
                 return line.strip()
         
         return "Unknown Company"
     
-    def _extract_requirements(self, job_description: str) -> List[JobRequirement]:
-        """Extract requirements from job description."""
-        # This is a simplified implementation
-        requirements = []
-        
-        # Look for common requirement patterns in job descriptions
-        skill_keywords = ["skills", "requirements", "qualifications", "proficient in", "experience with"]
-        description_lines = job_description.split('\n')
-        
-        for i, line in enumerate(description_lines):
-            if any(keyword in line.lower() for keyword in skill_keywords):
-                # This might be a requirements section header
-                # Collect the next few lines as requirements
-                req_count = 0
-                j = i + 1
-                while j < len(description_lines) and req_count < 10:
-                    if description_lines[j].strip() and len(description_lines[j].strip()) > 10:
-                        # Determine if this is likely a required or preferred skill
-                        is_required = not any(word in description_lines[j].lower() for word in ["preferred", "nice to have", "plus", "advantage"])
-                        
-                        requirements.append(
-                            JobRequirement(
-                                category="skill" if "skill" in line.lower() else "experience",
-                                description=description_lines[j].strip(),
-                                importance=1.0 if is_required else 0.5,
-                                required=is_required
-                            )
-                        )
-                        req_count += 1
-                    j += 1
-        
-        # If no requirements found, try a different approach
-        if not requirements:
-            # Look for bullet points or numbered lists
-            for line in description_lines:
-                if (line.strip().startswith("-") or line.strip().startswith("•") or 
-                    (len(line.strip()) > 0 and line.strip()[0].isdigit() and "." in line.strip()[:3])):
-                    # This is likely a bullet point in a requirements list
-                    is_required = not any(word in line.lower() for word in ["preferred", "nice to have", "plus", "advantage"])
-                    
-                    requirements.append(
-                        JobRequirement(
-                            category="general",
-                            description=line.strip().lstrip("-•0123456789. "),
-                            importance=1.0 if is_required else 0.5,
-                            required=is_required
-                        )
-                    )
-        
-        return requirements
+    def _extract_requirements(self, lines: List[str]) -> List[JobRequirement]:
+        """Extract requirements from the job description's lines (single pass, see extract_requirements)."""
+        return extract_requirements(lines)
     
     def _extract_keywords(self, job_description: str) -> List[str]:
         """Extract key skills and keywords from job description."""
-        # This is a simplified implementation
         # Extract common technical terms, programming languages, tools, etc.
-        tech_keywords = [
-            "python", "java", "javascript", "react", "angular", "vue", "node", "express",
-            "django", "flask", "spring", "hibernate", "sql", "nosql", "mongodb", "postgresql",
-            "mysql", "oracle", "aws", "azure", "gcp", "docker", "kubernetes", "ci/cd",
-            "git", "agile", "scrum", "kanban", "api", "rest", "graphql", "microservices"
-        ]
-        
-        found_keywords = []
+        # with a single scan of the shared skill automaton
+        found_keywords = get_skill_matcher().find_skills(job_description)
+        seen = set(found_keywords)
         words = job_description.lower().replace(',', ' ').replace(';', ' ').replace('.', ' ').split()
         
-        for keyword in tech_keywords:
-            if keyword in job_description.lower():
-                found_keywords.append(keyword)
-        
         # Add other potentially important keywords
         for word in words:
-            if (len(word) > 3 and word not in found_keywords and 
+            if (len(word) > 3 and word not in seen and 
                 any(term in word for term in ["skill", "experience", "year", "degree", "qualification"])):
                 found_keywords.append(word)
+                seen.add(word)
         
         return list(set(found_keywords))
\ No newline at end of file
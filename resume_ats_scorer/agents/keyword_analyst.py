@@ -1,7 +1,9 @@
 import logging
 from typing import List, Dict
 from crewai import Agent
+from ..core.llm_gateway import get_agent_llm
 from ..models.schemas import ParsedResume
+from ..utils.skill_taxonomy import get_skill_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +17,8 @@ class KeywordAnalyst:
             goal="Extract and analyze keywords from resumes to improve matching",
             backstory="I specialize in identifying key skills, technologies, and qualifications in resumes.",
             verbose=True,
-            allow_delegation=False
+            allow_delegation=False,
+            llm=get_agent_llm()
         )
     
     async def analyze_keywords(self, resume: ParsedResume) -> Dict[str, List[str]]:
@@ -28,14 +31,14 @@ class KeywordAnalyst:
             experience_keywords = self._extract_experience_keywords(resume)
             education_keywords = self._extract_education_keywords(resume)
             
-            # Combine all keywords
-            all_keywords = list(set(skills_keywords + experience_keywords + education_keywords))
+            # Combine all keywords; sorted so responses do not depend on set order
+            all_keywords = set(skills_keywords + experience_keywords + education_keywords)
             
             return {
-                "skills": skills_keywords,
-                "experience": experience_keywords,
-                "education": education_keywords,
-                "all": all_keywords
+                "skills": sorted(skills_keywords),
+                "experience": sorted(experience_keywords),
+                "education": sorted(education_keywords),
+                "all": sorted(all_keywords)
             }
         except Exception as e:
             logger.error(f"Error analyzing keywords: {str(e)}")
@@ -60,19 +63,8 @@ class KeywordAnalyst:
                 words = skills_text.split()
                 keywords = [word.strip() for word in words if len(word) > 3]
         
-        # Look for skill keywords in the entire resume
-        common_skills = [
-            "python", "java", "javascript", "react", "angular", "vue", "node", "express",
-            "django", "flask", "spring", "hibernate", "sql", "nosql", "mongodb", "postgresql",
-            "mysql", "oracle", "aws", "azure", "gcp", "docker", "kubernetes", "ci/cd",
-            "git", "agile", "scrum", "kanban", "api", "rest", "graphql", "microservices",
-            "machine learning", "artificial intelligence", "data science", "data analysis",
-            "deep learning", "nlp", "natural language processing", "computer vision"
-        ]
-        
-        for skill in common_skills:
-            if skill in resume.raw_text.lower() and skill not in keywords:
-                keywords.append(skill)
+        # Look for skill keywords in the entire resume (single automaton scan)
+        keywords.extend(get_skill_matcher().find_skills(resume.raw_text))
         
         return list(set(keywords))  # Remove duplicates
     
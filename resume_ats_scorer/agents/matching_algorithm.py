@@ -1,7 +1,14 @@
 import logging
-from typing import Dict, List, Tuple
+import string
+from typing import Dict, Iterable, List, Optional, Tuple
 from crewai import Agent
-from ..models.schemas import ParsedResume, ParsedJobDescription, ResumeScoreResponse, SectionScore, ResumeSection
+from ..core.llm_gateway import get_agent_llm
+from ..models.schemas import AnalysisLevel, ParsedResume, ParsedJobDescription, ResumeScoreResponse, SectionScore, ResumeSection
+from ..core.config import settings
+from ..utils.analysis_levels import includes_recommendations
+from ..utils.idf import weighted_match_ratio
+from ..utils.job_profile import JobProfile, get_job_profile
+from ..utils.skill_taxonomy import get_taxonomy
 
 logger = logging.getLogger(__name__)
 
@@ -15,66 +22,145 @@ class MatchingAlgorithm:
             goal="Compare resumes against job requirements and generate accurate scores",
             backstory="I am an expert at analyzing the relevance of resume content to job requirements.",
             verbose=True,
-            allow_delegation=False
+            allow_delegation=False,
+            llm=get_agent_llm()
         )
     
-    async def generate_score(self, resume: ParsedResume, job_description: ParsedJobDescription) -> ResumeScoreResponse:
-        """Generate a comprehensive score based on resume and job description."""
+    async def generate_score(
+        self,
+        resume: ParsedResume,
+        job_description: ParsedJobDescription,
+        profile: Optional[JobProfile] = None,
+        analysis_level: AnalysisLevel = AnalysisLevel.STANDARD
+    ) -> ResumeScoreResponse:
+        """
+        Generate a comprehensive score based on resume and job description.
+        
+        When scoring many resumes against one job description, pass the
+        compiled profile from get_job_profile so the job side is built once.
+        Quick analysis skips the recommendations.
+        """
         logger.info("Generating resume score")
         
         try:
+            if profile is None:
+                profile = get_job_profile(job_description)
+            
             # Calculate various score components
-            content_match_score, content_matches, content_missing = self._calculate_content_match(resume, job_description)
+            content_match_score, content_matches, content_missing, fuzzy_matches, requirement_matches = self._calculate_content_match(resume, profile)
             format_score = self._calculate_format_compatibility(resume)
-            section_scores = self._calculate_section_scores(resume, job_description)
+            section_scores = self._calculate_section_scores(resume, profile)
             
             # Calculate total score
             total_score = content_match_score + format_score + sum(section.score for section in section_scores)
             
             # Generate recommendations
-            recommendations = self._generate_recommendations(
-                resume, job_description, content_match_score, format_score, section_scores, content_missing
-            )
+            recommendations = []
+            if includes_recommendations(analysis_level):
+                recommendations = self._generate_recommendations(
+                    resume, job_description, content_match_score, format_score, section_scores, content_missing
+                )
             
             return ResumeScoreResponse(
-                total_score=total_score,
-                content_match_score=content_match_score,
-                format_compatibility_score=format_score,
-                section_scores=section_scores,
-                recommendations=recommendations
+                success=True,
+                overall_score=round(total_score, 2),
+                content_score=content_match_score,
+                format_score=format_score,
+                section_scores={section.name: section.score for section in section_scores},
+                recommendations=recommendations,
+                fuzzy_matches=fuzzy_matches,
+                requirement_matches=requirement_matches,
+                analysis_level=analysis_level,
+                breakdown={
+                    "content_match": {"score": content_match_score, "max_score": 50.0},
+                    "format_compatibility": {"score": format_score, "max_score": 20.0},
+                    "section_scores": {section.name: section.score / section.max_score for section in section_scores}
+                }
             )
         except Exception as e:
             logger.error(f"Error generating score: {str(e)}")
             raise
     
-    def _calculate_content_match(self, resume: ParsedResume, job_description: ParsedJobDescription) -> Tuple[float, List[str], List[str]]:
+    def _fuzzy_skill_matches(
+        self,
+        unmatched_keywords: Iterable[str],
+        resume_terms: Iterable[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Match job keywords against aliased or misspelled resume terms via the fuzzy skill index.
+        
+        Returns:
+            Exact alias matches (distance 0, full matches) and approximate
+            matches (distance > 0), each mapping the job keyword to the resume term;
+            of several candidate terms the closest (then alphabetically first) one wins
+        """
+        unmatched = set(unmatched_keywords)
+        if not unmatched:
+            return {}, {}
+        
+        fuzzy_index = get_taxonomy().fuzzy
+        best: Dict[str, Tuple[int, str]] = {}
+        for term in resume_terms:
+            match = fuzzy_index.lookup(term.strip(string.punctuation))
+            if match and match.skill in unmatched:
+                best[match.skill] = min(best.get(match.skill, (match.distance, term)), (match.distance, term))
+        
+        alias_matches = {skill: term for skill, (distance, term) in best.items() if distance == 0}
+        fuzzy_matches = {skill: term for skill, (distance, term) in best.items() if distance > 0}
+        return alias_matches, fuzzy_matches
+    
+    def _match_requirements(self, resume: ParsedResume, profile: JobProfile) -> List[Optional[str]]:
+        """Find the resume keyword that satisfies each job requirement (None if none does)."""
+        # Deduplicate while keeping the resume's keyword order so reports are deterministic
+        resume_keywords = list(dict.fromkeys(resume.keywords))
+        
+        if settings.REQUIREMENT_MATCH_MODE == "substring":
+            return [
+                next((keyword for keyword in resume_keywords if keyword in req.lowered), None)
+                for req in profile.requirements
+            ]
+        
+        # Token mode: one hash lookup per resume keyword against the profile's phrase index
+        return profile.match_requirements(resume_keywords)
+    
+    def _calculate_content_match(self, resume: ParsedResume, profile: JobProfile) -> Tuple[float, List[str], List[str], Dict[str, str], Dict[str, str]]:
         """Calculate the content match score (0-50)."""
-        # Extract all keywords and important phrases from job description
-        job_keywords = set(job_description.keywords)
+        # Keywords and important phrases from the job description are precomputed in the profile
+        job_keywords = profile.keyword_set
         resume_keywords = set(resume.keywords)
         
-        # Calculate keyword match percentage
+        # Calculate keyword match percentage, weighting rare keywords higher
         matched_keywords = job_keywords.intersection(resume_keywords)
-        match_percentage = len(matched_keywords) / max(len(job_keywords), 1)
+        match_percentage = weighted_match_ratio(matched_keywords, job_keywords)
+        
+        # Aliases of a job keyword count as full matches; typos only get partial credit
+        alias_matches, fuzzy_matches = self._fuzzy_skill_matches(
+            job_keywords - matched_keywords, resume_keywords - matched_keywords
+        )
+        if alias_matches:
+            matched_keywords = matched_keywords.union(alias_matches)
+            match_percentage = weighted_match_ratio(matched_keywords, job_keywords)
+        match_percentage += settings.FUZZY_MATCH_CREDIT * weighted_match_ratio(fuzzy_matches, job_keywords)
         
         # Calculate requirement match percentage
         matched_requirements = 0
         missing_requirements = []
+        requirement_matches = {}
         
-        for req in job_description.requirements:
-            req_description = req.description.lower()
-            if any(keyword in req_description for keyword in resume_keywords):
+        for req, keyword in zip(profile.requirements, self._match_requirements(resume, profile)):
+            if keyword is not None:
                 matched_requirements += 1
+                requirement_matches[req.description] = keyword
             else:
                 missing_requirements.append(req.description)
         
-        req_match_percentage = matched_requirements / max(len(job_description.requirements), 1)
+        req_match_percentage = matched_requirements / max(len(profile.requirements), 1)
         
         # Calculate overall content match score (0-50)
         content_score = (match_percentage * 25) + (req_match_percentage * 25)
         content_score = min(50, content_score)  # Cap at 50
         
-        return content_score, list(matched_keywords), missing_requirements
+        return content_score, list(matched_keywords), missing_requirements, fuzzy_matches, requirement_matches
     
     def _calculate_format_compatibility(self, resume: ParsedResume) -> float:
         """Calculate the format compatibility score (0-20)."""
@@ -101,7 +187,7 @@ class MatchingAlgorithm:
         
         return min(20, format_score)  # Cap at 20
     
-    def _calculate_section_scores(self, resume: ParsedResume, job_description: ParsedJobDescription) -> List[SectionScore]:
+    def _calculate_section_scores(self, resume: ParsedResume, profile: JobProfile) -> List[SectionScore]:
         """Calculate scores for individual resume sections."""
         section_scores = []
         
@@ -109,19 +195,33 @@ class MatchingAlgorithm:
         skills_score = 0
         skills_feedback = "Skills section not found or insufficient."
         skills_matches = []
+        skills_fuzzy_matches = []
         skills_missing = []
         
         if ResumeSection.SKILLS in resume.sections and resume.sections[ResumeSection.SKILLS]:
             skills_text = resume.sections[ResumeSection.SKILLS].lower()
             skills_score = 0
             
-            for keyword in job_description.keywords:
-                if keyword.lower() in skills_text:
+            for keyword, lowered_keyword in zip(profile.keywords, profile.lowered_keywords):
+                if lowered_keyword in skills_text:
                     skills_score += 1
                     skills_matches.append(keyword)
                 else:
                     skills_missing.append(keyword)
             
+            # Recover aliased skills as matches, and misspelled ones reported separately
+            alias_matches, fuzzy_matches = self._fuzzy_skill_matches(
+                skills_missing, skills_text.replace(',', ' ').replace(';', ' ').split()
+            )
+            if alias_matches:
+                skills_matches.extend(keyword for keyword in skills_missing if keyword in alias_matches)
+                skills_missing = [keyword for keyword in skills_missing if keyword not in alias_matches]
+                skills_score += len(alias_matches)
+            if fuzzy_matches:
+                skills_fuzzy_matches = [keyword for keyword in skills_missing if keyword in fuzzy_matches]
+                skills_missing = [keyword for keyword in skills_missing if keyword not in fuzzy_matches]
+                skills_score += settings.FUZZY_MATCH_CREDIT * len(skills_fuzzy_matches)
+            
             skills_score = min(10, skills_score)  # Cap at 10
             
             if skills_score >= 7:
@@ -132,10 +232,11 @@ class MatchingAlgorithm:
                 skills_feedback = "Skills section needs improvement to better match job requirements."
         
         section_scores.append(SectionScore(
-            section=ResumeSection.SKILLS,
+            name=ResumeSection.SKILLS.value,
             score=skills_score,
             feedback=skills_feedback,
             matches=skills_matches,
+            fuzzy_matches=skills_fuzzy_matches,
             missing=skills_missing
         ))
         
@@ -150,16 +251,14 @@ class MatchingAlgorithm:
             exp_score = 0
             
             # Check for relevant experience keywords
-            for req in job_description.requirements:
-                if req.category.lower() == "experience":
-                    req_keywords = req.description.lower().split()
-                    matched = any(keyword in exp_text for keyword in req_keywords if len(keyword) > 3)
-                    
-                    if matched:
-                        exp_score += 1
-                        exp_matches.append(req.description)
-                    else:
-                        exp_missing.append(req.description)
+            for req in profile.requirements_in("experience"):
+                matched = any(keyword in exp_text for keyword in req.match_tokens)
+                
+                if matched:
+                    exp_score += 1
+                    exp_matches.append(req.description)
+                else:
+                    exp_missing.append(req.description)
             
             exp_score = min(10, exp_score)  # Cap at 10
             
@@ -171,7 +270,7 @@ class MatchingAlgorithm:
                 exp_feedback = "Experience section needs improvement to better match job requirements."
         
         section_scores.append(SectionScore(
-            section=ResumeSection.EXPERIENCE,
+            name=ResumeSection.EXPERIENCE.value,
             score=exp_score,
             feedback=exp_feedback,
             matches=exp_matches,
@@ -189,11 +288,8 @@ class MatchingAlgorithm:
             edu_score = 0
             
             # Check for education requirements
-            education_reqs = [req for req in job_description.requirements if any(term in req.description.lower() for term in ["degree", "education", "university", "college", "bachelor", "master", "phd"])]
-            
-            for req in education_reqs:
-                req_keywords = req.description.lower().split()
-                matched = any(keyword in edu_text for keyword in req_keywords if len(keyword) > 3)
+            for req in profile.education_requirements:
+                matched = any(keyword in edu_text for keyword in req.match_tokens)
                 
                 if matched:
                     edu_score += 2
@@ -212,8 +308,9 @@ class MatchingAlgorithm:
                 edu_feedback = "Education section could be improved to better match job requirements."
         
         section_scores.append(SectionScore(
-            section=ResumeSection.EDUCATION,
+            name=ResumeSection.EDUCATION.value,
             score=edu_score,
+            max_score=5,
             feedback=edu_feedback,
             matches=edu_matches,
             missing=edu_missing
@@ -242,8 +339,9 @@ class MatchingAlgorithm:
             format_feedback = "Resume formatting could be improved for better ATS compatibility."
         
         section_scores.append(SectionScore(
-            section=ResumeSection.OTHER,  # Using OTHER for formatting
+            name="formatting",
             score=format_score,
+            max_score=5,
             feedback=format_feedback,
             matches=[],
             missing=[]
@@ -281,15 +379,15 @@ class MatchingAlgorithm:
         # Section-specific recommendations
         for section_score in section_scores:
             if section_score.score < section_score.max_score * 0.7:
-                if section_score.section == ResumeSection.SKILLS:
+                if section_score.name == ResumeSection.SKILLS.value:
                     recommendations.append(f"Improve your Skills section: {section_score.feedback}")
                     if section_score.missing:
                         recommendations.append(f"Add these missing skills: {', '.join(section_score.missing[:5])}")
-                elif section_score.section == ResumeSection.EXPERIENCE:
+                elif section_score.name == ResumeSection.EXPERIENCE.value:
                     recommendations.append(f"Improve your Experience section: {section_score.feedback}")
                     if section_score.missing:
                         recommendations.append(f"Add experiences that demonstrate: {', '.join(section_score.missing[:3])}")
-                elif section_score.section == ResumeSection.EDUCATION:
+                elif section_score.name == ResumeSection.EDUCATION.value:
                     recommendations.append(f"Enhance your Education section: {section_score.feedback}")
                     if section_score.missing:
                         recommendations.append(f"Consider highlighting education relevant to: {', '.join(section_score.missing[:2])}")
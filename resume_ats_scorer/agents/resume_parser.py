@@ -1,16 +1,20 @@
 import logging
 from typing import Dict, Any, Optional
 from pathlib import Path
-import PyPDF2
-import docx
-from bs4 import BeautifulSoup
 from crewai import Agent
+from ..core.cancellation import CancellationToken
+from ..core.config import settings
+from ..core.extraction_pool import get_extraction_pool
+from ..core.llm_gateway import get_agent_llm
 from ..models.schemas import ParsedResume, ResumeSection, FileType
+from ..utils.resume_text import extract_resume_text
+from ..utils.section_segmenter import SectionSegmenter
 from ..core.exceptions import (
     FileValidationError,
     ParsingError,
     UnsupportedFileTypeError,
-    FileNotFoundError
+    FileNotFoundError,
+    ScoringCancelled
 )
 
 logger = logging.getLogger(__name__)
@@ -28,16 +32,30 @@ class ResumeParser:
     
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
     
+    # Section patterns with multiple possible headers
+    SECTION_HEADERS = {
+        ResumeSection.EXPERIENCE: ["EXPERIENCE", "WORK EXPERIENCE", "PROFESSIONAL EXPERIENCE"],
+        ResumeSection.EDUCATION: ["EDUCATION", "ACADEMIC BACKGROUND"],
+        ResumeSection.SKILLS: ["SKILLS", "TECHNICAL SKILLS", "CORE COMPETENCIES"],
+        ResumeSection.SUMMARY: ["SUMMARY", "PROFILE", "PROFESSIONAL SUMMARY"]
+    }
+    
     def __init__(self):
         self.agent = Agent(
             role="Resume Parser",
             goal="Extract structured content from resume files",
             backstory="I am an expert at parsing resume files in various formats and extracting their content.",
             verbose=True,
-            allow_delegation=False
+            allow_delegation=False,
+            llm=get_agent_llm()
         )
         
-    async def parse_resume(self, file_path: str, file_type: Optional[FileType] = None) -> ParsedResume:
+    async def parse_resume(
+        self,
+        file_path: str,
+        file_type: Optional[FileType] = None,
+        cancellation: Optional[CancellationToken] = None
+    ) -> ParsedResume:
         """Parse a resume file and extract structured content."""
         logger.info(f"Starting resume parsing for file: {file_path}")
         
@@ -46,7 +64,7 @@ class ResumeParser:
             self._validate_file(file_path, file_type)
             
             # Extract text
-            raw_text = self._extract_text(file_path, file_type or self._detect_file_type(file_path))
+            raw_text = self._extract_text(file_path, file_type or self._detect_file_type(file_path), cancellation)
             if not raw_text.strip():
                 raise ParsingError("No text content found in the resume")
                 
@@ -77,6 +95,8 @@ class ResumeParser:
         except ParsingError as e:
             logger.error(f"Parsing error: {str(e)}")
             raise
+        except ScoringCancelled:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error during resume parsing: {str(e)}")
             raise ParsingError(f"Failed to parse resume: {str(e)}")
@@ -104,121 +124,17 @@ class ResumeParser:
                 return file_type
         raise UnsupportedFileTypeError(f"Unsupported file extension: {extension}")
     
-    def _extract_text(self, file_path: str, file_type: FileType) -> str:
-        """Extract raw text from resume file based on file type."""
-        try:
-            if file_type == FileType.PDF:
-                return self._extract_from_pdf(file_path)
-            elif file_type == FileType.DOCX:
-                return self._extract_from_docx(file_path)
-            elif file_type == FileType.HTML:
-                return self._extract_from_html(file_path)
-            elif file_type == FileType.TXT:
-                return self._extract_from_txt(file_path)
-            else:
-                raise UnsupportedFileTypeError(f"Unsupported file type: {file_type}")
-        except Exception as e:
-            raise ParsingError(f"Error extracting text from {file_type} file: {str(e)}")
-    
-    def _extract_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file."""
-        try:
-            text = ""
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                if len(reader.pages) == 0:
-                    raise ParsingError("PDF file contains no pages")
-                for page in reader.pages:
-                    page_text = page.extract_text()
-                    if not page_text.strip():
-                        logger.warning("Empty page detected in PDF")
-                    text += page_text
-            return text
-        except PyPDF2.PdfReadError as e:
-            raise ParsingError(f"Invalid PDF file: {str(e)}")
-    
-    def _extract_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX file."""
-        try:
-            doc = docx.Document(file_path)
-            if not doc.paragraphs:
-                raise ParsingError("DOCX file contains no text")
-            return "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
-        except Exception as e:
-            raise ParsingError(f"Error reading DOCX file: {str(e)}")
-    
-    def _extract_from_html(self, file_path: str) -> str:
-        """Extract text from HTML file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                soup = BeautifulSoup(file.read(), 'html.parser')
-                text = soup.get_text(separator="\n")
-                if not text.strip():
-                    raise ParsingError("HTML file contains no text content")
-                return text
-        except Exception as e:
-            raise ParsingError(f"Error parsing HTML file: {str(e)}")
-    
-    def _extract_from_txt(self, file_path: str) -> str:
-        """Extract text from TXT file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read()
-                if not text.strip():
-                    raise ParsingError("TXT file is empty")
-                return text
-        except UnicodeDecodeError:
-            raise ParsingError("TXT file contains invalid characters")
-        except Exception as e:
-            raise ParsingError(f"Error reading TXT file: {str(e)}")
+    def _extract_text(self, file_path: str, file_type: FileType, cancellation: Optional[CancellationToken] = None) -> str:
+        """Extract raw text from resume file based on file type (in an extraction worker process when enabled)."""
+        if settings.EXTRACTION_PROCESS_WORKERS > 0:
+            return get_extraction_pool().run(extract_resume_text, file_path, file_type, cancellation=cancellation)
+        if cancellation is not None:
+            cancellation.raise_if_cancelled()
+        return extract_resume_text(file_path, file_type)
     
     def _identify_sections(self, text: str) -> Dict[ResumeSection, str]:
         """Identify and extract different sections from resume text."""
-        sections = {}
-        
-        # Define section patterns with multiple possible headers
-        section_patterns = {
-            ResumeSection.EXPERIENCE: ["EXPERIENCE", "WORK EXPERIENCE", "PROFESSIONAL EXPERIENCE"],
-            ResumeSection.EDUCATION: ["EDUCATION", "ACADEMIC BACKGROUND"],
-            ResumeSection.SKILLS: ["SKILLS", "TECHNICAL SKILLS", "CORE COMPETENCIES"],
-            ResumeSection.SUMMARY: ["SUMMARY", "PROFILE", "PROFESSIONAL SUMMARY"]
-        }
-        
-        for section, headers in section_patterns.items():
-            content = self._extract_section(text, headers)
-            if content:
-                sections[section] = content
-                logger.debug(f"Found section: {section.value}")
-        
-        if not sections:
-            logger.warning("No standard sections found in resume")
-            
-        return sections
-    
-    def _extract_section(self, text: str, section_headers: list) -> str:
-        """Extract a specific section's content based on section headers."""
-        text_upper = text.upper()
-        
-        for header in section_headers:
-            header_upper = header.upper()
-            if header_upper in text_upper:
-                start_idx = text_upper.find(header_upper)
-                next_section_idx = float('inf')
-                
-                # Find the next section header
-                for section in ResumeSection:
-                    section_upper = section.value.upper()
-                    if section_upper != header_upper:
-                        next_idx = text_upper.find(section_upper, start_idx + len(header))
-                        if next_idx != -1 and next_idx < next_section_idx:
-                            next_section_idx = next_idx
-                
-                if next_section_idx == float('inf'):
-                    return text[start_idx:].strip()
-                else:
-                    return text[start_idx:next_section_idx].strip()
-        
-        return ""
+        return identify_sections(text)
     
     def _extract_keywords(self, text: str) -> list:
         """Extract key skills and keywords from resume text."""
@@ -243,3 +159,31 @@ class ResumeParser:
         except Exception as e:
             logger.error(f"Error extracting keywords: {str(e)}")
             return []
+
+
+def _build_segmenter() -> SectionSegmenter:
+    """Segmenter for the extracted sections; other standard section names only end a section."""
+    headers = {section.value: [section.value] for section in ResumeSection if section != ResumeSection.OTHER}
+    for section, section_headers in ResumeParser.SECTION_HEADERS.items():
+        headers[section.value] = section_headers
+    return SectionSegmenter(headers)
+
+
+_SECTION_SEGMENTER = _build_segmenter()
+
+
+def identify_sections(text: str) -> Dict[ResumeSection, str]:
+    """Sections of a resume text, as ResumeParser extracts them from uploaded files."""
+    found = _SECTION_SEGMENTER.sections(text, include_header=True)
+
+    sections = {}
+    for section in ResumeParser.SECTION_HEADERS:
+        content = found.get(section.value)
+        if content:
+            sections[section] = content
+            logger.debug(f"Found section: {section.value}")
+
+    if not sections:
+        logger.warning("No standard sections found in resume")
+
+    return sections
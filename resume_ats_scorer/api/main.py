@@ -1,9 +1,10 @@
+import asyncio
 import logging
-from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Form, Request
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Form, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 import os
 import tempfile
-from typing import Optional
+from typing import Optional, Tuple
 from enum import Enum
 from pydantic import ValidationError
 from fastapi.openapi.utils import get_openapi
@@ -15,8 +16,8 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from ..core.crew_manager import ResumeCrewManager
-from ..models.schemas import ResumeUploadRequest, ResumeScoreResponse, FileType, JobSource
-from .routes import resume, job_description, scoring
+from ..models.schemas import AnalysisLevel, ResumeUploadRequest, ResumeScoreResponse, FileType, JobSource
+from .routes import resume, job_description, scoring, ranking
 from ..core.exceptions import (
     ResumeATSException,
     FileValidationError,
@@ -26,7 +27,16 @@ from ..core.exceptions import (
     ScoringError,
     JobDescriptionError
 )
+from ..core.admission import AdmissionMiddleware, create_score_admission
+from ..core.cancellation import CancellationToken, ClientDisconnected, cancel_on_disconnect
 from ..core.config import settings
+from ..core.extraction_pool import shutdown_extraction_pool
+from ..core.load_monitor import get_load_monitor
+from ..core.metrics import metrics
+from ..utils.response_cache import content_hash
+from ..utils.resume_index import flush_persistent_candidate_indexes
+from ..utils.single_flight import FOLLOWER, REPLAYED, IdempotencyKeyMismatch, SingleFlight
+from ..utils.token_cache import warm_token_cache
 
 # Configure logging
 logging.basicConfig(
@@ -75,6 +85,12 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Shed scoring requests beyond the concurrency and queue limits before their uploads are read
+score_admission = create_score_admission()
+app.add_middleware(AdmissionMiddleware, controller=score_admission, paths=settings.SCORE_ADMISSION_PATHS)
+# Its queue is one of the load signals that switch scoring to degraded mode
+get_load_monitor().watch_queue(lambda: score_admission.queued)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -111,6 +127,7 @@ crew_manager = ResumeCrewManager()
 app.include_router(resume.router, prefix="/api/v1/resume", tags=["Resume"])
 app.include_router(job_description.router, prefix="/api/v1/job-description", tags=["Job Description"])
 app.include_router(scoring.router, prefix="/api/v1/scoring", tags=["Scoring"])
+app.include_router(ranking.router, prefix="/api/v1/ranking", tags=["Ranking"])
 
 # Custom exception handlers
 @app.exception_handler(ResumeATSException)
@@ -221,13 +238,44 @@ async def root():
         "redoc": "/redoc"
     }
 
+score_flight = SingleFlight(
+    "score_requests",
+    retention_seconds=settings.IDEMPOTENCY_RETENTION_SECONDS,
+    max_retained=settings.IDEMPOTENCY_MAX_KEYS
+)
+metrics.register_callback("score_requests_in_flight", lambda: score_flight.in_flight)
+
 @app.post("/score", response_model=ResumeScoreResponse)
 async def score_resume(
+    http_request: Request,
+    response: Response,
     resume_file: UploadFile = File(...),
     job_description: str = Form(...),
-    job_platform: JobSource = Form(JobSource.OTHER)
+    job_platform: JobSource = Form(JobSource.OTHER),
+    analysis_level: AnalysisLevel = Form(AnalysisLevel.STANDARD),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")
 ):
-    """Score a resume against a job description."""
+    """
+    Score a resume against a job description.
+    
+    analysis_level selects quick (scores only), standard (scores and
+    recommendations) or deep (adds similarity and layout analysis) scoring;
+    X-Cache reports whether the result was memoized.
+    
+    Identical concurrent requests (same file, job description, platform and
+    level) share one computation (X-Coalesced: true). With an Idempotency-Key
+    header, a retry within IDEMPOTENCY_RETENTION_SECONDS gets the stored
+    result (Idempotent-Replayed: true); reusing the key for a different
+    request is rejected with 422.
+    
+    If the client disconnects before the score is ready, the computation is
+    cancelled (unless an identical request is still waiting for it).
+    
+    At most SCORE_MAX_CONCURRENCY scoring requests run at once and
+    SCORE_MAX_QUEUE wait; beyond that, requests get 503 with Retry-After.
+    Before that point, rising load makes scoring skip optional analysis; such
+    responses have degraded=true and the degradation_level applied.
+    """
     try:
         # Determine file type
         file_extension = os.path.splitext(resume_file.filename)[1].lower()
@@ -243,29 +291,59 @@ async def score_resume(
         else:
             raise HTTPException(status_code=400, detail=f"Unsupported file type: {file_extension}")
         
-        # Save uploaded file to a temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
-            temp_file.write(await resume_file.read())
-            temp_file_path = temp_file.name
+        file_bytes = await resume_file.read()
+        request_key = content_hash(file_bytes, file_type, job_description, job_platform, analysis_level)
         
-        try:
-            # Create scoring request
-            request = ResumeUploadRequest(
-                resume_file_path=temp_file_path,
-                job_description=job_description,
-                job_platform=job_platform,
-                file_type=file_type
-            )
-            
-            # Process the request
-            result = await crew_manager.score_resume(request)
+        async def compute() -> Tuple[ResumeScoreResponse, bool]:
+            # Save uploaded file to a temporary location
+            with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
+                temp_file.write(file_bytes)
+                temp_file_path = temp_file.name
             
-            return result
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+            try:
+                # Create scoring request
+                request = ResumeUploadRequest(
+                    resume_file_path=temp_file_path,
+                    job_description=job_description,
+                    job_source=job_platform,
+                    file_type=file_type,
+                    analysis_level=analysis_level
+                )
+                
+                # Process the request
+                cancellation = CancellationToken()
+                try:
+                    return await crew_manager.score_resume_with_cache_status(request, cancellation)
+                except asyncio.CancelledError:
+                    # Stops stages still running on threads or in extraction processes
+                    cancellation.cancel("client disconnected")
+                    raise
+            finally:
+                # Clean up the temporary file
+                if os.path.exists(temp_file_path):
+                    os.unlink(temp_file_path)
+        
+        (result, cache_hit), role = await cancel_on_disconnect(
+            http_request,
+            score_flight.do(request_key, compute, idempotency_key),
+            settings.DISCONNECT_POLL_INTERVAL
+        )
+        response.headers["X-Cache"] = "hit" if cache_hit else "miss"
+        if role == FOLLOWER:
+            response.headers["X-Coalesced"] = "true"
+        elif role == REPLAYED:
+            response.headers["Idempotent-Replayed"] = "true"
+        
+        # Every caller gets its own copy of the shared result
+        return result.model_copy(deep=True)
     
+    except IdempotencyKeyMismatch as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ClientDisconnected as e:
+        # Nobody reads this response; 499 keeps it apart from errors in access logs
+        raise HTTPException(status_code=499, detail=str(e))
+    except HTTPException:
+        raise
     except ValidationError as e:
         logger.error(f"Validation error: {str(e)}")
         raise HTTPException(status_code=422, detail=str(e))
@@ -273,6 +351,11 @@ async def score_resume(
         logger.error(f"Error processing request: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/metrics", tags=["Health"])
+async def get_metrics():
+    """In-process counters, gauges and latency summaries."""
+    return metrics.snapshot()
+
 @app.get("/health", tags=["Health"])
 @limiter.limit("5/minute")
 async def health_check(request: Request):
@@ -282,18 +365,21 @@ async def health_check(request: Request):
 # Temporary file handling
 @app.on_event("startup")
 async def startup_event():
-    """Create temporary directory for file uploads."""
+    """Create temporary directory for file uploads and warm caches."""
     temp_dir = Path(tempfile.gettempdir()) / "resume_ats_scorer"
     temp_dir.mkdir(exist_ok=True)
     logger.info(f"Created temporary directory: {temp_dir}")
+    warm_token_cache()
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up temporary files on shutdown."""
+    """Commit buffered index changes and clean up temporary files on shutdown."""
+    flush_persistent_candidate_indexes()
     temp_dir = Path(tempfile.gettempdir()) / "resume_ats_scorer"
     if temp_dir.exists():
         shutil.rmtree(temp_dir)
         logger.info(f"Cleaned up temporary directory: {temp_dir}")
+    shutdown_extraction_pool()
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,3 +1,4 @@
 from .resume_routes import router as resume
 from .job_description_routes import router as job_description
-from .scoring_routes import router as scoring 
\ No newline at end of file
+from .scoring_routes import router as scoring 
+from .ranking_routes import router as ranking
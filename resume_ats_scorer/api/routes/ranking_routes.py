@@ -0,0 +1,157 @@
+import logging
+import math
+from typing import Any, List, Optional
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+from ...core.config import settings
+from ...models.schemas import (
+    ErrorResponse,
+    KeywordAnalysis,
+    JobRequirements,
+    ParsedResume,
+    RankedCandidate,
+    RankingResponse
+)
+from resume_ats_scorer.agents.resume_parser import identify_sections
+from resume_ats_scorer.utils.feature_vectors import build_feature_matrix, score_matrix
+from resume_ats_scorer.utils.ranking import candidate_index
+from resume_ats_scorer.utils.resume_index import get_persistent_candidate_index
+from resume_ats_scorer.utils.scoring import calculate_content_match_score
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    tags=["ranking"],
+    responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
+)
+
+
+class CandidateRecord(BaseModel):
+    candidate_id: str
+    resume_text: str
+    resume_filename: str
+    resume_keywords: KeywordAnalysis
+    file_type: str
+
+
+class RankingRequest(BaseModel):
+    job_requirements: JobRequirements
+    job_title: str
+    top_k: Optional[int] = Field(default=None, ge=1, description="Candidates re-scored with the full scorer")
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=10, ge=1, le=100)
+
+
+def _candidate_store():
+    """The persistent resume index when RESUME_INDEX_DIR is set, else the in-memory index."""
+    if settings.RESUME_INDEX_DIR:
+        return get_persistent_candidate_index(settings.RESUME_INDEX_DIR)
+    return candidate_index
+
+
+def _as_record(payload: Any) -> CandidateRecord:
+    # The persistent index stores payloads as JSON
+    return payload if isinstance(payload, CandidateRecord) else CandidateRecord.model_validate(payload)
+
+
+def _skills(candidate: CandidateRecord) -> List[str]:
+    return candidate.resume_keywords.hard_skills + candidate.resume_keywords.soft_skills
+
+
+def _persistent_entry(candidate: CandidateRecord):
+    resume = ParsedResume(raw_text=candidate.resume_text, sections=identify_sections(candidate.resume_text))
+    return candidate.candidate_id, resume, _skills(candidate), candidate.model_dump(mode="json")
+
+
+@router.post("/candidates")
+async def add_candidate(candidate: CandidateRecord) -> Any:
+    """Store a candidate and index its skills for ranking."""
+    store = _candidate_store()
+    if store is candidate_index:
+        indexed_terms = store.add(candidate.candidate_id, _skills(candidate), candidate)
+    else:
+        indexed_terms = store.add(*_persistent_entry(candidate))
+    logger.info(f"Indexed candidate {candidate.candidate_id} with {indexed_terms} terms")
+    return {"candidate_id": candidate.candidate_id, "indexed_terms": indexed_terms, "total_candidates": len(store)}
+
+
+@router.post("/candidates/batch")
+async def add_candidates(candidates: List[CandidateRecord]) -> Any:
+    """Store several candidates; the persistent index commits them together."""
+    store = _candidate_store()
+    if store is candidate_index:
+        indexed_terms = [store.add(candidate.candidate_id, _skills(candidate), candidate) for candidate in candidates]
+    else:
+        indexed_terms = store.add_many([_persistent_entry(candidate) for candidate in candidates])
+    logger.info(f"Indexed {len(candidates)} candidates")
+    return {
+        "candidate_ids": [candidate.candidate_id for candidate in candidates],
+        "indexed_terms": indexed_terms,
+        "total_candidates": len(store)
+    }
+
+
+@router.delete("/candidates/{candidate_id}")
+async def remove_candidate(candidate_id: str) -> Any:
+    """Remove a stored candidate."""
+    if not _candidate_store().remove(candidate_id):
+        raise HTTPException(status_code=404, detail=f"Candidate not found: {candidate_id}")
+    return {"candidate_id": candidate_id, "removed": True}
+
+
+@router.post("/rank", response_model=RankingResponse)
+async def rank_candidates(request: RankingRequest) -> Any:
+    """
+    Rank stored candidates for a job.
+
+    Candidates are first retrieved from the skill index with WAND top-k
+    pruning; only the top_k survivors are scored with the full scorer, as one
+    feature matrix evaluation, and ordered by total score, so latency grows
+    with top_k rather than with the number of stored candidates.
+    """
+    try:
+        store = _candidate_store()
+        top_k = min(request.top_k or settings.RANKING_RESCORE_K, settings.RANKING_MAX_RESCORE_K)
+        requirements = request.job_requirements
+        weights = store.query_weights(requirements.required_skills, requirements.preferred_skills)
+        prefiltered = store.top_k(weights, top_k)
+
+        records = [_as_record(candidate.payload) for candidate in prefiltered]
+        total_scores = score_matrix(build_feature_matrix(
+            (record.resume_text, record.resume_keywords, requirements, record.file_type) for record in records
+        ))
+        ranked = sorted(
+            zip(total_scores.tolist(), (candidate.score for candidate in prefiltered), records),
+            key=lambda item: (item[0], item[1]),
+            reverse=True
+        )
+
+        # Matched keywords are only reported for the candidates on the page
+        start = (request.page - 1) * request.page_size
+        page = [
+            RankedCandidate(
+                candidate_id=record.candidate_id,
+                rank=start + offset + 1,
+                score=round(total_score, 2),
+                prefilter_score=round(prefilter_score, 4),
+                filename=record.resume_filename,
+                matched_keywords=calculate_content_match_score(record.resume_keywords, requirements)[1]
+            )
+            for offset, (total_score, prefilter_score, record)
+            in enumerate(ranked[start:start + request.page_size])
+        ]
+
+        logger.info(
+            f"Ranked {len(ranked)} of {len(store)} candidates for {request.job_title} "
+            f"({math.ceil(len(ranked) / request.page_size)} pages)"
+        )
+        return RankingResponse(
+            job_title=request.job_title,
+            total=len(ranked),
+            page=request.page,
+            page_size=request.page_size,
+            candidates=page
+        )
+    except Exception as e:
+        logger.exception(f"Error ranking candidates: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error ranking candidates: {str(e)}")
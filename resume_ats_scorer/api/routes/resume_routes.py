@@ -1,7 +1,7 @@
 import logging
 import tempfile
 import os
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, BackgroundTasks, Response
 from fastapi.responses import JSONResponse
 from typing import List
 
@@ -12,10 +12,11 @@ from ...models.schemas import (
     JobSource,
     ParsedResume,
     ParsedJobDescription,
-    ErrorResponse
+    ErrorResponse,
+    AnalysisLevel
 )
 from resume_ats_scorer.utils.file_handlers import save_upload_file, extract_text_from_file
-from resume_ats_scorer.utils.scoring import calculate_resume_score
+from resume_ats_scorer.utils.scoring import calculate_resume_score_with_cache_status
 from resume_ats_scorer.utils.text_processors import extract_keywords_from_resume, extract_job_requirements
 from resume_ats_scorer.utils.agents import create_crew_for_analysis
 
@@ -32,10 +33,12 @@ router = APIRouter(
 @router.post("/score-resume", response_model=ResumeScoreResponse)
 async def score_resume(
     background_tasks: BackgroundTasks,
+    response: Response,
     resume_file: UploadFile = File(...),
     job_description: str = Form(...),
     job_source: JobSource = Form(JobSource.OTHER),
-    job_title: str = Form(...)
+    job_title: str = Form(...),
+    analysis_level: AnalysisLevel = Form(AnalysisLevel.STANDARD)
 ):
     """
     Upload a resume and job description to get an ATS compatibility score.
@@ -72,7 +75,8 @@ async def score_resume(
         resume_request = ResumeUploadRequest(
             job_description=job_description,
             job_source=job_source,
-            job_title=job_title
+            job_title=job_title,
+            analysis_level=analysis_level
         )
         
         # Create a crew for analysis using CrewAI
@@ -83,16 +87,18 @@ async def score_resume(
         job_requirements = extract_job_requirements(job_description, job_source)
         
         # Calculate score
-        score_response = calculate_resume_score(
+        score_response, cache_hit = calculate_resume_score_with_cache_status(
             resume_text=resume_text,
             resume_filename=resume_file.filename,
             resume_keywords=resume_keywords,
             job_requirements=job_requirements,
             job_title=job_title,
-            file_type=file_extension
+            file_type=file_extension,
+            analysis_level=analysis_level
         )
         
-        logger.info(f"Resume scored successfully: {resume_file.filename} - Total Score: {score_response.total_score}")
+        response.headers["X-Cache"] = "hit" if cache_hit else "miss"
+        logger.info(f"Resume scored successfully: {resume_file.filename} - Total Score: {score_response.overall_score}")
         return score_response
         
     except HTTPException as e:
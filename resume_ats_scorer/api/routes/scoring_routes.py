@@ -1,5 +1,5 @@
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 from typing import Any
 from ...models.schemas import (
@@ -11,9 +11,10 @@ from ...models.schemas import (
     ParsedJobDescription,
     ErrorResponse,
     KeywordAnalysis,
-    JobRequirements
+    JobRequirements,
+    AnalysisLevel
 )
-from resume_ats_scorer.utils.scoring import calculate_resume_score
+from resume_ats_scorer.utils.scoring import calculate_resume_score_with_cache_status
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ class ScoringRequest(BaseModel):
     job_requirements: JobRequirements
     job_title: str
     file_type: str
+    analysis_level: AnalysisLevel = AnalysisLevel.STANDARD
 
 @router.get("/health")
 async def health_check():
@@ -37,19 +39,21 @@ async def health_check():
     return {"status": "ok", "service": "scoring"}
 
 @router.post("/score")
-async def score(request: ScoringRequest) -> Any:
-    """Score endpoint using calculate_resume_score."""
+async def score(request: ScoringRequest, response: Response) -> Any:
+    """Score endpoint using calculate_resume_score (X-Cache reports whether the result was memoized)."""
     try:
         logger.info(f"Received data for scoring: {request.resume_filename}")
-        response = calculate_resume_score(
+        result, cache_hit = calculate_resume_score_with_cache_status(
             resume_text=request.resume_text,
             resume_filename=request.resume_filename,
             resume_keywords=request.resume_keywords,
             job_requirements=request.job_requirements,
             job_title=request.job_title,
-            file_type=request.file_type
+            file_type=request.file_type,
+            analysis_level=request.analysis_level
         )
-        return response
+        response.headers["X-Cache"] = "hit" if cache_hit else "miss"
+        return result
     except Exception as e:
         logger.exception(f"Error in scoring: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error in scoring: {str(e)}") 
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Admission control and load shedding for expensive routes.
+
+An AdmissionController lets at most max_concurrent requests run and at most
+max_queue more wait for a slot (for at most queue_timeout seconds); anything
+beyond that is rejected straight away. Under overload, admitted requests
+keep their normal latency and the rest fail fast with 503 and Retry-After
+instead of every request slowing down until all of them time out.
+
+AdmissionMiddleware applies a controller to a set of paths as plain ASGI
+middleware, so requests are admitted or rejected before the upload body is
+read and before any other work is done. Other paths (/health, /) bypass it.
+"""
+import math
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Iterable
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import settings
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class Overloaded(Exception):
+    """A request was shed because the concurrency and queue limits were reached."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Concurrency limit with a bounded, time-limited FIFO queue (one per event loop)."""
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float, retry_after: float = 1.0):
+        """
+        Args:
+            name: Prefix of the metrics recorded for this controller
+            max_concurrent: Requests allowed to run at the same time
+            max_queue: Requests allowed to wait for a slot; more are rejected immediately
+            queue_timeout: Seconds a request may wait for a slot before it is rejected
+            retry_after: Minimum Retry-After, in seconds, given to rejected requests
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.min_retry_after = retry_after
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        metrics.register_callback(f"{name}_active", lambda: self._active)
+        metrics.register_callback(f"{name}_queued", lambda: len(self._waiters))
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free: the queue ahead served at the median service time."""
+        service = metrics.percentile(f"{self.name}_service_seconds", 0.5) or 0.0
+        backlog = (len(self._waiters) + 1) / max(1, self.max_concurrent)
+        return max(1, math.ceil(max(self.min_retry_after, service * backlog)))
+
+    def _reject(self, reason: str) -> Overloaded:
+        metrics.increment(f"{self.name}_rejected_{reason}")
+        retry_after = self.retry_after()
+        logger.warning(
+            f"Shedding {self.name} request ({reason}): {self._active} running, {len(self._waiters)} queued; "
+            f"retry after {retry_after}s"
+        )
+        return Overloaded(f"Server is busy ({reason.replace('_', ' ')}); retry later", retry_after)
+
+    async def acquire(self) -> None:
+        """
+        Wait for a slot
+
+        Raises:
+            Overloaded: If the queue is full or no slot freed up within queue_timeout
+        """
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            metrics.increment(f"{self.name}_admitted")
+            return
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended; pass it on
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                raise self._reject("queue_timeout")
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            metrics.observe(f"{self.name}_queue_seconds", time.perf_counter() - started)
+        metrics.increment(f"{self.name}_admitted")
+
+    def release(self) -> None:
+        """Free a slot, handing it to the longest-waiting request if there is one."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+
+class AdmissionMiddleware:
+    """ASGI middleware admitting requests to the given paths through an AdmissionController."""
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController, paths: Iterable[str]):
+        self.app = app
+        self.controller = controller
+        self.paths = frozenset(path.rstrip("/") or "/" for path in paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "").rstrip("/") or "/"
+        if scope["type"] != "http" or scope.get("method") == "OPTIONS" or path not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire()
+        except Overloaded as e:
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": str(e)},
+                headers={"Retry-After": str(e.retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
+            metrics.observe(f"{self.controller.name}_service_seconds", time.perf_counter() - started)
+
+
+def create_score_admission() -> AdmissionController:
+    """Controller for the scoring routes, configured from settings."""
+    return AdmissionController(
+        "score_admission",
+        max_concurrent=settings.SCORE_MAX_CONCURRENCY,
+        max_queue=settings.SCORE_MAX_QUEUE,
+        queue_timeout=settings.SCORE_QUEUE_TIMEOUT,
+        retry_after=settings.SCORE_RETRY_AFTER_SECONDS
+    )
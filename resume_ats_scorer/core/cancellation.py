@@ -0,0 +1,109 @@
+"""
+Cooperative cancellation of scoring work.
+
+A CancellationToken is created per scoring computation and handed to the
+stage graph and to blocking work (worker threads, extraction processes).
+Asyncio cancellation stops coroutines at their next await, but a stage
+already running on a thread cannot be interrupted, so the token is also
+checked between stages and watched by the extraction pool, which terminates
+the worker process of a cancelled extraction.
+
+cancel_on_disconnect ties a request handler's work to the client
+connection: when the ASGI server reports the client gone, the work is
+cancelled instead of being finished and thrown away.
+"""
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, List, Optional
+
+from .exceptions import ScoringCancelled
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ClientDisconnected(Exception):
+    """The client closed the connection before the response was ready."""
+
+
+class CancellationToken:
+    """Thread-safe, one-way cancellation flag with callbacks."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel once; later calls are ignored. Callbacks run on the calling thread."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Cancellation callback failed: {e}")
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Run callback on cancellation (immediately if already cancelled)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self) -> None:
+        """Checkpoint: raise ScoringCancelled if the token was cancelled."""
+        if self._event.is_set():
+            raise ScoringCancelled(f"Scoring cancelled: {self.reason}")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or the timeout passes; returns whether cancelled."""
+        return self._event.wait(timeout)
+
+
+async def cancel_on_disconnect(request: Any, work: Awaitable[Any], poll_interval: float = 0.1) -> Any:
+    """
+    Await work, cancelling it if the client disconnects first
+
+    Args:
+        request: Starlette request of the handler
+        work: Coroutine or future producing the response data
+        poll_interval: Seconds between checks of the connection
+
+    Returns:
+        The result of work
+
+    Raises:
+        ClientDisconnected: If the client went away; work has been cancelled
+    """
+    task = asyncio.ensure_future(work)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                metrics.increment("client_disconnects")
+                logger.info(f"Client disconnected from {request.url.path}; cancelling its work")
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                raise ClientDisconnected(f"Client disconnected from {request.url.path}")
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
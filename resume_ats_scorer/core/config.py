@@ -1,7 +1,7 @@
 import os
 import logging
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 class Settings(BaseModel):
     """Application settings."""
@@ -34,6 +34,150 @@ class Settings(BaseModel):
         default=None,
         description="OpenAI API key"
     )
+    LLM_MODEL: str = Field(default="gpt-4o-mini", description="Model used by the CrewAI agents")
+    LLM_BASE_URL: str = Field(
+        default="https://api.openai.com/v1",
+        description="OpenAI-compatible endpoint for agent LLM calls (e.g. the local stub server)"
+    )
+    LLM_TEMPERATURE: float = Field(default=0.0, description="Sampling temperature of agent LLM calls (0 makes them cacheable)")
+    LLM_MAX_CONCURRENCY: int = Field(default=4, description="Maximum concurrent upstream LLM calls per process")
+    LLM_CACHE_SIZE: int = Field(default=512, description="Completions cached by prompt hash (0 disables the cache)")
+    LLM_TIMEOUT: float = Field(default=60.0, description="Timeout of one upstream LLM call in seconds")
+    RESUME_SUMMARY_TOKEN_BUDGET: int = Field(default=800, description="Approximate token budget of the resume summary given to agents")
+    JOB_SUMMARY_TOKEN_BUDGET: int = Field(default=400, description="Approximate token budget of the job description summary given to agents")
+    PROMPT_SUMMARY_CACHE_SIZE: int = Field(default=256, description="Resume and job description summaries cached by content hash")
+    
+    # Skill taxonomy settings
+    SKILL_TAXONOMY_PATH: Optional[str] = Field(
+        default=None,
+        description="Path to the skill taxonomy JSON file (defaults to the bundled taxonomy)"
+    )
+    SKILL_TAXONOMY_RELOAD_INTERVAL: float = Field(
+        default=30.0,
+        description="Seconds between checks of the taxonomy file for changes (0 disables hot reload)"
+    )
+    
+    # Keyword weighting settings
+    IDF_TABLE_PATH: Optional[str] = Field(
+        default=None,
+        description="Path to the IDF table built by resume_ats_scorer.utils.idf (unset disables IDF weighting)"
+    )
+    IDF_TABLE_RELOAD_INTERVAL: float = Field(
+        default=60.0,
+        description="Seconds between checks of the IDF table file for updates"
+    )
+    
+    FUZZY_MATCH_CREDIT: float = Field(
+        default=0.5,
+        description="Fraction of an exact match credited to a typo-tolerant (fuzzy) skill match"
+    )
+    TOKEN_CACHE_SIZE: int = Field(
+        default=100_000,
+        description="Maximum number of tokens kept in the lemma/stopword normalization cache"
+    )
+    TOKEN_CACHE_WARM_PATH: Optional[str] = Field(
+        default=None,
+        description="Frequency list (one token per line, most frequent first) used to warm the token cache at startup"
+    )
+    JOB_PROFILE_CACHE_SIZE: int = Field(
+        default=128,
+        description="Number of compiled job description profiles kept in memory"
+    )
+    REQUIREMENT_MATCH_MODE: str = Field(
+        default="token",
+        description="How resume keywords are matched to job requirements: 'token' (whole tokens/phrases) or 'substring'"
+    )
+    RANKING_RESCORE_K: int = Field(
+        default=100,
+        description="Default number of prefiltered candidates re-scored with the full scorer when ranking"
+    )
+    RANKING_MAX_RESCORE_K: int = Field(
+        default=1000,
+        description="Upper limit on the number of candidates re-scored per ranking request"
+    )
+    RESUME_INDEX_DIR: Optional[str] = Field(
+        default=None,
+        description="Directory of the persistent resume index used by the ranking API (unset keeps candidates in memory)"
+    )
+    RESUME_INDEX_MERGE_FACTOR: int = Field(
+        default=10,
+        description="Number of adjacent, similar-sized resume index segments that a commit merges into one"
+    )
+    RESUME_INDEX_COMMIT_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        description="How long candidates added through the ranking API are buffered before being committed together (0 commits every change)"
+    )
+    RESPONSE_CACHE_SIZE: int = Field(
+        default=1024,
+        description="Number of scoring responses memoized in memory (0 disables response caching)"
+    )
+    RESPONSE_CACHE_PATH: Optional[str] = Field(
+        default=None,
+        description="SQLite file backing the response cache across processes and restarts (unset keeps it in memory)"
+    )
+    RESPONSE_CACHE_PERSISTENT_SIZE: int = Field(
+        default=100_000,
+        description="Maximum number of responses kept in the SQLite tier (0 means unbounded)"
+    )
+    ANALYSIS_LATENCY_BUDGETS_MS: Dict[str, float] = Field(
+        default={
+            "quick": 50.0,  # scores only, no NLP models
+            "standard": 250.0,  # + recommendations
+            "deep": 2000.0,  # + spaCy similarity and layout analysis
+        },
+        description="Server-side latency budget per analysis level in milliseconds (see docs/scoring_mechanism.md)"
+    )
+    PIPELINE_THREAD_WORKERS: int = Field(
+        default=8,
+        description="Worker threads shared by blocking pipeline stages (file parsing, NLP)"
+    )
+    EXTRACTION_PROCESS_WORKERS: int = Field(
+        default=2,
+        description="Worker processes for resume text extraction, terminated when their request is cancelled (0 extracts in-thread)"
+    )
+    DISCONNECT_POLL_INTERVAL: float = Field(
+        default=0.1,
+        description="Seconds between client disconnect checks while a /score request is computed"
+    )
+    SCORE_MAX_CONCURRENCY: int = Field(default=4, description="Scoring requests executed at the same time per process")
+    SCORE_MAX_QUEUE: int = Field(
+        default=16,
+        description="Scoring requests allowed to wait for a slot; further requests get 503 with Retry-After"
+    )
+    SCORE_QUEUE_TIMEOUT: float = Field(default=5.0, description="Seconds a scoring request may wait for a slot before 503")
+    SCORE_RETRY_AFTER_SECONDS: float = Field(default=1.0, description="Minimum Retry-After given to shed scoring requests")
+    SCORE_ADMISSION_PATHS: List[str] = Field(
+        default=["/score", "/api/v1/resume/score-resume", "/api/v1/scoring/score", "/api/v1/ranking/rank"],
+        description="Routes subject to the scoring concurrency and queue limits"
+    )
+    DEGRADATION_ENABLED: bool = Field(default=True, description="Skip optional analysis stages while the service is overloaded")
+    DEGRADATION_QUEUE_THRESHOLDS: List[int] = Field(
+        default=[4, 12],
+        description="Queued scoring requests at which degradation levels 1 and 2 are entered"
+    )
+    DEGRADATION_LATENCY_THRESHOLDS: List[float] = Field(
+        default=[1.5, 3.0],
+        description="p95 of scoring latency relative to its analysis level budget at which levels 1 and 2 are entered"
+    )
+    DEGRADATION_RECOVERY_FRACTION: float = Field(
+        default=0.5,
+        description="A level is left once load is below this fraction of the thresholds that entered it"
+    )
+    DEGRADATION_MIN_HOLD_SECONDS: float = Field(default=15.0, description="Minimum time at a level before stepping down")
+    DEGRADATION_WINDOW_SECONDS: float = Field(default=30.0, description="Window of recent latencies the p95 is computed over")
+    DEGRADED_MAX_RULE_PRIORITY: int = Field(
+        default=41,
+        description="Highest recommendation rule priority evaluated at degradation level 2 (formatting and missing requirements)"
+    )
+    IDEMPOTENCY_RETENTION_SECONDS: float = Field(
+        default=300.0,
+        description="How long /score results are replayed for a repeated Idempotency-Key (0 disables replay)"
+    )
+    IDEMPOTENCY_MAX_KEYS: int = Field(default=10_000, description="Maximum idempotency keys retained per process")
+    MAX_RECOMMENDATIONS: int = Field(
+        default=10,
+        description="Recommendations returned per scored resume; rule evaluation stops once this many are collected"
+    )
     
     # Custom model settings
     MODEL_WEIGHTS: Dict[str, float] = Field(
@@ -71,6 +215,14 @@ class Settings(BaseModel):
             raise ValueError(f"Invalid log level. Must be one of {valid_levels}")
         return v.upper()
 
+    @field_validator('REQUIREMENT_MATCH_MODE')
+    @classmethod
+    def validate_requirement_match_mode(cls, v: str) -> str:
+        valid_modes = ["token", "substring"]
+        if v.lower() not in valid_modes:
+            raise ValueError(f"Invalid requirement match mode. Must be one of {valid_modes}")
+        return v.lower()
+
     @field_validator('MODEL_WEIGHTS')
     @classmethod
     def validate_model_weights(cls, v: Dict[str, float]) -> Dict[str, float]:
@@ -1,12 +1,39 @@
+import time
 import logging
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 from crewai import Crew, Task
 from ..agents.resume_parser import ResumeParser
 from ..agents.keyword_analyst import KeywordAnalyst
 from ..agents.job_description_parser import JobDescriptionParser
 from ..agents.matching_algorithm import MatchingAlgorithm
 from ..agents.recommendation_engine import RecommendationEngine
-from ..models.schemas import ResumeUploadRequest, ResumeScoreResponse, ParsedResume, ParsedJobDescription
+from ..utils.analysis_levels import (
+    applied_degradation,
+    includes_deep_analysis,
+    includes_recommendations,
+    latency_budget_ms,
+    layout_analysis,
+    record_analysis_latency,
+    semantic_similarity
+)
+from ..utils.job_profile import JobProfile, get_job_profile
+from ..utils.prompt_summaries import summarize_job, summarize_resume
+from ..utils.response_cache import content_hash, file_hash, get_response_cache, response_cache_key
+from ..models.schemas import (
+    AnalysisLevel,
+    DegradationLevel,
+    ResumeUploadRequest,
+    ResumeScoreResponse,
+    ParsedResume,
+    ParsedJobDescription
+)
+from .cancellation import CancellationToken
+from .config import settings
+from .exceptions import ScoringCancelled
+from .load_monitor import get_load_monitor
+from .metrics import metrics
+from .pipeline import CANCELLATION, THREAD, StageGraph
 
 logger = logging.getLogger(__name__)
 
@@ -21,68 +48,235 @@ class ResumeCrewManager:
         self.job_parser = JobDescriptionParser()
         self.matching_algorithm = MatchingAlgorithm()
         self.recommendation_engine = RecommendationEngine()
+        
+        # One declared workflow per analysis level and degradation level that applies to it
+        self.pipelines = {
+            (level, degradation): self._build_pipeline(level, degradation)
+            for level in AnalysisLevel
+            for degradation in DegradationLevel
+            if applied_degradation(level, degradation) == degradation
+        }
+    
+    def _build_pipeline(self, analysis_level: AnalysisLevel, degradation: DegradationLevel = DegradationLevel.NONE) -> StageGraph:
+        """
+        Declare the scoring workflow as a stage graph.
+        
+        Resume and job description parsing are independent and run on worker
+        threads at the same time; the job profile only waits for the parsed job,
+        and keyword analysis and deep analysis run alongside matching, which
+        does not depend on them. Degraded workflows leave out the optional
+        stages (see DegradationLevel).
+        """
+        name = f"score_resume_{analysis_level.value}"
+        if degradation:
+            name += f"_degraded{int(degradation)}"
+        pipeline = StageGraph(name, inputs=("request",))
+        pipeline.add("parsed_resume", self._parse_resume, requires=("request", CANCELLATION), executor=THREAD)
+        pipeline.add("parsed_job", self._parse_job, requires=("request",), executor=THREAD)
+        pipeline.add("job_profile", get_job_profile_for, requires=("parsed_job",))
+        pipeline.add(
+            "score",
+            self._generate_score_for(analysis_level),
+            requires=("parsed_resume", "parsed_job", "job_profile")
+        )
+        
+        if includes_recommendations(analysis_level):
+            pipeline.add("keyword_analysis", self._analyze_keywords, requires=("parsed_resume",))
+            pipeline.add(
+                "recommendations",
+                self._generate_recommendations_for(degradation),
+                requires=("score", "parsed_resume", "parsed_job")
+            )
+        
+        if includes_deep_analysis(analysis_level) and degradation < DegradationLevel.REDUCED:
+            pipeline.add("similarity", self._similarity, requires=("parsed_resume", "parsed_job"), executor=THREAD)
+            pipeline.add("layout", self._layout, requires=("parsed_resume",), executor=THREAD)
+        
+        return pipeline
     
     async def score_resume(self, request: ResumeUploadRequest) -> ResumeScoreResponse:
         """Process a scoring request through the entire CrewAI workflow."""
-        logger.info(f"Processing resume scoring request for file: {request.resume_file_path}")
+        result, _ = await self.score_resume_with_cache_status(request)
+        return result
+    
+    async def score_resume_with_cache_status(
+        self,
+        request: ResumeUploadRequest,
+        cancellation: Optional[CancellationToken] = None
+    ) -> Tuple[ResumeScoreResponse, bool]:
+        """
+        Score a request, reusing the memoized response for an identical resume, job description, platform and level.
         
-        try:
-            # Step 1: Parse the resume
-            parsed_resume = await self.resume_parser.parse_resume(
-                request.resume_file_path, 
-                request.file_type
-            )
-            
-            # Step 2: Parse the job description
-            parsed_job = await self.job_parser.parse_job_description(
-                request.job_description,
-                request.job_platform
+        While the service is overloaded, optional stages are skipped and the
+        response is marked degraded; degraded responses are not memoized.
+        
+        Args:
+            request: Scoring request
+            cancellation: Token that abandons the remaining stages when cancelled
+        
+        Returns:
+            The score response and whether it came from the response cache
+        """
+        analysis_level = AnalysisLevel(request.analysis_level)
+        cache = get_response_cache()
+        key = None
+        if cache is not None:
+            key = response_cache_key(
+                "score_resume",
+                file_hash(request.resume_file_path),
+                request.file_type,
+                content_hash(request.job_description),
+                request.job_source,
+                analysis_level.value
             )
+            cached = cache.get(key)
+            if cached is not None:
+                logger.info(f"Serving cached score for file: {request.resume_file_path}")
+                return cached, True
+        
+        degradation = DegradationLevel.NONE
+        if settings.DEGRADATION_ENABLED:
+            degradation = applied_degradation(analysis_level, get_load_monitor().level())
+        
+        started = time.perf_counter()
+        try:
+            result = await self._score_resume(request, analysis_level, cancellation, degradation)
+        except (ScoringCancelled, asyncio.CancelledError):
+            metrics.increment("scoring_runs_cancelled")
+            logger.info(f"Scoring cancelled for file: {request.resume_file_path}")
+            raise
+        elapsed = time.perf_counter() - started
+        record_analysis_latency(analysis_level, elapsed)
+        budget_ms = latency_budget_ms(analysis_level)
+        get_load_monitor().observe(elapsed, budget_ms / 1000 if budget_ms else None)
+        
+        if degradation:
+            result.degraded = True
+            result.degradation_level = degradation
+            metrics.increment(f"degraded_responses_{degradation.name.lower()}")
+        elif cache is not None:
+            cache.put(key, result)
+        return result, False
+    
+    async def _score_resume(
+        self,
+        request: ResumeUploadRequest,
+        analysis_level: AnalysisLevel,
+        cancellation: Optional[CancellationToken] = None,
+        degradation: DegradationLevel = DegradationLevel.NONE
+    ) -> ResumeScoreResponse:
+        logger.info(
+            f"Processing {analysis_level.value} resume scoring request for file: {request.resume_file_path}"
+            + (f" (degraded: {degradation.name.lower()})" if degradation else "")
+        )
+        
+        try:
+            run = await self.pipelines[(analysis_level, degradation)].run(cancellation, request=request)
+            results = run.results
             
-            # Step 3: Generate the score
-            score_result = await self.matching_algorithm.generate_score(
-                parsed_resume,
-                parsed_job
-            )
+            score_result = results["score"]
+            if "recommendations" in results:
+                score_result.recommendations = results["recommendations"]
+            if "keyword_analysis" in results:
+                score_result.keyword_analysis = results["keyword_analysis"]
+            if "similarity" in results:
+                score_result.similarity_score = results["similarity"]
+                score_result.layout_analysis = results["layout"]
             
-            # Step 4: Generate detailed recommendations
-            detailed_recommendations = await self.recommendation_engine.generate_recommendations(
-                parsed_resume,
-                parsed_job,
-                score_result
+            logger.info(
+                f"Scored resume in {run.elapsed * 1000:.0f}ms "
+                f"(critical path {run.critical_path * 1000:.0f}ms, "
+                + ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in run.timings.items()) + ")"
             )
-            
-            # Update the score result with detailed recommendations
-            score_result.recommendations = detailed_recommendations
-            
             return score_result
+        except ScoringCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in resume scoring workflow: {str(e)}")
             raise
     
+    # Pipeline stages; each receives the results it requires as keyword arguments
+    
+    async def _parse_resume(self, request: ResumeUploadRequest, cancellation: Optional[CancellationToken]) -> ParsedResume:
+        return await self.resume_parser.parse_resume(request.resume_file_path, request.file_type, cancellation)
+    
+    async def _parse_job(self, request: ResumeUploadRequest) -> ParsedJobDescription:
+        return await self.job_parser.parse_job_description(request.job_description, request.job_source)
+    
+    async def _analyze_keywords(self, parsed_resume: ParsedResume) -> Dict[str, List[str]]:
+        return await self.keyword_analyst.analyze_keywords(parsed_resume)
+    
+    def _generate_score_for(self, analysis_level: AnalysisLevel):
+        async def generate_score(
+            parsed_resume: ParsedResume,
+            parsed_job: ParsedJobDescription,
+            job_profile: JobProfile
+        ) -> ResumeScoreResponse:
+            # Score against the (cached) compiled job profile
+            return await self.matching_algorithm.generate_score(
+                parsed_resume, parsed_job, profile=job_profile, analysis_level=analysis_level
+            )
+        return generate_score
+    
+    def _generate_recommendations_for(self, degradation: DegradationLevel):
+        # At MINIMAL only the core (formatting and missing requirement) rules are evaluated
+        max_priority = settings.DEGRADED_MAX_RULE_PRIORITY if degradation >= DegradationLevel.MINIMAL else None
+        
+        async def generate_recommendations(
+            score: ResumeScoreResponse,
+            parsed_resume: ParsedResume,
+            parsed_job: ParsedJobDescription
+        ) -> List[str]:
+            return await self.recommendation_engine.generate_recommendations(
+                parsed_resume, parsed_job, score, max_priority=max_priority
+            )
+        return generate_recommendations
+    
+    def _similarity(self, parsed_resume: ParsedResume, parsed_job: ParsedJobDescription) -> float:
+        return semantic_similarity(parsed_resume.raw_text, parsed_job.description)
+    
+    def _layout(self, parsed_resume: ParsedResume) -> Dict[str, float]:
+        return layout_analysis(parsed_resume.raw_text)
+    
+    def crew_inputs(self, parsed_resume: ParsedResume, parsed_job: ParsedJobDescription) -> Dict[str, str]:
+        """
+        Inputs for create_crew().kickoff(inputs=...).
+        
+        The agents get cached, token-budgeted summaries (sections, keywords,
+        requirements) rather than the raw documents, so prompt size does not
+        grow with resume or job description length.
+        """
+        return {
+            "resume_summary": summarize_resume(parsed_resume),
+            "job_summary": summarize_job(parsed_job)
+        }
+    
     def create_crew(self) -> Crew:
-        """Create a CrewAI crew with all the agents and tasks."""
+        """Create a CrewAI crew with all the agents and tasks (kick off with crew_inputs)."""
         # Create tasks
         parse_resume_task = Task(
-            description="Parse the resume file and extract structured content",
+            description="Parse the resume and extract structured content.\n\nResume summary:\n{resume_summary}",
             agent=self.resume_parser.agent,
             expected_output="Parsed resume content"
         )
         
         parse_job_task = Task(
-            description="Parse the job description and extract key requirements",
+            description="Parse the job description and extract key requirements.\n\nJob description summary:\n{job_summary}",
             agent=self.job_parser.agent,
             expected_output="Parsed job requirements"
         )
         
         matching_task = Task(
-            description="Compare resume content against job requirements and generate scores",
+            description=(
+                "Compare resume content against job requirements and generate scores.\n\n"
+                "Resume summary:\n{resume_summary}\n\nJob description summary:\n{job_summary}"
+            ),
             agent=self.matching_algorithm.agent,
             expected_output="Resume score analysis"
         )
         
         recommendation_task = Task(
-            description="Generate detailed recommendations for improving the resume",
+            description="Generate detailed recommendations for improving the resume.\n\nResume summary:\n{resume_summary}",
             agent=self.recommendation_engine.agent,
             expected_output="Improvement recommendations"
         )
@@ -105,3 +299,8 @@ class ResumeCrewManager:
         )
         
         return crew
+
+
+def get_job_profile_for(parsed_job: ParsedJobDescription) -> JobProfile:
+    """Pipeline stage: the compiled profile of the parsed job description."""
+    return get_job_profile(parsed_job)
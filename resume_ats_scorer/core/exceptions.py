@@ -28,4 +28,12 @@ class JobDescriptionError(ResumeATSException):
 
 class RecommendationError(ResumeATSException):
     """Raised when there's an error generating recommendations."""
-    pass 
\ No newline at end of file
+    pass 
+
+class TaxonomyError(ResumeATSException):
+    """Raised when the skill taxonomy file cannot be loaded or is invalid."""
+    pass
+
+class ScoringCancelled(ResumeATSException):
+    """Raised when a scoring request is cancelled, e.g. because the client disconnected."""
+    pass
@@ -0,0 +1,191 @@
+"""
+Pool of worker processes for resume text extraction that can abandon work.
+
+PDF and DOCX extraction is CPU-bound and cannot be interrupted on a thread.
+Each ExtractionPool job runs in a long-lived worker process; if the job's
+CancellationToken is cancelled while it runs (the client disconnected), the
+worker process is terminated and replaced on demand, so the CPU is freed
+immediately instead of finishing an extraction nobody will read.
+
+Workers are started with the "forkserver" method and only import the
+functions they run (utils/resume_text.py is preloaded), never CrewAI or
+spaCy. Functions and arguments must be picklable.
+"""
+import time
+import logging
+import threading
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, List, Optional
+
+from .cancellation import CancellationToken
+from .config import settings
+from .exceptions import ScoringCancelled
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_PRELOAD = ["resume_ats_scorer.utils.resume_text"]
+
+
+def _worker_main(connection: Connection) -> None:
+    """Worker loop: run (func, args) jobs and send back (ok, value)."""
+    while True:
+        try:
+            func, args = connection.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            result = (True, func(*args))
+        except Exception as e:
+            result = (False, e)
+        try:
+            connection.send(result)
+        except Exception as e:
+            # Unpicklable result or exception
+            connection.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _Worker:
+    def __init__(self, context: Any):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), name="resume-extraction", daemon=True)
+        self.process.start()
+        child.close()
+
+    def terminate(self) -> None:
+        self.process.terminate()
+        self.process.join(timeout=5)
+        self.connection.close()
+
+
+class ExtractionPool:
+    """Bounded pool of extraction worker processes whose jobs can be cancelled."""
+
+    def __init__(self, max_workers: int, start_method: str = "forkserver", preload: Optional[List[str]] = None):
+        """
+        Args:
+            max_workers: Maximum concurrent jobs (and worker processes)
+            start_method: multiprocessing start method of the workers
+            preload: Modules the forkserver imports once for all workers
+        """
+        self.max_workers = max_workers
+        self._context = multiprocessing.get_context(start_method)
+        if start_method == "forkserver" and preload:
+            self._context.set_forkserver_preload(preload)
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._idle: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._busy = 0
+
+    @property
+    def busy(self) -> int:
+        return self._busy
+
+    def _acquire(self) -> _Worker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+        return _Worker(self._context)
+
+    def _release(self, worker: _Worker) -> None:
+        with self._lock:
+            self._idle.append(worker)
+
+    def run(self, func: Callable[..., Any], *args: Any, cancellation: Optional[CancellationToken] = None) -> Any:
+        """
+        Run func(*args) in a worker process and wait for the result
+
+        Args:
+            func: Picklable module-level function
+            args: Picklable arguments
+            cancellation: Token whose cancellation terminates the job
+
+        Returns:
+            The function's return value
+
+        Raises:
+            ScoringCancelled: If the token was cancelled before or during the job
+            Whatever func raised
+        """
+        if cancellation is not None:
+            cancellation.raise_if_cancelled()
+
+        with self._slots:
+            worker = self._acquire()
+            with self._lock:
+                self._busy += 1
+            started = time.perf_counter()
+            cancelled = threading.Event()
+            # Wake the wait below as soon as the token is cancelled
+            wake_reader, wake_writer = self._context.Pipe(duplex=False)
+
+            def on_cancel() -> None:
+                cancelled.set()
+                wake_writer.send_bytes(b"")
+
+            if cancellation is not None:
+                cancellation.add_callback(on_cancel)
+            try:
+                worker.connection.send((func, args))
+                while True:
+                    ready = wait([worker.connection, worker.process.sentinel, wake_reader])
+                    if worker.connection in ready:
+                        ok, value = worker.connection.recv()
+                        break
+                    if cancelled.is_set():
+                        worker.terminate()
+                        worker = None
+                        metrics.increment("extraction_jobs_terminated")
+                        logger.info("Terminated a cancelled extraction job")
+                        raise ScoringCancelled(f"Extraction cancelled: {cancellation.reason}")
+                    if worker.process.sentinel in ready:
+                        worker.terminate()
+                        worker = None
+                        metrics.increment("extraction_worker_crashes")
+                        raise RuntimeError("Extraction worker process exited unexpectedly")
+            finally:
+                if cancellation is not None:
+                    cancellation.remove_callback(on_cancel)
+                wake_reader.close()
+                wake_writer.close()
+                with self._lock:
+                    self._busy -= 1
+                if worker is not None:
+                    self._release(worker)
+                metrics.observe("extraction_seconds", time.perf_counter() - started)
+
+        metrics.increment("extraction_jobs")
+        if not ok:
+            raise value
+        return value
+
+    def shutdown(self) -> None:
+        """Terminate every idle worker."""
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.terminate()
+
+
+_pool: Optional[ExtractionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """Return the process-wide extraction pool (EXTRACTION_PROCESS_WORKERS workers)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ExtractionPool(settings.EXTRACTION_PROCESS_WORKERS, preload=EXTRACTION_PRELOAD)
+                metrics.register_callback("extraction_workers_busy", lambda: _pool.busy)
+    return _pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Terminate the idle workers of the process-wide pool, if it was started."""
+    if _pool is not None:
+        _pool.shutdown()
@@ -0,0 +1,273 @@
+"""
+Single call layer for every LLM request made by the CrewAI agents.
+
+All agents are given a GatewayLLM, so in agentic mode every completion goes
+through one process-wide LLMGateway that
+
+- answers repeated prompts from a bounded LRU keyed by a hash of the
+  normalized prompt (model, messages with whitespace collapsed, stop words);
+  only deterministic calls (temperature 0 or unset) are cached, and the
+  messages themselves are sent upstream unchanged,
+- coalesces identical deterministic prompts that are already in flight, so
+  concurrent requests for the same resume wait for one upstream call,
+- caps concurrent upstream calls with a global semaphore (LLM_MAX_CONCURRENCY),
+- records per-call latency, token usage, cache hits and coalesced calls in
+  the metrics registry.
+
+The upstream is any OpenAI-compatible /chat/completions endpoint
+(LLM_BASE_URL); core/llm_stub_server.py provides a local one for offline
+throughput and caching tests.
+"""
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+from crewai import BaseLLM
+
+from .config import settings
+from .metrics import metrics
+from ..utils.response_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+Messages = Union[str, List[Dict[str, str]]]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class LLMGatewayError(RuntimeError):
+    """The upstream LLM endpoint failed or returned a malformed response."""
+
+
+def chat_messages(messages: Messages) -> List[Dict[str, str]]:
+    """OpenAI-style chat messages for a prompt string or message list."""
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+    return list(messages)
+
+
+def normalize_messages(messages: Messages) -> List[Dict[str, str]]:
+    """Chat messages with whitespace collapsed, so formatting-only differences share a cache entry."""
+    return [
+        {"role": message["role"], "content": _WHITESPACE.sub(" ", str(message.get("content") or "")).strip()}
+        for message in chat_messages(messages)
+    ]
+
+
+def prompt_key(model: str, messages: Messages, temperature: Optional[float], stop: Optional[List[str]]) -> str:
+    """Cache key of one completion request, over the normalized messages."""
+    return content_hash(model, normalize_messages(messages), temperature, sorted(stop or []))
+
+
+class LLMGateway:
+    """Cached, coalescing, concurrency-limited client for an OpenAI-compatible chat endpoint."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 4,
+        cache_size: int = 512,
+        timeout: float = 60.0,
+        client: Optional[httpx.Client] = None
+    ):
+        """
+        Args:
+            base_url: OpenAI-compatible API root, e.g. https://api.openai.com/v1
+            api_key: Bearer token sent upstream
+            max_concurrency: Maximum concurrent upstream calls
+            cache_size: Completions kept in the LRU (0 disables caching)
+            timeout: Timeout of one upstream call in seconds
+            client: HTTP client to use instead of creating one (e.g. a test client)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.cache_size = cache_size
+        self._client = client or httpx.Client(
+            base_url=self.base_url,
+            headers={"Authorization": f"Bearer {api_key}"} if api_key else {},
+            timeout=timeout
+        )
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def complete(
+        self,
+        messages: Messages,
+        model: str,
+        temperature: Optional[float] = None,
+        stop: Optional[List[str]] = None
+    ) -> str:
+        """
+        Return the completion text for a chat request
+
+        Args:
+            messages: Prompt string or OpenAI-style chat messages
+            model: Model name sent upstream
+            temperature: Sampling temperature; only 0 / None responses are cached
+                or shared with identical in-flight calls
+            stop: Stop sequences
+
+        Returns:
+            Content of the first choice
+
+        Raises:
+            LLMGatewayError: If the upstream call fails
+        """
+        messages = chat_messages(messages)
+        if temperature:
+            # Sampled calls each get their own completion
+            return self._post(messages, model, temperature, stop)
+        key = prompt_key(model, messages, temperature, stop)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                metrics.increment("llm_cache_hits")
+                return self._cache[key]
+            pending = self._in_flight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._in_flight[key] = Future()
+
+        if not owner:
+            metrics.increment("llm_calls_coalesced")
+            return pending.result()
+
+        metrics.increment("llm_cache_misses")
+        try:
+            content = self._post(messages, model, temperature, stop)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+            if self.cache_size > 0:
+                self._cache[key] = content
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        pending.set_result(content)
+        return content
+
+    def complete_many(
+        self,
+        prompts: List[Messages],
+        model: str,
+        temperature: Optional[float] = None,
+        stop: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Complete a batch of prompts
+
+        Deterministic duplicates in the batch are sent once, cached prompts are not sent,
+        and the rest run concurrently up to the gateway's concurrency limit.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(len(prompts), self._max_concurrency))) as pool:
+            futures = [pool.submit(self.complete, prompt, model, temperature, stop) for prompt in prompts]
+            return [future.result() for future in futures]
+
+    def _post(self, messages: List[Dict[str, str]], model: str, temperature: Optional[float], stop: Optional[List[str]]) -> str:
+        payload: Dict[str, Any] = {"model": model, "messages": messages}
+        if temperature is not None:
+            payload["temperature"] = temperature
+        if stop:
+            payload["stop"] = stop
+
+        waited = time.perf_counter()
+        with self._semaphore:
+            started = time.perf_counter()
+            metrics.observe("llm_queue_seconds", started - waited)
+            try:
+                response = self._client.post("/chat/completions", json=payload)
+                response.raise_for_status()
+                body = response.json()
+                content = body["choices"][0]["message"]["content"] or ""
+            except (httpx.HTTPError, KeyError, IndexError, ValueError) as e:
+                metrics.increment("llm_call_errors")
+                raise LLMGatewayError(f"LLM call to {self.base_url} failed: {e}") from e
+            finally:
+                metrics.observe("llm_call_seconds", time.perf_counter() - started)
+
+        usage = body.get("usage") or {}
+        metrics.increment("llm_calls")
+        metrics.increment("llm_prompt_tokens", usage.get("prompt_tokens", 0))
+        metrics.increment("llm_completion_tokens", usage.get("completion_tokens", 0))
+        return content
+
+    def clear(self) -> None:
+        """Drop every cached completion."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class GatewayLLM(BaseLLM):
+    """CrewAI LLM that sends every call through the shared LLMGateway."""
+
+    def __init__(self, gateway: LLMGateway, model: str, temperature: Optional[float] = None):
+        super().__init__(model=model, temperature=temperature)
+        self.gateway = gateway
+
+    def call(
+        self,
+        messages: Messages,
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> str:
+        return self.gateway.complete(messages, self.model, self.temperature, self.stop)
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Return the process-wide gateway, configured from settings."""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway(
+                    settings.LLM_BASE_URL,
+                    api_key=settings.OPENAI_API_KEY,
+                    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+                    cache_size=settings.LLM_CACHE_SIZE,
+                    timeout=settings.LLM_TIMEOUT
+                )
+                metrics.register_callback("llm_cache_size", lambda: len(_gateway))
+                metrics.register_callback("llm_in_flight", lambda: _gateway.in_flight)
+                logger.info(
+                    f"LLM gateway for {settings.LLM_MODEL} at {settings.LLM_BASE_URL} "
+                    f"(max {settings.LLM_MAX_CONCURRENCY} concurrent calls, {settings.LLM_CACHE_SIZE} cached prompts)"
+                )
+    return _gateway
+
+
+def get_agent_llm() -> GatewayLLM:
+    """LLM to pass to every CrewAI Agent."""
+    return GatewayLLM(get_llm_gateway(), settings.LLM_MODEL, settings.LLM_TEMPERATURE)
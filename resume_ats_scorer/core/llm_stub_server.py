@@ -0,0 +1,144 @@
+"""
+OpenAI-compatible stub LLM server for offline throughput and caching tests.
+
+Serves POST /v1/chat/completions with a deterministic completion derived
+from the prompt, after a configurable delay, and GET /v1/stats with the
+number of completions served, so tests can check how many calls reached the
+"upstream". Point the agents at it with LLM_BASE_URL=http://127.0.0.1:8100/v1:
+
+    python -m resume_ats_scorer.core.llm_stub_server --port 8100 --latency-ms 200
+"""
+import sys
+import time
+import asyncio
+import hashlib
+import argparse
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from fastapi import FastAPI
+from pydantic import BaseModel, Field
+
+
+class ChatMessage(BaseModel):
+    role: str
+    content: Optional[str] = None
+
+
+class ChatCompletionRequest(BaseModel):
+    model: str = Field(default="stub", description="Model name; echoed back")
+    messages: List[ChatMessage] = Field(..., description="Chat messages")
+    temperature: Optional[float] = Field(default=None, description="Ignored; completions are deterministic")
+    stop: Optional[List[str]] = Field(default=None, description="Ignored")
+
+
+def _count_tokens(text: str) -> int:
+    return len(text.split())
+
+
+def stub_completion(messages: List[ChatMessage]) -> str:
+    """Deterministic completion for a prompt: a digest of it plus the start of the last message."""
+    prompt = "\n".join(f"{message.role}: {message.content or ''}" for message in messages)
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+    last = (messages[-1].content or "") if messages else ""
+    return f"Final Answer: stub-{digest} {' '.join(last.split()[:12])}"
+
+
+def create_stub_app(latency_ms: float = 0.0) -> FastAPI:
+    """
+    Build the stub server app
+
+    Args:
+        latency_ms: Delay added to every completion, to model upstream latency
+
+    Returns:
+        FastAPI application
+    """
+    app = FastAPI(title="Stub LLM server")
+    stats: Dict[str, int] = {"completions": 0, "prompt_tokens": 0, "completion_tokens": 0}
+    lock = threading.Lock()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: ChatCompletionRequest) -> Dict[str, Any]:
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        content = stub_completion(request.messages)
+        prompt_tokens = sum(_count_tokens(message.content or "") for message in request.messages)
+        completion_tokens = _count_tokens(content)
+        with lock:
+            stats["completions"] += 1
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+            number = stats["completions"]
+        return {
+            "id": f"chatcmpl-stub-{number}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    @app.get("/v1/models")
+    async def models() -> Dict[str, Any]:
+        return {"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "stub"}]}
+
+    @app.get("/v1/stats")
+    async def get_stats() -> Dict[str, int]:
+        with lock:
+            return dict(stats)
+
+    return app
+
+
+@contextmanager
+def serve_in_background(latency_ms: float = 0.0, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """
+    Run the stub server on a background thread
+
+    Args:
+        latency_ms: Delay added to every completion
+        host: Interface to bind
+        port: Port to bind; 0 picks a free one
+
+    Yields:
+        Base URL of the OpenAI-compatible API, e.g. http://127.0.0.1:53211/v1
+    """
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(create_stub_app(latency_ms), host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, name="llm-stub-server", daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("Stub LLM server failed to start")
+        time.sleep(0.01)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://{host}:{bound_port}/v1"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the stub server."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every completion")
+    args = parser.parse_args(argv)
+
+    uvicorn.run(create_stub_app(args.latency_ms), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Load-driven choice of the degradation level applied to scoring requests.
+
+The LoadMonitor watches two signals: the number of scoring requests waiting
+for an admission slot, and the p95 over the last DEGRADATION_WINDOW_SECONDS
+of scoring latency relative to the budget of its analysis level (so quick
+and deep requests are judged against their own budgets). When either signal
+reaches a level's threshold, that level is entered at once.
+
+Stepping back down is deliberately slower, so the mode does not flap as the
+skipped work itself lowers latency: a level is held for at least
+DEGRADATION_MIN_HOLD_SECONDS, and only left, one level at a time, once both
+signals are below DEGRADATION_RECOVERY_FRACTION of its thresholds.
+"""
+import time
+import logging
+import threading
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+from .config import settings
+from .metrics import metrics
+from ..models.schemas import DegradationLevel
+
+logger = logging.getLogger(__name__)
+
+
+class LoadMonitor:
+    """Degradation level with hysteresis, from queue depth and budget-relative p95 latency."""
+
+    def __init__(
+        self,
+        queue_thresholds: List[int],
+        latency_thresholds: List[float],
+        recovery_fraction: float = 0.5,
+        min_hold_seconds: float = 15.0,
+        window_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            queue_thresholds: Queue depth entering each level above NONE, in order
+            latency_thresholds: p95 latency/budget ratio entering each level above NONE, in order
+            recovery_fraction: Fraction of a level's thresholds load must fall below to leave it
+            min_hold_seconds: Minimum time at a level before stepping down
+            window_seconds: Age of the oldest latency sample used for the p95
+            clock: Monotonic time source
+        """
+        levels = len(DegradationLevel) - 1
+        if len(queue_thresholds) != levels or len(latency_thresholds) != levels:
+            raise ValueError(f"Expected {levels} queue and latency thresholds, one per degradation level")
+        self.queue_thresholds = list(queue_thresholds)
+        self.latency_thresholds = list(latency_thresholds)
+        self.recovery_fraction = recovery_fraction
+        self.min_hold_seconds = min_hold_seconds
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._queue_depth: Optional[Callable[[], int]] = None
+        self._samples: Deque[Tuple[float, float]] = deque()
+        self._level = DegradationLevel.NONE
+        self._changed_at = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> DegradationLevel:
+        """Level chosen by the last call to level()."""
+        return self._level
+
+    def watch_queue(self, queue_depth: Callable[[], int]) -> None:
+        """Use queue_depth() (e.g. the admission controller's queue) as the queue signal."""
+        self._queue_depth = queue_depth
+
+    def observe(self, seconds: float, budget_seconds: Optional[float] = None) -> None:
+        """Record the latency of a scoring request, relative to its budget if it has one."""
+        ratio = seconds / budget_seconds if budget_seconds else seconds
+        with self._lock:
+            self._samples.append((self._clock(), ratio))
+
+    def _p95(self, now: float) -> float:
+        while self._samples and self._samples[0][0] < now - self.window_seconds:
+            self._samples.popleft()
+        if not self._samples:
+            return 0.0
+        ordered = sorted(ratio for _, ratio in self._samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def _target(self, queue: int, p95: float) -> DegradationLevel:
+        target = DegradationLevel.NONE
+        for index, (queue_threshold, latency_threshold) in enumerate(zip(self.queue_thresholds, self.latency_thresholds)):
+            if queue >= queue_threshold or p95 >= latency_threshold:
+                target = DegradationLevel(index + 1)
+        return target
+
+    def _recovered(self, level: DegradationLevel, queue: int, p95: float) -> bool:
+        index = level - 1
+        return (
+            queue < self.queue_thresholds[index] * self.recovery_fraction
+            and p95 < self.latency_thresholds[index] * self.recovery_fraction
+        )
+
+    def level(self) -> DegradationLevel:
+        """Re-evaluate the load and return the degradation level to apply to a new request."""
+        queue = self._queue_depth() if self._queue_depth is not None else 0
+        with self._lock:
+            now = self._clock()
+            p95 = self._p95(now)
+            target = self._target(queue, p95)
+            level = self._level
+            if target > level:
+                level = target
+            elif (
+                target < level
+                and now - self._changed_at >= self.min_hold_seconds
+                and self._recovered(level, queue, p95)
+            ):
+                level = DegradationLevel(level - 1)
+
+            if level != self._level:
+                logger.warning(
+                    f"Degradation level {self._level.name} -> {level.name} "
+                    f"(queue {queue}, p95 latency/budget {p95:.2f})"
+                )
+                metrics.increment("degradation_level_changes")
+                self._level = level
+                self._changed_at = now
+            return level
+
+
+_monitor: Optional[LoadMonitor] = None
+_monitor_lock = threading.Lock()
+
+
+def get_load_monitor() -> LoadMonitor:
+    """Process-wide load monitor configured from settings."""
+    global _monitor
+    if _monitor is None:
+        with _monitor_lock:
+            if _monitor is None:
+                _monitor = LoadMonitor(
+                    settings.DEGRADATION_QUEUE_THRESHOLDS,
+                    settings.DEGRADATION_LATENCY_THRESHOLDS,
+                    recovery_fraction=settings.DEGRADATION_RECOVERY_FRACTION,
+                    min_hold_seconds=settings.DEGRADATION_MIN_HOLD_SECONDS,
+                    window_seconds=settings.DEGRADATION_WINDOW_SECONDS
+                )
+                metrics.register_callback("degradation_level", lambda: int(_monitor.current))
+    return _monitor
@@ -0,0 +1,97 @@
+import math
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+class _Summary:
+    """Running count/sum/max plus a bounded window of recent values for percentiles."""
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "avg": round(self.total / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "p50": round(self.percentile(0.5), 6),
+            "p95": round(self.percentile(0.95), 6),
+        }
+
+
+class MetricsRegistry:
+    """In-process registry of counters, gauges and summaries exposed on /metrics."""
+
+    def __init__(self, window: int = 1024):
+        self._window = window
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._summaries: Dict[str, _Summary] = {}
+        self._callbacks: Dict[str, Callable[[], Any]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Add to a monotonically increasing counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Record the current value of a gauge."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record one observation (e.g. a latency in seconds) of a summary."""
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                summary = self._summaries[name] = _Summary(self._window)
+            summary.observe(value)
+
+    def percentile(self, name: str, fraction: float) -> Optional[float]:
+        """Return a percentile of the recent observations of a summary."""
+        with self._lock:
+            summary = self._summaries.get(name)
+            return summary.percentile(fraction) if summary else None
+
+    def register_callback(self, name: str, callback: Callable[[], Any]) -> None:
+        """Register a gauge whose value is computed when metrics are read."""
+        with self._lock:
+            self._callbacks[name] = callback
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all metrics as a JSON-serializable dictionary."""
+        with self._lock:
+            gauges = dict(self._gauges)
+            callbacks = dict(self._callbacks)
+            result = {
+                "counters": dict(self._counters),
+                "summaries": {name: summary.snapshot() for name, summary in self._summaries.items()},
+            }
+
+        for name, callback in callbacks.items():
+            gauges[name] = callback()
+        result["gauges"] = gauges
+        return result
+
+
+# Shared registry for the whole process
+metrics = MetricsRegistry()
@@ -0,0 +1,209 @@
+"""
+Declared stage graphs for request pipelines.
+
+A StageGraph is a set of named stages with explicit dependencies. Running
+the graph starts every stage as soon as the stages it requires have
+finished, so independent stages overlap and end-to-end latency approaches
+the critical path instead of the sum of all stages.
+
+Each stage runs on the event loop (the default, for cheap or truly
+asynchronous work), on the shared thread pool ("thread", for blocking file
+parsing and NLP), or on any concurrent.futures executor passed in (for
+example a process pool; its functions and arguments must be picklable).
+Stage durations are recorded in the metrics registry.
+
+A run can be given a CancellationToken. It is checked before each stage
+starts, stages that require CANCELLATION receive it (to hand it to blocking
+work), and it is cancelled when the run fails or is cancelled, so work still
+running on threads or in extraction processes is abandoned with it.
+"""
+import time
+import asyncio
+import inspect
+import logging
+import functools
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .cancellation import CancellationToken
+from .config import settings
+from .exceptions import ScoringCancelled
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+THREAD = "thread"
+# Implicit graph input: the run's CancellationToken (or None)
+CANCELLATION = "cancellation"
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_lock = threading.Lock()
+
+
+def get_stage_thread_pool() -> ThreadPoolExecutor:
+    """Thread pool shared by every stage that runs with executor="thread"."""
+    global _thread_pool
+    if _thread_pool is None:
+        with _thread_pool_lock:
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(
+                    max_workers=settings.PIPELINE_THREAD_WORKERS,
+                    thread_name_prefix="pipeline-stage"
+                )
+    return _thread_pool
+
+
+def _call_blocking(func: Callable[..., Any], kwargs: Dict[str, Any]) -> Any:
+    """Run a stage in a worker; coroutine stages get an event loop of their own."""
+    value = func(**kwargs)
+    if inspect.iscoroutine(value):
+        value = asyncio.run(value)
+    return value
+
+
+class Stage(NamedTuple):
+    """One step of a pipeline: called with the results it requires as keyword arguments."""
+    name: str
+    func: Callable[..., Any]
+    requires: Tuple[str, ...]
+    executor: Union[None, str, Executor]
+
+
+class PipelineRun(NamedTuple):
+    """Results and per-stage durations of one graph run."""
+    results: Dict[str, Any]
+    timings: Dict[str, float]
+    elapsed: float
+    critical_path: float
+
+
+class StageGraph:
+    """
+    A DAG of pipeline stages.
+
+    Stages may only require graph inputs or stages added before them, so
+    the insertion order is always a valid topological order and cycles
+    cannot be declared.
+    """
+
+    def __init__(self, name: str, inputs: Iterable[str] = ()):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self._stages: Dict[str, Stage] = {}
+
+    @property
+    def stages(self) -> List[Stage]:
+        return list(self._stages.values())
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        requires: Iterable[str] = (),
+        executor: Union[None, str, Executor] = None
+    ) -> "StageGraph":
+        """
+        Declare a stage
+
+        Args:
+            name: Stage name; its result is passed to dependents under this name
+            func: Function or coroutine function taking the required results as keyword arguments
+            requires: Graph inputs, CANCELLATION and earlier stages this stage depends on
+            executor: None (event loop), "thread" (shared thread pool) or an Executor
+
+        Returns:
+            The graph, so declarations can be chained
+        """
+        requires = tuple(requires)
+        if name in self._stages or name in self.inputs:
+            raise ValueError(f"Stage {name} is already declared in pipeline {self.name}")
+        unknown = [
+            dependency for dependency in requires
+            if dependency not in self._stages and dependency not in self.inputs and dependency != CANCELLATION
+        ]
+        if unknown:
+            raise ValueError(f"Stage {name} requires undeclared stages or inputs: {', '.join(unknown)}")
+        if executor is not None and executor != THREAD and not isinstance(executor, Executor):
+            raise ValueError(f"Unknown executor for stage {name}: {executor!r}")
+        self._stages[name] = Stage(name, func, requires, executor)
+        return self
+
+    async def _call(self, stage: Stage, kwargs: Dict[str, Any]) -> Any:
+        if stage.executor is None:
+            value = stage.func(**kwargs)
+            if inspect.isawaitable(value):
+                value = await value
+            return value
+
+        executor = get_stage_thread_pool() if stage.executor == THREAD else stage.executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(_call_blocking, stage.func, kwargs))
+
+    async def run(self, cancellation: Optional[CancellationToken] = None, **inputs: Any) -> PipelineRun:
+        """
+        Run every stage, each as soon as its requirements are available
+
+        Args:
+            cancellation: Token checked before each stage and cancelled if the run fails
+            inputs: Values of the graph inputs
+
+        Returns:
+            Results of the inputs and all stages, with timings
+
+        Raises:
+            ScoringCancelled: If the token was cancelled before a stage started
+            The first exception raised by a stage; stages not yet finished are cancelled
+        """
+        missing = [name for name in self.inputs if name not in inputs]
+        if missing:
+            raise ValueError(f"Pipeline {self.name} is missing inputs: {', '.join(missing)}")
+
+        results: Dict[str, Any] = dict(inputs)
+        results[CANCELLATION] = cancellation
+        timings: Dict[str, float] = {}
+        tasks: Dict[str, asyncio.Future] = {}
+
+        async def run_stage(stage: Stage) -> None:
+            dependencies = [tasks[dependency] for dependency in stage.requires if dependency in tasks]
+            if dependencies:
+                await asyncio.gather(*dependencies)
+            if cancellation is not None:
+                cancellation.raise_if_cancelled()
+            started = time.perf_counter()
+            results[stage.name] = await self._call(stage, {dependency: results[dependency] for dependency in stage.requires})
+            timings[stage.name] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for stage in self._stages.values():
+            tasks[stage.name] = asyncio.ensure_future(run_stage(stage))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException as e:
+            for task in tasks.values():
+                task.cancel()
+            if cancellation is not None:
+                cancellation.cancel(f"pipeline {self.name} stopped: {type(e).__name__}")
+            if isinstance(e, (ScoringCancelled, asyncio.CancelledError)):
+                metrics.increment(f"{self.name}_stages_cancelled", len(self._stages) - len(timings))
+            raise
+        elapsed = time.perf_counter() - started
+
+        critical_path = self._critical_path(timings)
+        for stage_name, seconds in timings.items():
+            metrics.observe(f"{self.name}_stage_seconds_{stage_name}", seconds)
+        metrics.observe(f"{self.name}_seconds", elapsed)
+        metrics.observe(f"{self.name}_critical_path_seconds", critical_path)
+        logger.debug(
+            f"Pipeline {self.name} finished in {elapsed * 1000:.1f}ms "
+            f"(critical path {critical_path * 1000:.1f}ms, stages {sum(timings.values()) * 1000:.1f}ms)"
+        )
+        return PipelineRun(results, timings, elapsed, critical_path)
+
+    def _critical_path(self, timings: Dict[str, float]) -> float:
+        """Longest chain of dependent stage durations."""
+        finish: Dict[str, float] = {}
+        for stage in self._stages.values():
+            ready = max((finish.get(dependency, 0.0) for dependency in stage.requires), default=0.0)
+            finish[stage.name] = ready + timings.get(stage.name, 0.0)
+        return max(finish.values(), default=0.0)
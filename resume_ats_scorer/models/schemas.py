@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any
-from enum import Enum
+from enum import Enum, IntEnum
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
@@ -23,6 +23,19 @@ class ResumeSection(str, Enum):
     OTHER = "other"
 
 
+class AnalysisLevel(str, Enum):
+    QUICK = "quick"
+    STANDARD = "standard"
+    DEEP = "deep"
+
+
+class DegradationLevel(IntEnum):
+    """Optional work skipped under load; each level also skips what the levels below it skip."""
+    NONE = 0
+    REDUCED = 1  # no spaCy similarity or layout analysis
+    MINIMAL = 2  # core recommendation rules only
+
+
 class JobSource(str, Enum):
     LINKEDIN = "linkedin"
     NAUKRI = "naukri"
@@ -38,6 +51,7 @@ class SectionScore(BaseModel):
     max_score: float = Field(default=10, description="Maximum possible score for this section")
     feedback: str = Field(..., description="Feedback on this section")
     matches: List[str] = Field(default_factory=list, description="Matching keywords or phrases")
+    fuzzy_matches: List[str] = Field(default_factory=list, description="Keywords matched only approximately (e.g. misspelled)")
     missing: List[str] = Field(default_factory=list, description="Missing keywords or phrases")
 
     model_config = {
@@ -198,7 +212,13 @@ class ParsedJobDescription(BaseModel):
 class ResumeUploadRequest(BaseModel):
     job_description: str = Field(..., description="Job description text")
     job_source: JobSource = Field(default=JobSource.OTHER, description="Source of the job posting")
-    job_title: str = Field(..., description="Job title")
+    job_title: Optional[str] = Field(default=None, description="Job title")
+    analysis_level: AnalysisLevel = Field(
+        default=AnalysisLevel.STANDARD,
+        description="quick (scores only), standard (scores and recommendations) or deep (adds similarity and layout analysis)"
+    )
+    resume_file_path: Optional[str] = Field(default=None, description="Path of the uploaded resume file, set by the server")
+    file_type: Optional[FileType] = Field(default=None, description="Type of the resume file (detected from its extension if not set)")
 
     model_config = {
         "json_schema_extra": {
@@ -250,11 +270,38 @@ class JobRequirements(BaseModel):
 class ResumeScoreResponse(BaseModel):
     """Response model for resume scoring."""
     success: bool = Field(..., description="Whether the scoring was successful")
+    filename: Optional[str] = Field(default=None, description="Name of the scored resume file")
     overall_score: float = Field(..., description="Overall ATS compatibility score (0-100)")
     content_score: float = Field(..., description="Content match score (0-100)")
     format_score: float = Field(..., description="Format compatibility score (0-100)")
     section_scores: Dict[str, float] = Field(..., description="Scores for each resume section")
     recommendations: List[str] = Field(..., description="List of improvement recommendations")
+    fuzzy_matches: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Job keywords matched only approximately, mapped to the resume term that matched them"
+    )
+    requirement_matches: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Job requirements met by the resume, mapped to the resume keyword that satisfied them"
+    )
+    analysis_level: AnalysisLevel = Field(default=AnalysisLevel.STANDARD, description="Analysis level that produced the result")
+    similarity_score: Optional[float] = Field(
+        default=None,
+        description="Semantic similarity between resume and job description (0-1, deep analysis only)"
+    )
+    layout_analysis: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-check ATS layout scores (0-1, deep analysis only)"
+    )
+    keyword_analysis: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Skill, experience and education keywords found in the resume (standard and deep analysis)"
+    )
+    degraded: bool = Field(default=False, description="Whether optional analysis was skipped because the service was under load")
+    degradation_level: DegradationLevel = Field(
+        default=DegradationLevel.NONE,
+        description="Degradation applied: 0 none, 1 without similarity and layout analysis, 2 also core recommendations only"
+    )
     breakdown: Dict[str, Dict[str, float]] = Field(
         ...,
         description="Detailed breakdown of scoring weights and calculations",
@@ -334,6 +381,44 @@ class ResumeScoreResponse(BaseModel):
         return round(v, 2)
 
 
+class RankedCandidate(BaseModel):
+    candidate_id: str = Field(..., description="Identifier of the stored candidate")
+    rank: int = Field(..., ge=1, description="Position in the ranked list (1 = best)")
+    score: float = Field(..., description="Total score from the full resume scorer (0-100)")
+    prefilter_score: float = Field(..., description="Skill-index relevance used to select candidates for full scoring")
+    filename: str = Field(..., description="Resume file name")
+    matched_keywords: List[str] = Field(default_factory=list, description="Job skills found on the resume")
+
+
+class RankingResponse(BaseModel):
+    job_title: str = Field(..., description="Job title the candidates were ranked for")
+    total: int = Field(..., description="Number of ranked candidates across all pages")
+    page: int = Field(..., ge=1, description="Page number")
+    page_size: int = Field(..., ge=1, description="Candidates per page")
+    candidates: List[RankedCandidate] = Field(default_factory=list, description="Ranked candidates on this page")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "job_title": "Backend Engineer",
+                "total": 2,
+                "page": 1,
+                "page_size": 10,
+                "candidates": [
+                    {
+                        "candidate_id": "cand-42",
+                        "rank": 1,
+                        "score": 78.5,
+                        "prefilter_score": 6.2,
+                        "filename": "jane_doe.pdf",
+                        "matched_keywords": ["python", "aws"]
+                    }
+                ]
+            }
+        }
+    }
+
+
 class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
     details: Optional[Any] = Field(default=None, description="Additional error details")
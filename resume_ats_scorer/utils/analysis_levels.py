@@ -0,0 +1,83 @@
+"""
+Helpers for the quick / standard / deep analysis levels.
+
+quick     scores only; never loads spaCy or runs the recommendation engine
+standard  scores and recommendations (the default)
+deep      standard plus spaCy document similarity and a layout analysis
+
+The deep-only analyses import text_processors lazily, so scoring a quick or
+standard request (utils/scoring.py, the crew manager) never needs the spaCy
+model. The API process still loads it at import, through the upload routes'
+keyword and requirement extraction.
+
+Under load (core/load_monitor.py) a degradation level is applied on top:
+level 1 drops the deep-only analyses and level 2 also limits recommendations
+to the core rules.
+"""
+import logging
+from typing import Dict, Optional
+
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..models.schemas import AnalysisLevel, DegradationLevel, JobRequirements
+
+logger = logging.getLogger(__name__)
+
+
+def includes_recommendations(level: AnalysisLevel) -> bool:
+    """Whether the level produces recommendations / improvement suggestions."""
+    return level != AnalysisLevel.QUICK
+
+
+def includes_deep_analysis(level: AnalysisLevel) -> bool:
+    """Whether the level adds similarity and layout analysis."""
+    return level == AnalysisLevel.DEEP
+
+
+def applied_degradation(level: AnalysisLevel, degradation: DegradationLevel) -> DegradationLevel:
+    """The part of a degradation level that removes work from a request of this analysis level."""
+    if degradation >= DegradationLevel.MINIMAL and includes_recommendations(level):
+        return DegradationLevel.MINIMAL
+    if degradation >= DegradationLevel.REDUCED and includes_deep_analysis(level):
+        return DegradationLevel.REDUCED
+    return DegradationLevel.NONE
+
+
+def latency_budget_ms(level: AnalysisLevel) -> Optional[float]:
+    """Configured latency budget of a level, in milliseconds."""
+    return settings.ANALYSIS_LATENCY_BUDGETS_MS.get(AnalysisLevel(level).value)
+
+
+def record_analysis_latency(level: AnalysisLevel, seconds: float) -> None:
+    """Record the scoring latency of a level and warn when it exceeds its budget."""
+    level = AnalysisLevel(level)
+    metrics.observe(f"analysis_latency_seconds_{level.value}", seconds)
+    budget = latency_budget_ms(level)
+    if budget is not None and seconds * 1000 > budget:
+        metrics.increment(f"analysis_budget_exceeded_{level.value}")
+        logger.warning(f"{level.value} analysis took {seconds * 1000:.0f}ms (budget {budget:.0f}ms)")
+
+
+def job_requirements_text(job_requirements: JobRequirements) -> str:
+    """Flatten extracted job requirements into text for similarity scoring."""
+    parts = list(job_requirements.required_skills) + list(job_requirements.preferred_skills)
+    parts.extend(job_requirements.education_required or [])
+    if job_requirements.experience_required:
+        parts.append(f"{job_requirements.experience_required} years of experience")
+    return ", ".join(parts)
+
+
+def semantic_similarity(resume_text: str, job_text: str) -> float:
+    """spaCy document similarity between a resume and a job description (0-1)."""
+    from .text_processors import MatchingAlgorithm as TextMatcher
+
+    if not resume_text.strip() or not job_text.strip():
+        return 0.0
+    return round(max(0.0, min(1.0, float(TextMatcher().calculate_similarity(resume_text, job_text)))), 4)
+
+
+def layout_analysis(resume_text: str) -> Dict[str, float]:
+    """ATS layout checks (bullets, date consistency, headers, spacing, common issues), each 0-1."""
+    from .text_processors import ATSFormatChecker
+
+    return ATSFormatChecker().check_format(resume_text)
@@ -0,0 +1,226 @@
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from ..models.schemas import JobRequirements, KeywordAnalysis
+from .format_analyzer import analyze_format
+from .phrase_index import PhraseIndex
+from .scoring import (
+    FORMAT_PATTERNS,
+    RESUME_SECTIONS,
+    SCORING_BULLETS,
+    SKILL_SEPARATORS,
+    identify_resume_sections
+)
+
+logger = logging.getLogger(__name__)
+
+# Maximum content match and section scores of score_resume_components
+CONTENT_MAX_SCORE = 40.0
+SECTION_MAX_SCORE = 30.0
+
+# (feature name, group, weight). The score_resume_components components are
+# the weighted sums of their groups' features: content match ("content", scaled
+# to 40), format compatibility ("format", points of each passed check) and
+# section quality (one group per RESUME_SECTIONS entry, in its order, with the
+# section's points). Features and weights are listed in the order the scalar
+# scorer adds them up, so the vectorized sums are bit-for-bit the same.
+FEATURES: Tuple[Tuple[str, str, float], ...] = (
+    ("required_skill_ratio", "content", 0.6),
+    ("preferred_skill_ratio", "content", 0.2),
+    ("experience_match", "content", 0.1),
+    ("education_match", "content", 0.1),
+    ("has_bullets", "format", 3.0),
+    ("has_date_ranges", "format", 3.0),
+    ("has_action_verbs", "format", 3.0),
+    ("length_in_range", "format", 3.0),
+    ("no_personal_pronouns", "format", 2.0),
+    ("consistent_tense", "format", 2.0),
+    ("text_extracted", "format", 4.0),
+    ("contact_email", "contact_info", RESUME_SECTIONS["contact_info"] * 0.4),
+    ("contact_phone", "contact_info", RESUME_SECTIONS["contact_info"] * 0.3),
+    ("contact_linkedin", "contact_info", RESUME_SECTIONS["contact_info"] * 0.3),
+    ("summary_length", "summary", float(RESUME_SECTIONS["summary"])),
+    ("experience_dates", "experience", RESUME_SECTIONS["experience"] * 0.3),
+    ("experience_bullets", "experience", RESUME_SECTIONS["experience"] * 0.3),
+    ("experience_action_verbs", "experience", RESUME_SECTIONS["experience"] * 0.4),
+    ("education_institution", "education", RESUME_SECTIONS["education"] * 0.4),
+    ("education_degree", "education", RESUME_SECTIONS["education"] * 0.4),
+    ("education_year", "education", RESUME_SECTIONS["education"] * 0.2),
+    ("skills_coverage", "skills", float(RESUME_SECTIONS["skills"])),
+    ("certifications_detail", "certifications", float(RESUME_SECTIONS["certifications"])),
+)
+
+FEATURE_NAMES: Tuple[str, ...] = tuple(name for name, _, _ in FEATURES)
+FEATURE_INDEX: Dict[str, int] = {name: index for index, name in enumerate(FEATURE_NAMES)}
+FEATURE_WEIGHTS = np.array([weight for _, _, weight in FEATURES], dtype=np.float64)
+
+_GROUP_FEATURES: Dict[str, List[int]] = {
+    group: [index for index, (_, feature_group, _) in enumerate(FEATURES) if feature_group == group]
+    for _, group, _ in FEATURES
+}
+
+
+def _skill_ratio(skills: List[str], skill_index: PhraseIndex) -> float:
+    if not skills:
+        return 1.0
+    return sum(1 for skill in skills if skill_index.contains(skill)) / max(len(skills), 1)
+
+
+def _summary_length(word_count: int) -> float:
+    if 50 <= word_count <= 200:
+        return 1.0
+    return 0.6 if word_count < 50 else 0.7
+
+
+def _skills_coverage(skill_count: int) -> float:
+    if skill_count >= 10:
+        return 1.0
+    return 0.7 if skill_count >= 5 else 0.4
+
+
+def extract_features(
+    resume_text: str,
+    resume_keywords: KeywordAnalysis,
+    job_requirements: JobRequirements,
+    file_type: str
+) -> np.ndarray:
+    """
+    Turn a resume / job requirements pair into the feature vector score_resume_components scores
+
+    Args:
+        resume_text: The text content of the resume
+        resume_keywords: Keywords extracted from the resume
+        job_requirements: Requirements extracted from the job description
+        file_type: The file type of the resume
+
+    Returns:
+        Float vector ordered as FEATURE_NAMES, every value in [0, 1]
+    """
+    vector = np.zeros(len(FEATURE_NAMES), dtype=np.float64)
+
+    def set_feature(name: str, value: float) -> None:
+        vector[FEATURE_INDEX[name]] = value
+
+    # Content match (calculate_content_match_score)
+    required = job_requirements.required_skills
+    preferred = job_requirements.preferred_skills
+    skill_index = PhraseIndex.for_phrases(resume_keywords.hard_skills + resume_keywords.soft_skills, required + preferred)
+    set_feature("required_skill_ratio", _skill_ratio(required, skill_index))
+    set_feature("preferred_skill_ratio", _skill_ratio(preferred, skill_index))
+
+    experience_match = 1.0
+    if job_requirements.experience_required and resume_keywords.experience:
+        max_exp = max(resume_keywords.experience.values())
+        if max_exp < job_requirements.experience_required:
+            experience_match = max_exp / job_requirements.experience_required
+    set_feature("experience_match", experience_match)
+
+    education_match = 1.0
+    if job_requirements.education_required and resume_keywords.education:
+        education_index = PhraseIndex.for_phrases(resume_keywords.education, job_requirements.education_required)
+        education_match = float(any(education_index.contains(edu_req) for edu_req in job_requirements.education_required))
+    set_feature("education_match", education_match)
+
+    # Format compatibility (analyze_format_compatibility)
+    features = analyze_format(resume_text)
+    past_tense, present_tense = features.past_tense_count, features.present_tense_count
+    mixed_tenses = past_tense > 0 and present_tense > 0 and min(past_tense, present_tense) / max(past_tense, present_tense) > 0.4
+    set_feature("has_bullets", features.has_bullets(SCORING_BULLETS))
+    set_feature("has_date_ranges", features.has_date_range)
+    set_feature("has_action_verbs", features.action_verb_count > 0)
+    set_feature("length_in_range", FORMAT_PATTERNS["appropriate_length"](resume_text))
+    set_feature("no_personal_pronouns", not features.pronoun_count)
+    set_feature("consistent_tense", not mixed_tenses)
+    set_feature("text_extracted", not (file_type == "pdf" and "could not extract" in resume_text.lower()))
+
+    # Section quality (evaluate_section_scores); missing sections score 0
+    sections = identify_resume_sections(resume_text)
+    if sections["contact_info"]:
+        contact = analyze_format(sections["contact_info"])
+        set_feature("contact_email", contact.has_email)
+        set_feature("contact_phone", contact.has_phone)
+        set_feature("contact_linkedin", contact.has_linkedin)
+    if sections["summary"]:
+        set_feature("summary_length", _summary_length(analyze_format(sections["summary"]).word_count))
+    if sections["experience"]:
+        experience = analyze_format(sections["experience"])
+        set_feature("experience_dates", experience.has_date_range)
+        set_feature("experience_bullets", experience.has_bullets(SCORING_BULLETS))
+        set_feature("experience_action_verbs", experience.action_verb_count > 0)
+    if sections["education"]:
+        education = analyze_format(sections["education"])
+        set_feature("education_institution", education.has_institution)
+        set_feature("education_degree", education.has_degree)
+        set_feature("education_year", education.has_year)
+    if sections["skills"]:
+        skills = analyze_format(sections["skills"])
+        set_feature(
+            "skills_coverage",
+            _skills_coverage(skills.comma_count + skills.newline_count + skills.bullet_count(SKILL_SEPARATORS) + 1)
+        )
+    if sections["certifications"]:
+        set_feature("certifications_detail", 1.0 if len(sections["certifications"]) > 50 else 0.5)
+
+    return vector
+
+
+def build_feature_matrix(pairs: Iterable[Tuple[str, KeywordAnalysis, JobRequirements, str]]) -> np.ndarray:
+    """
+    Stack the feature vectors of many pairs
+
+    Args:
+        pairs: (resume text, resume keywords, job requirements, file type) tuples
+
+    Returns:
+        Array of shape (number of pairs, len(FEATURE_NAMES))
+    """
+    rows: List[np.ndarray] = [extract_features(*pair) for pair in pairs]
+    if not rows:
+        return np.empty((0, len(FEATURE_NAMES)), dtype=np.float64)
+    return np.vstack(rows)
+
+
+def _group_sum(features: np.ndarray, group: str) -> np.ndarray:
+    total = np.zeros(len(features), dtype=np.float64)
+    for index in _GROUP_FEATURES[group]:
+        total = total + features[:, index] * FEATURE_WEIGHTS[index]
+    return total
+
+
+def _round1(values: np.ndarray) -> np.ndarray:
+    # Python's round, like the scalar scorer: np.round scales by 10 first and so
+    # rounds values such as 0.15 (just below the tie in binary) the other way
+    return np.array([round(value, 1) for value in values.tolist()], dtype=np.float64)
+
+
+def score_matrix(features: np.ndarray) -> np.ndarray:
+    """
+    Score every row of a feature matrix with array operations over the whole batch
+
+    Reproduces the total of score_resume_components: content match, format
+    compatibility, section quality and the overall impression derived from them.
+
+    Args:
+        features: Array of shape (n, len(FEATURE_NAMES)) or a single vector
+
+    Returns:
+        Total scores (0-100), one per row, or a single score for a single vector
+    """
+    features = np.asarray(features, dtype=np.float64)
+    single = features.ndim == 1
+    features = np.atleast_2d(features)
+
+    content = _round1(np.minimum(_group_sum(features, "content") * CONTENT_MAX_SCORE, CONTENT_MAX_SCORE))
+    format_score = np.maximum(_group_sum(features, "format"), 0.0)
+    section_total = np.zeros(len(features), dtype=np.float64)
+    for section in RESUME_SECTIONS:
+        section_total = section_total + _group_sum(features, section)
+    section = _round1(section_total / sum(RESUME_SECTIONS.values()) * SECTION_MAX_SCORE)
+    overall = _round1(np.minimum(
+        (content / CONTENT_MAX_SCORE * 0.5 + format_score / 20 * 0.25 + section / SECTION_MAX_SCORE * 0.25) * 10, 10.0
+    ))
+
+    scores = content + format_score + section + overall
+    return scores[0] if single else scores
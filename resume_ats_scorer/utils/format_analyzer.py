@@ -0,0 +1,152 @@
+import re
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Set
+
+logger = logging.getLogger(__name__)
+
+_MONTH_ABBR = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)"
+_MONTH = (
+    r"(?:January|February|March|April|May|June|July|August|September|October|November|December"
+    r"|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)"
+)
+
+# One alternation evaluated left to right at each position; earlier groups win
+# where they overlap (a date range is not also counted as two years, an ISO date
+# is not also a yyyy-mm date, ...). Compiled once at import.
+_FORMAT_TOKEN = re.compile(
+    r"(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
+    r"|(?P<linkedin>linkedin\.com/in/[a-zA-Z0-9\-]+)"
+    rf"|(?P<date_range>{_MONTH}\s+\d{{4}}\s*[-–—]\s*{_MONTH}\s+\d{{4}})"
+    rf"|(?P<month_year>\b{_MONTH_ABBR}[a-z]*\.?\s+\d{{4}}\b)"
+    r"|(?P<dd_mm_yyyy>\b\d{2}/\d{2}/\d{4}\b)"
+    r"|(?P<iso>\b\d{4}-\d{2}-\d{2}\b)"
+    r"|(?P<yyyy_mm>\b\d{4}-\d{2}\b)"
+    r"|(?P<mm_yyyy>\b\d{2}/\d{4}\b)"
+    r"|(?P<phone>[\+\(]?[0-9][0-9 \-\(\)]{8,}[0-9])"
+    r"|(?P<year>\b(?:19|20)\d{2}\b)"
+    r"|(?P<word>\w+)"
+    r"|(?P<bullet>[•■○►✓✔*+\-])"
+    r"|(?P<comma>,)"
+    r"|(?P<table>[|\t])"
+    r"|(?P<newline>\n)"
+)
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+
+# Groups that identify a distinct date notation
+DATE_FORMATS = ("month_year", "dd_mm_yyyy", "iso", "yyyy_mm", "mm_yyyy")
+
+ACTION_VERBS = frozenset([
+    'led', 'managed', 'developed', 'created', 'implemented', 'achieved', 'improved',
+    'increased', 'decreased', 'coordinated', 'designed'
+])
+PERSONAL_PRONOUNS = frozenset(['i', 'me', 'my', 'mine', 'myself'])
+INSTITUTION_WORDS = frozenset(['university', 'college', 'institute', 'school'])
+DEGREE_WORDS = frozenset(['phd', 'doctorate', 'bsc', 'ba', 'bs', 'msc', 'ms', 'ma', 'mba'])
+DEGREE_PREFIXES = ('bachelor', 'master')
+
+
+@dataclass
+class FormatFeatures:
+    """Formatting features of a text, collected in a single pass."""
+    length: int = 0
+    newline_count: int = 0
+    word_count: int = 0
+    comma_count: int = 0
+    bullet_counts: Dict[str, int] = field(default_factory=dict)
+    date_formats: Set[str] = field(default_factory=set)
+    has_date_range: bool = False
+    has_year: bool = False
+    has_email: bool = False
+    has_phone: bool = False
+    has_linkedin: bool = False
+    has_table_chars: bool = False
+    has_institution: bool = False
+    has_degree: bool = False
+    pronoun_count: int = 0
+    action_verb_count: int = 0
+    past_tense_count: int = 0
+    present_tense_count: int = 0
+    first_line_repeated: bool = False
+
+    @property
+    def line_count(self) -> int:
+        return self.newline_count + 1
+
+    def has_bullets(self, symbols: Iterable[str]) -> bool:
+        """Whether any of the given bullet symbols occurs."""
+        return any(self.bullet_counts.get(symbol) for symbol in symbols)
+
+    def bullet_count(self, symbols: Iterable[str]) -> int:
+        """Total occurrences of the given bullet symbols."""
+        return sum(self.bullet_counts.get(symbol, 0) for symbol in symbols)
+
+
+def analyze_format(text: str) -> FormatFeatures:
+    """
+    Collect formatting features of a text
+
+    Args:
+        text: Resume text or the content of one resume section
+
+    Returns:
+        Feature record read by the format and section scorers
+    """
+    features = FormatFeatures(length=len(text))
+    bullets: Counter = Counter()
+
+    for match in _FORMAT_TOKEN.finditer(text):
+        kind = match.lastgroup
+        if kind == 'word':
+            word = match.group()
+            features.word_count += 1
+            lowered = word.lower()
+            if word in ACTION_VERBS:
+                features.action_verb_count += 1
+            if lowered in PERSONAL_PRONOUNS:
+                features.pronoun_count += 1
+            if word == 'Present':
+                features.has_date_range = True
+            if len(word) > 2 and word.endswith('ed'):
+                features.past_tense_count += 1
+            elif len(word) > 3 and word.endswith('ing'):
+                features.present_tense_count += 1
+            if lowered in INSTITUTION_WORDS:
+                features.has_institution = True
+            if lowered in DEGREE_WORDS or lowered.startswith(DEGREE_PREFIXES):
+                features.has_degree = True
+        elif kind == 'newline':
+            features.newline_count += 1
+        elif kind == 'bullet':
+            bullets[match.group()] += 1
+        elif kind == 'comma':
+            features.comma_count += 1
+        elif kind == 'year':
+            features.has_year = True
+        elif kind == 'date_range':
+            features.has_date_range = True
+            features.has_year = True
+            features.date_formats.add('month_year')
+        elif kind in DATE_FORMATS:
+            features.has_year = True
+            features.date_formats.add(kind)
+        elif kind == 'phone':
+            features.has_phone = True
+            # A phone-shaped run such as "2018 - 2020" still carries years
+            if not features.has_year and _YEAR.search(match.group()):
+                features.has_year = True
+        elif kind == 'email':
+            features.has_email = True
+        elif kind == 'linkedin':
+            features.has_linkedin = True
+        elif kind == 'table':
+            features.has_table_chars = True
+
+    features.bullet_counts = dict(bullets)
+
+    first_break = text.find('\n')
+    if first_break != -1:
+        features.first_line_repeated = text[:first_break] == text[text.rfind('\n') + 1:]
+
+    return features
@@ -0,0 +1,140 @@
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .skill_matcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class FuzzyMatch(NamedTuple):
+    """Result of a fuzzy vocabulary lookup."""
+    skill: str
+    term: str
+    distance: int
+
+
+def max_edits_for(term: str) -> int:
+    """Number of typos tolerated for a term; short terms must match exactly."""
+    if len(term) <= 5:
+        return 0
+    if len(term) <= 8:
+        return 1
+    return 2
+
+
+def _deletes(term: str, max_distance: int) -> Set[str]:
+    """All variants of a term with up to max_distance characters deleted."""
+    variants = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for variant in frontier:
+            for index in range(len(variant)):
+                next_frontier.add(variant[:index] + variant[index + 1:])
+        variants.update(next_frontier)
+        frontier = next_frontier
+    return variants
+
+
+def bounded_edit_distance(source: str, target: str, limit: int) -> Optional[int]:
+    """
+    Optimal string alignment distance between two strings
+
+    Args:
+        source: First string
+        target: Second string
+        limit: Largest distance of interest
+
+    Returns:
+        The distance, or None if it exceeds the limit
+    """
+    if abs(len(source) - len(target)) > limit:
+        return None
+
+    previous_previous: List[int] = []
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        row_min = current[0]
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and source[i - 1] == target[j - 2] and source[i - 2] == target[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+            row_min = min(row_min, current[j])
+        if row_min > limit:
+            return None
+        previous_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= limit else None
+
+
+class FuzzySkillMatcher:
+    """
+    Typo-tolerant skill lookup using a symmetric-delete index.
+
+    Every vocabulary term is stored under all of its deletion variants when
+    the index is built. A lookup generates the (few) deletion variants of the
+    query and verifies only the candidates that share a variant, so the cost
+    does not depend on the vocabulary size.
+    """
+
+    def __init__(self, terms: Dict[str, str], max_distance: int = 2):
+        """
+        Args:
+            terms: Mapping of vocabulary term or alias to its canonical skill
+            max_distance: Largest edit distance ever tolerated
+        """
+        self.max_distance = max_distance
+        self._terms: Dict[str, str] = {}
+        self._index: Dict[str, List[str]] = {}
+
+        for term, skill in terms.items():
+            term = SkillMatcher.normalize(term)
+            self._terms[term] = SkillMatcher.normalize(skill)
+            for variant in _deletes(term, min(max_edits_for(term), max_distance)):
+                self._index.setdefault(variant, []).append(term)
+
+        logger.debug(f"Built fuzzy skill index with {len(self._terms)} terms and {len(self._index)} variants")
+
+    def lookup(self, query: str) -> Optional[FuzzyMatch]:
+        """
+        Find the closest vocabulary term within the tolerated edit distance
+
+        Args:
+            query: Token or phrase to look up
+
+        Returns:
+            The best match (distance 0 for exact term or alias hits), or None
+        """
+        query = SkillMatcher.normalize(query)
+        if not query:
+            return None
+        if query in self._terms:
+            return FuzzyMatch(self._terms[query], query, 0)
+
+        limit = min(max(max_edits_for(query), 1), self.max_distance)
+        best: Optional[Tuple[int, str]] = None
+        checked = set()
+        for variant in _deletes(query, limit):
+            for term in self._index.get(variant, ()):
+                if term in checked:
+                    continue
+                checked.add(term)
+                allowed = min(limit, max_edits_for(term))
+                distance = bounded_edit_distance(query, term, allowed) if allowed else None
+                if distance is not None and (best is None or (distance, term) < best):
+                    best = (distance, term)
+
+        if best is None:
+            return None
+        return FuzzyMatch(self._terms[best[1]], best[1], best[0])
+
+    def match_terms(self, queries: Iterable[str]) -> Dict[str, FuzzyMatch]:
+        """Look up many queries, returning only those that matched."""
+        matches = {}
+        for query in queries:
+            match = self.lookup(query)
+            if match is not None:
+                matches[query] = match
+        return matches
@@ -0,0 +1,280 @@
+"""
+Corpus-level IDF statistics for weighting keyword matches.
+
+The offline job builds a compact on-disk table of document frequencies over
+stored job descriptions and resumes:
+
+    python -m resume_ats_scorer.utils.idf --output idf.bin corpus_dir/ more.jsonl
+    python -m resume_ats_scorer.utils.idf --output idf.bin --update new_docs/
+
+The table is an open-addressing hash table of (term hash, document frequency)
+slots behind a fixed header, so it can be memory-mapped read-only by every
+worker process (sharing the page cache) and queried in O(1) per token.
+"""
+import os
+import re
+import sys
+import json
+import math
+import mmap
+import time
+import struct
+import hashlib
+import logging
+import argparse
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from ..core.config import settings
+from .skill_matcher import SkillMatcher
+from .skill_taxonomy import get_skill_matcher
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"ATSIDF1\0"
+FORMAT_VERSION = 1
+# magic, format version, slot count, document count, term count, average document length
+HEADER = struct.Struct("<8sIIQQd")
+# term hash, document frequency
+SLOT = struct.Struct("<QI")
+MAX_LOAD_FACTOR = 0.5
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+
+
+def term_hash(term: str) -> int:
+    """Stable 64-bit hash of a normalized term (never 0, which marks empty slots)."""
+    digest = hashlib.blake2b(SkillMatcher.normalize(term).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') or 1
+
+
+def document_terms(text: str) -> Set[str]:
+    """
+    Extract the distinct terms of a document that are counted in the table
+
+    Args:
+        text: Raw document text
+
+    Returns:
+        Set of normalized single tokens plus canonical taxonomy skills, so
+        multi-word skills such as "machine learning" get their own frequency
+    """
+    terms = set(_TOKEN_PATTERN.findall(text.lower()))
+    terms.update(get_skill_matcher().find_skills(text))
+    return terms
+
+
+class IDFTable:
+    """Read-only, memory-mapped IDF table."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"IDF table {path} is empty")
+
+        magic, version, slot_count, doc_count, term_count, avg_doc_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} IDF table")
+
+        self.slot_count = slot_count
+        self.doc_count = doc_count
+        self.term_count = term_count
+        self.avg_doc_length = avg_doc_length
+        self._mask = slot_count - 1
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        self._mmap.close()
+        self._file.close()
+
+    def _slots(self) -> Iterator[tuple]:
+        for index in range(self.slot_count):
+            key, df = SLOT.unpack_from(self._mmap, HEADER.size + index * SLOT.size)
+            if key:
+                yield key, df
+
+    def document_frequency(self, term: str) -> int:
+        """Return the number of documents containing the term."""
+        key = term_hash(term)
+        index = key & self._mask
+        while True:
+            slot_key, df = SLOT.unpack_from(self._mmap, HEADER.size + index * SLOT.size)
+            if slot_key == key:
+                return df
+            if slot_key == 0:
+                return 0
+            index = (index + 1) & self._mask
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency of a term (unseen terms get the maximum)."""
+        df = self.document_frequency(term)
+        return math.log(1.0 + (self.doc_count - df + 0.5) / (df + 0.5))
+
+
+class IDFTableBuilder:
+    """Accumulates document frequencies and writes them as an IDF table."""
+
+    def __init__(self):
+        self.frequencies: Dict[int, int] = {}
+        self.doc_count = 0
+        self.total_length = 0
+
+    @classmethod
+    def from_table(cls, path: str) -> "IDFTableBuilder":
+        """Start from an existing table so new documents can be added incrementally."""
+        builder = cls()
+        table = IDFTable(path)
+        try:
+            builder.frequencies = dict(table._slots())
+            builder.doc_count = table.doc_count
+            builder.total_length = int(round(table.avg_doc_length * table.doc_count))
+        finally:
+            table.close()
+        return builder
+
+    def add_document(self, text: str) -> None:
+        """Count the distinct terms of one document."""
+        terms = document_terms(text)
+        for term in terms:
+            key = term_hash(term)
+            self.frequencies[key] = self.frequencies.get(key, 0) + 1
+        self.doc_count += 1
+        self.total_length += len(text.split())
+
+    def write(self, path: str) -> None:
+        """Write the table atomically so readers never see a partial file."""
+        slot_count = 1
+        while slot_count * MAX_LOAD_FACTOR < max(len(self.frequencies), 1):
+            slot_count *= 2
+        mask = slot_count - 1
+
+        slots = bytearray(slot_count * SLOT.size)
+        for key, df in self.frequencies.items():
+            index = key & mask
+            while SLOT.unpack_from(slots, index * SLOT.size)[0]:
+                index = (index + 1) & mask
+            SLOT.pack_into(slots, index * SLOT.size, key, df)
+
+        avg_doc_length = self.total_length / self.doc_count if self.doc_count else 0.0
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, slot_count, self.doc_count, len(self.frequencies), avg_doc_length)
+
+        temp_path = f"{path}.tmp{os.getpid()}"
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            f.write(slots)
+        os.replace(temp_path, path)
+        logger.info(f"Wrote IDF table {path}: {self.doc_count} documents, {len(self.frequencies)} terms")
+
+
+_active_table: Optional[IDFTable] = None
+_active_mtime: Optional[float] = None
+_last_checked = 0.0
+_table_lock = threading.Lock()
+
+
+def get_idf_table() -> Optional[IDFTable]:
+    """
+    Return the configured IDF table, or None when IDF weighting is disabled.
+
+    The table is re-opened when the file on disk is replaced (for example by
+    an incremental update), checked at most once per IDF_TABLE_RELOAD_INTERVAL.
+    """
+    global _active_table, _active_mtime, _last_checked
+    path = settings.IDF_TABLE_PATH
+    if not path:
+        return None
+
+    now = time.monotonic()
+    if _active_table is not None and now - _last_checked < settings.IDF_TABLE_RELOAD_INTERVAL:
+        return _active_table
+
+    with _table_lock:
+        _last_checked = now
+        try:
+            mtime = os.path.getmtime(path)
+            if _active_table is None or mtime != _active_mtime or _active_table.path != path:
+                # The previous map stays valid for readers still holding it; it
+                # is released when garbage collected
+                _active_table = IDFTable(path)
+                _active_mtime = mtime
+                logger.info(f"Loaded IDF table {path} with {_active_table.doc_count} documents")
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load IDF table {path}: {str(e)}")
+        return _active_table
+
+
+def weighted_match_ratio(matched: Iterable[str], expected: Iterable[str]) -> float:
+    """
+    Fraction of expected keywords that were matched, weighted by IDF
+
+    Args:
+        matched: Keywords found in the resume
+        expected: Keywords required by the job description
+
+    Returns:
+        Ratio between 0 and 1; every keyword weighs 1.0 when no IDF table is
+        configured, which reduces to the plain match percentage
+    """
+    table = get_idf_table()
+    expected = set(expected)
+    if not expected:
+        return 0.0
+    if table is None:
+        return len(expected.intersection(matched)) / len(expected)
+
+    weights = {term: table.idf(term) for term in expected}
+    total = sum(weights.values())
+    if total <= 0:
+        return 0.0
+    return sum(weights[term] for term in expected.intersection(matched)) / total
+
+
+def _iter_documents(paths: List[str]) -> Iterator[str]:
+    """Yield document texts from .txt files, .jsonl files and directories of them."""
+    for raw_path in paths:
+        path = Path(raw_path)
+        files = sorted(p for p in path.rglob('*') if p.is_file()) if path.is_dir() else [path]
+        for file_path in files:
+            if file_path.suffix == '.txt':
+                yield file_path.read_text(encoding='utf-8', errors='ignore')
+            elif file_path.suffix == '.jsonl':
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            text = record.get("text") or record.get("raw_text") or record.get("description")
+                            if text:
+                                yield text
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build or incrementally update an IDF table from stored documents."""
+    parser = argparse.ArgumentParser(description="Build the IDF table used to weight keyword matches")
+    parser.add_argument("inputs", nargs="+", help=".txt/.jsonl files or directories of resumes and job descriptions")
+    parser.add_argument("--output", required=True, help="Path of the IDF table to write")
+    parser.add_argument("--update", action="store_true", help="Add documents to the existing table instead of rebuilding")
+    args = parser.parse_args(argv)
+
+    if args.update and os.path.exists(args.output):
+        builder = IDFTableBuilder.from_table(args.output)
+    else:
+        builder = IDFTableBuilder()
+
+    added = 0
+    for text in _iter_documents(args.inputs):
+        builder.add_document(text)
+        added += 1
+
+    builder.write(args.output)
+    logger.info(f"Added {added} documents to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
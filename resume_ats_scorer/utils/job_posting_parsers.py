@@ -0,0 +1,182 @@
+"""
+Structure-aware parsers for LinkedIn and Naukri job postings.
+
+Both platforms render postings from fixed templates: LinkedIn postings carry
+"Qualifications" / "Requirements" / "Skills" blocks, Naukri postings end
+with "Role", "Industry Type", "Role Category", "Education" and "Key Skills"
+fields. When those blocks are found, requirements are read from them
+directly: skills are scanned only inside the skill and qualification blocks,
+and education / experience come from the few lines that can hold them,
+instead of running every generic pattern over the whole posting. When the
+template is not recognized the parsers return None and the caller falls
+back to the generic extractor.
+"""
+import re
+import logging
+from typing import Callable, Dict, List, Optional
+
+from ..core.metrics import metrics
+from ..models.schemas import JobSource
+from .section_segmenter import SectionSegmenter
+from .skill_taxonomy import get_skill_matcher
+
+logger = logging.getLogger(__name__)
+
+LINKEDIN_HEADERS = {
+    'qualifications': [
+        'qualifications', 'basic qualifications', 'minimum qualifications', 'required qualifications',
+        'preferred qualifications', 'requirements', 'job requirements', 'what you bring',
+        "what you'll need", 'what we are looking for', "what we're looking for", 'who you are'
+    ],
+    'skills': ['skills', 'required skills', 'key skills', 'technical skills', 'must have', 'nice to have'],
+    'responsibilities': [
+        'responsibilities', 'key responsibilities', "what you'll do", 'what you will do', 'the role', 'about the role'
+    ],
+    'other': [
+        'about the job', 'about us', 'about the company', 'benefits', 'perks', 'why join us',
+        'seniority level', 'employment type', 'job function', 'industries'
+    ]
+}
+
+NAUKRI_HEADERS = {
+    'job_description': ['job description', 'roles and responsibilities', 'responsibilities'],
+    'experience': ['experience', 'desired experience', 'work experience'],
+    'role': ['role', 'role category', 'industry type', 'department', 'functional area', 'employment type'],
+    'education': ['education', 'educational qualification', 'ug', 'pg', 'doctorate'],
+    'key_skills': ['key skills', 'skills', 'desired skills', 'desired candidate profile'],
+    'other': ['about company', 'company profile', 'perks and benefits']
+}
+
+# Blocks whose presence identifies each template
+_LINKEDIN_REQUIRED = ('qualifications',)
+_NAUKRI_REQUIRED = ('key_skills', 'role')
+
+_EDUCATION = re.compile(
+    r"\b(?:bachelor'?s?|master'?s?|ph\.?d|doctorate|degree|diploma|b\.?\s?tech|m\.?\s?tech|b\.?e|m\.?e|"
+    r"b\.?sc?|m\.?sc?|mba|mca|bca|graduate|post\s?graduate)\b",
+    re.IGNORECASE
+)
+_EXPERIENCE = re.compile(
+    r"(?:minimum\s+of\s+|at\s+least\s+)?\d+\s*(?:\+|-\s*\d+|to\s+\d+)?\s*(?:years?|yrs?)\b[^.;\n]*",
+    re.IGNORECASE
+)
+
+_PREAMBLE = 'preamble'
+
+_linkedin_segmenter = SectionSegmenter(LINKEDIN_HEADERS)
+_naukri_segmenter = SectionSegmenter(NAUKRI_HEADERS)
+
+
+def _blocks(segmenter: SectionSegmenter, text: str) -> Dict[str, List[str]]:
+    """Text of every section, grouped by section name (a name may occur several times)."""
+    spans = segmenter.segment(text)
+    blocks: Dict[str, List[str]] = {}
+    if spans and spans[0].header_start > 0:
+        # Title, company and (on Naukri) the experience range come before the first header
+        blocks[_PREAMBLE] = [text[:spans[0].header_start]]
+    for span in spans:
+        blocks.setdefault(span.name, []).append(text[span.start:span.end])
+    return blocks
+
+
+def _lines(blocks: Dict[str, List[str]], *names: str) -> List[str]:
+    """Non-empty lines of the named blocks, with bullet markers stripped."""
+    lines = []
+    for name in names:
+        for block in blocks.get(name, ()):
+            for line in block.split('\n'):
+                line = line.strip().lstrip('-•*▪◦ ').strip()
+                if line:
+                    lines.append(line)
+    return lines
+
+
+def _unique(values: List[str]) -> List[str]:
+    seen = set()
+    return [value for value in values if not (value.lower() in seen or seen.add(value.lower()))]
+
+
+def _requirements(skills_text: str, education: List[str], experience: List[str]) -> Dict[str, List[str]]:
+    return {
+        'skills': get_skill_matcher("hard").find_skills(skills_text),
+        'education': _unique(education),
+        'experience': _unique(experience)
+    }
+
+
+def parse_linkedin_posting(job_text: str) -> Optional[Dict[str, List[str]]]:
+    """
+    Parse a LinkedIn posting from its qualification and skill blocks
+
+    Args:
+        job_text: Posting text
+
+    Returns:
+        Requirements in the generic extractor's format, or None when the
+        posting has no qualifications block
+    """
+    blocks = _blocks(_linkedin_segmenter, job_text)
+    if not all(name in blocks for name in _LINKEDIN_REQUIRED):
+        return None
+
+    lines = _lines(blocks, 'qualifications', 'skills')
+    education = [line for line in lines if _EDUCATION.search(line)]
+    experience = [match.group().strip() for line in lines for match in _EXPERIENCE.finditer(line)]
+    return _requirements('\n'.join(lines), education, experience)
+
+
+def parse_naukri_posting(job_text: str) -> Optional[Dict[str, List[str]]]:
+    """
+    Parse a Naukri posting from its Key Skills, Education and Experience fields
+
+    Args:
+        job_text: Posting text
+
+    Returns:
+        Requirements in the generic extractor's format, or None when the
+        posting lacks the Key Skills and Role fields
+    """
+    blocks = _blocks(_naukri_segmenter, job_text)
+    if not all(name in blocks for name in _NAUKRI_REQUIRED):
+        return None
+
+    # Key Skills is a tag list, one or several skills per line
+    skills_text = '\n'.join(_lines(blocks, 'key_skills'))
+    education = [line for line in _lines(blocks, 'education') if _EDUCATION.search(line)]
+    experience = [
+        match.group().strip()
+        for line in _lines(blocks, _PREAMBLE, 'experience', 'job_description')
+        for match in _EXPERIENCE.finditer(line)
+    ]
+    return _requirements(skills_text, education, experience)
+
+
+STRUCTURED_PARSERS: Dict[JobSource, Callable[[str], Optional[Dict[str, List[str]]]]] = {
+    JobSource.LINKEDIN: parse_linkedin_posting,
+    JobSource.NAUKRI: parse_naukri_posting,
+}
+
+
+def parse_structured_posting(job_text: str, source: JobSource) -> Optional[Dict[str, List[str]]]:
+    """
+    Parse a posting with its platform's template, if there is one
+
+    Args:
+        job_text: Posting text
+        source: Platform the posting came from
+
+    Returns:
+        Requirements, or None when the platform has no structured parser or
+        the posting does not follow its template
+    """
+    source = JobSource(source)
+    parser = STRUCTURED_PARSERS.get(source)
+    if parser is None:
+        return None
+    requirements = parser(job_text)
+    if requirements is None:
+        metrics.increment(f"job_parser_fallback_{source.value}")
+        logger.debug(f"{source.value} posting structure not recognized, using the generic parser")
+    else:
+        metrics.increment(f"job_parser_structured_{source.value}")
+    return requirements
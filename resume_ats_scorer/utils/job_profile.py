@@ -0,0 +1,170 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from ..core.config import settings
+from ..models.schemas import ParsedJobDescription
+
+logger = logging.getLogger(__name__)
+
+# Terms that mark a requirement as an education requirement
+EDUCATION_TERMS = ("degree", "education", "university", "college", "bachelor", "master", "phd")
+
+# Word tokens; "node.js", "c++", "ci/cd" and "c#" stay single tokens
+_PHRASE_TOKEN = re.compile(r"[^\W_][\w+#]*(?:[./-][^\W_][\w+#]*)*")
+
+# Longest requirement phrase (in tokens) a single resume keyword can satisfy
+MAX_PHRASE_WORDS = 4
+
+
+def phrase_tokens(text: str) -> List[str]:
+    """Lowercased word tokens of a keyword or requirement."""
+    return _PHRASE_TOKEN.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class CompiledRequirement:
+    """A job requirement with the derived forms used during matching."""
+    description: str
+    lowered: str
+    category: str
+    match_tokens: Tuple[str, ...]
+    tokens: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class JobProfile:
+    """
+    Everything the matcher needs from a job description, derived once.
+
+    Scoring many resumes against the same job description only touches the
+    resume side; the job side (keyword sets, lowered requirement text and
+    token sets, category buckets, education filter) is computed here.
+    """
+    key: str
+    keywords: Tuple[str, ...]
+    lowered_keywords: Tuple[str, ...]
+    keyword_set: FrozenSet[str]
+    requirements: Tuple[CompiledRequirement, ...]
+    by_category: Dict[str, Tuple[CompiledRequirement, ...]]
+    education_requirements: Tuple[CompiledRequirement, ...]
+    # Space-joined token n-gram -> indexes of the requirements containing it
+    phrase_index: Dict[str, Tuple[int, ...]]
+
+    def requirements_in(self, category: str) -> Tuple[CompiledRequirement, ...]:
+        """Requirements of one (lowercase) category, in job description order."""
+        return self.by_category.get(category, ())
+
+    def match_requirements(self, keywords: Iterable[str]) -> List[Optional[str]]:
+        """
+        Find, for each requirement, a resume keyword whose tokens appear in it as a phrase
+
+        Args:
+            keywords: Resume keywords, in order of preference
+
+        Returns:
+            The first satisfying keyword per requirement (None if unmatched), aligned with requirements
+        """
+        matches: List[Optional[str]] = [None] * len(self.requirements)
+        remaining = len(self.requirements)
+        for keyword in keywords:
+            if not remaining:
+                break
+            tokens = phrase_tokens(keyword)
+            if not tokens or len(tokens) > MAX_PHRASE_WORDS:
+                continue
+            for index in self.phrase_index.get(" ".join(tokens), ()):
+                if matches[index] is None:
+                    matches[index] = keyword
+                    remaining -= 1
+        return matches
+
+
+def job_profile_key(job_description: ParsedJobDescription) -> str:
+    """Content hash of the parts of a job description that affect matching."""
+    payload = json.dumps([
+        job_description.description,
+        [[req.category, req.description] for req in job_description.requirements],
+        job_description.keywords,
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compile_job_profile(job_description: ParsedJobDescription, key: Optional[str] = None) -> JobProfile:
+    """
+    Derive the matching structures for a job description
+
+    Args:
+        job_description: Parsed job description
+        key: Precomputed content hash, if available
+
+    Returns:
+        Compiled job profile
+    """
+    requirements = []
+    phrase_index: Dict[str, List[int]] = {}
+    for index, req in enumerate(job_description.requirements):
+        lowered = req.description.lower()
+        tokens = tuple(phrase_tokens(lowered))
+        requirements.append(CompiledRequirement(
+            description=req.description,
+            lowered=lowered,
+            category=req.category.lower(),
+            match_tokens=tuple(token for token in lowered.split() if len(token) > 3),
+            tokens=tokens
+        ))
+
+        phrases = {
+            " ".join(tokens[start:start + length])
+            for start in range(len(tokens))
+            for length in range(1, min(MAX_PHRASE_WORDS, len(tokens) - start) + 1)
+        }
+        for phrase in phrases:
+            phrase_index.setdefault(phrase, []).append(index)
+
+    by_category: Dict[str, List[CompiledRequirement]] = {}
+    for req in requirements:
+        by_category.setdefault(req.category, []).append(req)
+
+    keywords = tuple(job_description.keywords)
+    return JobProfile(
+        key=key or job_profile_key(job_description),
+        keywords=keywords,
+        lowered_keywords=tuple(keyword.lower() for keyword in keywords),
+        keyword_set=frozenset(keywords),
+        requirements=tuple(requirements),
+        by_category={category: tuple(reqs) for category, reqs in by_category.items()},
+        education_requirements=tuple(
+            req for req in requirements if any(term in req.lowered for term in EDUCATION_TERMS)
+        ),
+        phrase_index={phrase: tuple(indexes) for phrase, indexes in phrase_index.items()}
+    )
+
+
+_profiles: "OrderedDict[str, JobProfile]" = OrderedDict()
+_profiles_lock = threading.Lock()
+
+
+def get_job_profile(job_description: ParsedJobDescription) -> JobProfile:
+    """Return the compiled profile for a job description, reusing a cached one when possible."""
+    key = job_profile_key(job_description)
+    with _profiles_lock:
+        profile = _profiles.get(key)
+        if profile is not None:
+            _profiles.move_to_end(key)
+            return profile
+
+    profile = compile_job_profile(job_description, key)
+    with _profiles_lock:
+        _profiles[key] = profile
+        _profiles.move_to_end(key)
+        while len(_profiles) > settings.JOB_PROFILE_CACHE_SIZE:
+            _profiles.popitem(last=False)
+
+    logger.debug(f"Compiled job profile {key[:12]} with {len(profile.requirements)} requirements")
+    return profile
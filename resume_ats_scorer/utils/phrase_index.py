@@ -0,0 +1,69 @@
+import re
+from functools import lru_cache
+from typing import Iterable, List, Pattern, Set
+
+_WORD_RUN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=4096)
+def _boundary_pattern(phrase: str) -> Pattern:
+    return re.compile(rf'\b{re.escape(phrase)}\b', re.IGNORECASE)
+
+
+def _is_word_char(char: str) -> bool:
+    # Same definition as \w for str patterns
+    return char.isalnum() or char == '_'
+
+
+def _indexable(phrase: str) -> bool:
+    """Phrases that begin and end with a word character can be answered from the index."""
+    return bool(phrase) and _is_word_char(phrase[0]) and _is_word_char(phrase[-1])
+
+
+def word_count(phrase: str) -> int:
+    """Number of word-character runs in a phrase."""
+    return sum(1 for _ in _WORD_RUN.finditer(phrase))
+
+
+class PhraseIndex:
+    """
+    Whole-word phrase lookups over a fixed list of texts.
+
+    Answers the same question as ``re.search(rf'\\b{re.escape(phrase)}\\b', text,
+    re.IGNORECASE)`` for any of the texts, but with a set lookup: every span of
+    a text that runs from the start of a word to the end of a word (spanning at
+    most ``max_words`` words) is stored lowercased when the index is built.
+    Phrases that begin or end with a non-word character ("c++", ".net") have
+    different boundary rules and fall back to a cached regex.
+    """
+
+    def __init__(self, texts: Iterable[str], max_words: int):
+        """
+        Args:
+            texts: Texts to search, e.g. the skills listed on a resume
+            max_words: Longest phrase (in words) that will be looked up
+        """
+        self._texts: List[str] = list(texts)
+        self.max_words = max_words
+        self._phrases: Set[str] = set()
+
+        for text in self._texts:
+            lowered = text.lower()
+            runs = [(match.start(), match.end()) for match in _WORD_RUN.finditer(lowered)]
+            for first, (start, _) in enumerate(runs):
+                for _, end in runs[first:first + max_words]:
+                    self._phrases.add(lowered[start:end])
+
+    @classmethod
+    def for_phrases(cls, texts: Iterable[str], phrases: Iterable[str]) -> "PhraseIndex":
+        """Build an index sized for the phrases that will be looked up."""
+        max_words = max((word_count(phrase) for phrase in phrases if _indexable(phrase)), default=0)
+        return cls(texts, max_words)
+
+    def contains(self, phrase: str) -> bool:
+        """Whether the phrase occurs as a whole word/phrase in any text."""
+        lowered = phrase.lower()
+        if _indexable(lowered) and word_count(lowered) <= self.max_words:
+            return lowered in self._phrases
+        pattern = _boundary_pattern(phrase)
+        return any(pattern.search(text) for text in self._texts)
@@ -0,0 +1,172 @@
+"""
+Compact, token-budgeted summaries of resumes and job descriptions for agent prompts.
+
+In agentic mode the CrewAI tasks are given these summaries instead of the
+raw documents, so prompt size no longer grows with document length. A
+resume summary lists its sections and keywords, then excerpts of each
+section (the spans found by ResumeParser._identify_sections), with the
+budget shared between sections. A job summary lists the title, the required
+and preferred requirements and the keywords. Summaries are cached by a hash
+of the content they are built from and the budget.
+
+Token counts are estimated at four characters per token, which is close
+enough for budgeting English text without loading a tokenizer.
+"""
+import math
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..models.schemas import ParsedJobDescription, ParsedResume
+from .response_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+_ELLIPSIS = " …"
+# Keywords listed in a summary before the section excerpts
+MAX_SUMMARY_KEYWORDS = 40
+# Sections are left out once their share of the budget drops below this
+MIN_SECTION_TOKENS = 20
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, tokens: int) -> str:
+    """Cut text to about `tokens` tokens, at a line or word boundary where possible."""
+    limit = tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text[:max(0, limit - len(_ELLIPSIS))]
+    boundary = max(cut.rfind("\n"), cut.rfind(" "))
+    if boundary > limit // 2:
+        cut = cut[:boundary]
+    return cut.rstrip() + _ELLIPSIS
+
+
+def _join_limited(label: str, values: List[str], tokens: int) -> Optional[str]:
+    if not values:
+        return None
+    return truncate_to_tokens(f"{label}: {', '.join(values)}", tokens)
+
+
+def build_resume_summary(resume: ParsedResume, token_budget: int) -> str:
+    """
+    Build the structured summary of a parsed resume
+
+    Args:
+        resume: Parsed resume with sections and keywords
+        token_budget: Approximate maximum size of the summary in tokens
+
+    Returns:
+        Summary text
+    """
+    sections = [(section.value, content.strip()) for section, content in resume.sections.items() if content.strip()]
+    lines = []
+    if sections:
+        lines.append(f"Sections: {', '.join(name for name, _ in sections)}")
+    keywords = _join_limited("Keywords", resume.keywords[:MAX_SUMMARY_KEYWORDS], token_budget // 4)
+    if keywords:
+        lines.append(keywords)
+
+    remaining = token_budget - estimate_tokens("\n".join(lines))
+    if not sections:
+        # Nothing was segmented; fall back to the start of the document
+        sections = [("text", resume.raw_text.strip())]
+
+    # Split what is left between the sections, giving unused share of short sections to the rest
+    pending = sorted(sections, key=lambda item: len(item[1]))
+    excerpts = {}
+    for index, (name, content) in enumerate(pending):
+        label = f"[{name}]\n"
+        # The excerpt's share, less its label and the joining newline
+        share = remaining // (len(pending) - index) - estimate_tokens(label) - 1
+        if share < MIN_SECTION_TOKENS:
+            break
+        excerpts[name] = label + truncate_to_tokens(content, share)
+        remaining -= estimate_tokens(excerpts[name]) + 1
+    lines.extend(excerpts[name] for name, _ in sections if name in excerpts)
+    return "\n".join(lines)
+
+
+def build_job_summary(job_description: ParsedJobDescription, token_budget: int) -> str:
+    """
+    Build the structured summary of a parsed job description
+
+    Args:
+        job_description: Parsed job description with requirements and keywords
+        token_budget: Approximate maximum size of the summary in tokens
+
+    Returns:
+        Summary text
+    """
+    required = [req.description for req in job_description.requirements if req.required]
+    preferred = [req.description for req in job_description.requirements if not req.required]
+    lines = [f"Title: {job_description.title}", f"Company: {job_description.company}"]
+    remaining = token_budget - estimate_tokens("\n".join(lines))
+
+    # Required requirements matter most and get half of the budget; keywords come last
+    for label, values, share in (
+        ("Required", required, remaining // 2),
+        ("Preferred", preferred, remaining // 4),
+        ("Keywords", job_description.keywords[:MAX_SUMMARY_KEYWORDS], remaining // 4),
+    ):
+        line = _join_limited(label, values, share)
+        if line:
+            lines.append(line)
+
+    if not required and not preferred:
+        # No requirements were extracted; excerpt the posting instead
+        remaining = token_budget - estimate_tokens("\n".join(lines))
+        if remaining > 0:
+            lines.append(truncate_to_tokens(job_description.description.strip(), remaining))
+    return "\n".join(lines)
+
+
+_summaries: "OrderedDict[str, str]" = OrderedDict()
+_summaries_lock = threading.Lock()
+
+
+def _cached_summary(kind: str, raw_text: str, key: str, build) -> str:
+    with _summaries_lock:
+        summary = _summaries.get(key)
+        if summary is not None:
+            _summaries.move_to_end(key)
+    if summary is not None:
+        metrics.increment("prompt_summary_cache_hits")
+    else:
+        metrics.increment("prompt_summary_cache_misses")
+        summary = build()
+        with _summaries_lock:
+            _summaries[key] = summary
+            while len(_summaries) > settings.PROMPT_SUMMARY_CACHE_SIZE:
+                _summaries.popitem(last=False)
+
+    raw_tokens = estimate_tokens(raw_text)
+    summary_tokens = estimate_tokens(summary)
+    metrics.increment(f"prompt_tokens_raw_{kind}", raw_tokens)
+    metrics.increment(f"prompt_tokens_summarized_{kind}", summary_tokens)
+    metrics.increment("prompt_tokens_saved", max(0, raw_tokens - summary_tokens))
+    return summary
+
+
+def summarize_resume(resume: ParsedResume, token_budget: Optional[int] = None) -> str:
+    """Cached resume summary (budget defaults to RESUME_SUMMARY_TOKEN_BUDGET)."""
+    budget = token_budget or settings.RESUME_SUMMARY_TOKEN_BUDGET
+    key = content_hash("resume_summary", budget, resume.raw_text, resume.keywords)
+    return _cached_summary("resume", resume.raw_text, key, lambda: build_resume_summary(resume, budget))
+
+
+def summarize_job(job_description: ParsedJobDescription, token_budget: Optional[int] = None) -> str:
+    """Cached job description summary (budget defaults to JOB_SUMMARY_TOKEN_BUDGET)."""
+    budget = token_budget or settings.JOB_SUMMARY_TOKEN_BUDGET
+    key = content_hash("job_summary", budget, job_description)
+    return _cached_summary(
+        "job", job_description.description, key, lambda: build_job_summary(job_description, budget)
+    )
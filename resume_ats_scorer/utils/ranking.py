@@ -0,0 +1,275 @@
+import heapq
+import logging
+import math
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from ..core.metrics import metrics
+from .job_profile import phrase_tokens
+from .skill_matcher import SkillMatcher
+from .skill_taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of required vs preferred skills, as in calculate_content_match_score (0.6 vs 0.2)
+REQUIRED_TERM_WEIGHT = 3.0
+PREFERRED_TERM_WEIGHT = 1.0
+
+_EXHAUSTED = math.inf
+
+
+def normalize_skill(skill: str) -> str:
+    """Canonical form of a skill: the taxonomy id for known skills and aliases, else the normalized text."""
+    normalized = SkillMatcher.normalize(skill)
+    return get_taxonomy().canonicalize(normalized) or normalized
+
+
+def skill_terms(skills: Iterable[str]) -> Set[str]:
+    """Index terms for a resume's skills: each normalized skill plus the words of multi-word skills."""
+    terms = set()
+    for skill in skills:
+        normalized = normalize_skill(skill)
+        if not normalized:
+            continue
+        terms.add(normalized)
+        tokens = phrase_tokens(normalized)
+        if len(tokens) > 1:
+            terms.update(tokens)
+    return terms
+
+
+class ScoredCandidate(NamedTuple):
+    """A candidate with its prefilter (upper-bound scored) relevance."""
+    candidate_id: str
+    score: float
+    payload: Any
+
+
+class _Cursor:
+    """
+    Position in one term's postings list during a WAND traversal.
+
+    wand_top_k works with any cursor offering weight, doc (the current
+    document id, or infinity once exhausted), next() and seek(target).
+    """
+
+    __slots__ = ("postings", "weight", "position")
+
+    def __init__(self, postings: List[int], weight: float):
+        self.postings = postings
+        self.weight = weight
+        self.position = 0
+
+    @property
+    def doc(self) -> float:
+        if self.position < len(self.postings):
+            return self.postings[self.position]
+        return _EXHAUSTED
+
+    def next(self) -> None:
+        """Move to the following posting."""
+        self.position += 1
+
+    def seek(self, target: int) -> int:
+        """Move to the first posting >= target; returns the number of postings skipped."""
+        start = self.position
+        self.position = bisect_left(self.postings, target, start)
+        return self.position - start
+
+
+def wand_top_k(cursors: Iterable[Any], k: int, is_live: Callable[[int], bool]) -> List[Tuple[float, int]]:
+    """
+    WAND top-k traversal over sorted postings lists
+
+    A query term's upper bound is its weight (postings are binary), which
+    lets the traversal skip every document that cannot beat the current
+    k-th best score without looking at it.
+
+    Args:
+        cursors: One cursor (see _Cursor) per query term, positioned on its first posting
+        k: Number of documents to return
+        is_live: Whether a document id still belongs to the index
+
+    Returns:
+        (score, document id) pairs ordered by descending score
+    """
+    cursors = list(cursors)
+    heap: List[tuple] = []
+    threshold = 0.0
+    evaluated = 0
+    skipped = 0
+
+    while True:
+        cursors.sort(key=lambda cursor: cursor.doc)
+
+        # Pivot: first cursor at which the accumulated upper bounds can beat the threshold
+        upper_bound = 0.0
+        pivot = None
+        for index, cursor in enumerate(cursors):
+            if cursor.doc == _EXHAUSTED:
+                break
+            upper_bound += cursor.weight
+            if upper_bound > threshold:
+                pivot = index
+                break
+        if pivot is None:
+            break
+
+        pivot_doc = cursors[pivot].doc
+        if cursors[0].doc == pivot_doc:
+            # Every cursor up to the pivot is on the pivot document: score it fully
+            score = 0.0
+            for cursor in cursors:
+                if cursor.doc != pivot_doc:
+                    break
+                score += cursor.weight
+                cursor.next()
+            evaluated += 1
+            if is_live(pivot_doc):
+                entry = (score, -pivot_doc)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+                if len(heap) == k:
+                    threshold = heap[0][0]
+        else:
+            # Documents before the pivot cannot reach the threshold; skip over them
+            for cursor in cursors[:pivot]:
+                skipped += cursor.seek(pivot_doc)
+
+    metrics.increment("ranking_candidates_evaluated", evaluated)
+    metrics.increment("ranking_postings_skipped", skipped)
+    return [(score, -negative_doc_id) for score, negative_doc_id in sorted(heap, reverse=True)]
+
+
+class CandidateIndex:
+    """
+    In-memory inverted index of candidate skills with WAND top-k retrieval.
+
+    Every candidate gets an increasing document id, so postings lists stay
+    sorted by appending, and queries run a WAND traversal over them.
+    Removed candidates are tombstoned and dropped from the postings when
+    they outnumber live candidates.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, List[int]] = {}
+        self._document_frequency: Dict[str, int] = {}
+        self._doc_ids: Dict[str, int] = {}
+        self._documents: Dict[int, tuple] = {}
+        self._next_doc_id = 0
+        self._tombstones = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, candidate_id: str, skills: Iterable[str], payload: Any = None) -> int:
+        """
+        Index a candidate, replacing any previous version
+
+        Args:
+            candidate_id: Caller's identifier for the candidate
+            skills: Skills listed on the resume
+            payload: Object returned with the candidate in query results
+
+        Returns:
+            Number of distinct index terms
+        """
+        terms = skill_terms(skills)
+        with self._lock:
+            self.remove(candidate_id)
+            doc_id = self._next_doc_id
+            self._next_doc_id += 1
+            for term in terms:
+                self._postings.setdefault(term, []).append(doc_id)
+                self._document_frequency[term] = self._document_frequency.get(term, 0) + 1
+            self._doc_ids[candidate_id] = doc_id
+            self._documents[doc_id] = (candidate_id, frozenset(terms), payload)
+        return len(terms)
+
+    def remove(self, candidate_id: str) -> bool:
+        """Remove a candidate; returns whether it was indexed."""
+        with self._lock:
+            doc_id = self._doc_ids.pop(candidate_id, None)
+            if doc_id is None:
+                return False
+            _, terms, _ = self._documents.pop(doc_id)
+            for term in terms:
+                self._document_frequency[term] -= 1
+            self._tombstones += 1
+            if self._tombstones > len(self._documents):
+                self._compact()
+            return True
+
+    def get(self, candidate_id: str) -> Optional[Any]:
+        """Return the payload stored for a candidate."""
+        with self._lock:
+            doc_id = self._doc_ids.get(candidate_id)
+            return self._documents[doc_id][2] if doc_id is not None else None
+
+    def _compact(self) -> None:
+        for term in list(self._postings):
+            live = [doc_id for doc_id in self._postings[term] if doc_id in self._documents]
+            if live:
+                self._postings[term] = live
+            else:
+                del self._postings[term]
+                self._document_frequency.pop(term, None)
+        self._tombstones = 0
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency of a term over the live candidates."""
+        document_frequency = self._document_frequency.get(term, 0)
+        return math.log(1 + (len(self._documents) - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def query_weights(self, required_skills: Iterable[str], preferred_skills: Iterable[str]) -> Dict[str, float]:
+        """Weight each job skill term by its rarity and by whether it is required or preferred."""
+        weights: Dict[str, float] = {}
+        with self._lock:
+            for skills, importance in ((required_skills, REQUIRED_TERM_WEIGHT), (preferred_skills, PREFERRED_TERM_WEIGHT)):
+                for skill in skills:
+                    term = normalize_skill(skill)
+                    if term in self._postings:
+                        weights[term] = max(weights.get(term, 0.0), importance * self.idf(term))
+        return weights
+
+    def top_k(self, weights: Dict[str, float], k: int) -> List[ScoredCandidate]:
+        """
+        Retrieve the k candidates with the highest total weight of matched terms
+
+        Args:
+            weights: Query term weights (see query_weights)
+            k: Number of candidates to return
+
+        Returns:
+            Candidates ordered by descending score
+        """
+        if k <= 0:
+            return []
+
+        with self._lock:
+            if not weights:
+                # Nothing to rank on; return the first candidates in insertion order
+                return [
+                    ScoredCandidate(candidate_id, 0.0, payload)
+                    for candidate_id, _, payload in list(self._documents.values())[:k]
+                ]
+
+            ranked = wand_top_k(
+                [_Cursor(self._postings[term], weight) for term, weight in weights.items() if term in self._postings],
+                k,
+                self._documents.__contains__
+            )
+
+            results = []
+            for score, doc_id in ranked:
+                candidate_id, _, payload = self._documents[doc_id]
+                results.append(ScoredCandidate(candidate_id, score, payload))
+            return results
+
+
+# Process-wide candidate store used by the ranking API
+candidate_index = CandidateIndex()
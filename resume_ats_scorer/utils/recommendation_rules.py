@@ -0,0 +1,246 @@
+"""
+Declarative recommendation rules.
+
+Each rule names the feature that triggers it ("missing_sections",
+"content_band:low", ...) and renders its recommendation from a
+RecommendationFeatures object. Features come from what scoring already
+produced (section texts, score bands, requirement matches) and are computed
+once per request; the expensive ones (job skills absent from the resume,
+experience wording) only when a triggered rule reads them. Rules are indexed
+by trigger, so a request only looks at the rules its features switch on, in
+priority order, until the requested number of recommendations is filled.
+"""
+import re
+import heapq
+import logging
+from functools import cached_property
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Union
+
+from ..models.schemas import ParsedJobDescription, ParsedResume, ResumeScoreResponse, ResumeSection
+from .format_analyzer import ACTION_VERBS
+
+logger = logging.getLogger(__name__)
+
+ESSENTIAL_SECTIONS = (ResumeSection.SKILLS, ResumeSection.EXPERIENCE, ResumeSection.EDUCATION, ResumeSection.SUMMARY)
+
+# Resume length outside these bounds (characters) triggers a length rule
+MIN_RESUME_LENGTH = 500
+MAX_RESUME_LENGTH = 5000
+# Minimum share of the resume text expected in these sections
+MIN_SECTION_SHARE = {ResumeSection.SKILLS: 0.1, ResumeSection.EXPERIENCE: 0.3}
+# Score bands (0-100) below which the ATS checklists are recommended
+LOW_FORMAT_SCORE = 75
+LOW_CONTENT_SCORE = 70
+
+_WORD = re.compile(r"[a-z]+")
+_DIGIT = re.compile(r"\d")
+
+
+class RecommendationFeatures:
+    """Features of one scored resume that recommendation rules are triggered by and rendered from."""
+
+    def __init__(self, resume: ParsedResume, job_description: ParsedJobDescription, score_result: ResumeScoreResponse):
+        self.resume = resume
+        self.job_description = job_description
+        self.score_result = score_result
+
+    @cached_property
+    def missing_sections(self) -> List[str]:
+        return [
+            section.value.title() for section in ESSENTIAL_SECTIONS
+            if not self.resume.sections.get(section)
+        ]
+
+    @cached_property
+    def section_shares(self) -> Dict[ResumeSection, float]:
+        """Share of the sectioned text in each section; empty with fewer than three sections."""
+        if len(self.resume.sections) < 3:
+            return {}
+        lengths = {section: len(content) for section, content in self.resume.sections.items()}
+        total = sum(lengths.values())
+        return {section: length / total for section, length in lengths.items()} if total else {}
+
+    @cached_property
+    def missing_keywords(self) -> List[str]:
+        """Job requirements the scorer found no match for, in posting order."""
+        matched = self.score_result.requirement_matches
+        return list(dict.fromkeys(
+            requirement.description for requirement in self.job_description.requirements
+            if requirement.description not in matched
+        ))
+
+    @cached_property
+    def missing_skills(self) -> List[str]:
+        """Skill requirements that do not appear in the skills section."""
+        skills_text = self.resume.sections.get(ResumeSection.SKILLS, "").lower()
+        return list(dict.fromkeys(
+            requirement.description for requirement in self.job_description.requirements
+            if "skill" in requirement.category.lower() and requirement.description.lower() not in skills_text
+        ))
+
+    @cached_property
+    def experience_words(self) -> Set[str]:
+        return set(_WORD.findall(self.resume.sections.get(ResumeSection.EXPERIENCE, "").lower()))
+
+    def triggers(self) -> Iterator[str]:
+        """Trigger keys switched on by this resume; cheap features only."""
+        if self.score_result.recommendations:
+            yield "score_recommendations"
+        if self.missing_sections:
+            yield "missing_sections"
+        length = len(self.resume.raw_text)
+        if length < MIN_RESUME_LENGTH:
+            yield "length:short"
+        elif length > MAX_RESUME_LENGTH:
+            yield "length:long"
+        for section, minimum in MIN_SECTION_SHARE.items():
+            if section in self.section_shares and self.section_shares[section] < minimum:
+                yield f"section_share_low:{section.value}"
+        if self.job_description.requirements:
+            yield "job_requirements"
+        if self.resume.sections.get(ResumeSection.EXPERIENCE):
+            yield "has_experience"
+        if self.score_result.format_score < LOW_FORMAT_SCORE:
+            yield "format_band:low"
+        if self.score_result.content_score < LOW_CONTENT_SCORE:
+            yield "content_band:low"
+
+
+Rendered = Union[None, str, List[str]]
+
+
+class RecommendationRule(NamedTuple):
+    """A recommendation and the feature that triggers it; render returns None when it does not apply."""
+    name: str
+    trigger: str
+    priority: int
+    render: Callable[[RecommendationFeatures], Rendered]
+
+
+def _missing_keywords(features: RecommendationFeatures) -> Rendered:
+    if features.missing_keywords:
+        return f"Consider incorporating these keywords in your resume: {', '.join(features.missing_keywords[:5])}"
+    return None
+
+
+def _missing_skills(features: RecommendationFeatures) -> Rendered:
+    if features.missing_skills:
+        return f"Consider highlighting these skills if you have them: {', '.join(features.missing_skills[:3])}"
+    return None
+
+
+def _action_verbs(features: RecommendationFeatures) -> Rendered:
+    if features.experience_words.isdisjoint(ACTION_VERBS):
+        return "Use strong action verbs in your experience section (e.g., Led, Developed, Implemented) to highlight achievements."
+    return None
+
+
+def _quantified(features: RecommendationFeatures) -> Rendered:
+    if not _DIGIT.search(features.resume.sections[ResumeSection.EXPERIENCE]):
+        return "Consider adding quantifiable achievements with numbers and percentages to strengthen your experience section."
+    return None
+
+
+DEFAULT_RULES = [
+    RecommendationRule("score", "score_recommendations", 0, lambda features: list(features.score_result.recommendations)),
+    # Formatting
+    RecommendationRule(
+        "missing_sections", "missing_sections", 10,
+        lambda features: f"Add these missing sections for better ATS compatibility: {', '.join(features.missing_sections)}"
+    ),
+    RecommendationRule(
+        "too_short", "length:short", 20,
+        lambda features: "Your resume appears too short. Consider adding more detailed content to better showcase your qualifications."
+    ),
+    RecommendationRule(
+        "too_long", "length:long", 20,
+        lambda features: "Your resume may be too long. Consider focusing on the most relevant experience to make it more concise."
+    ),
+    RecommendationRule(
+        "brief_skills", "section_share_low:skills", 30,
+        lambda features: "Your Skills section appears too brief. Consider expanding it to highlight more relevant skills."
+    ),
+    RecommendationRule(
+        "brief_experience", "section_share_low:experience", 31,
+        lambda features: "Your Experience section could be more detailed. Focus on quantifiable achievements and responsibilities."
+    ),
+    # Content
+    RecommendationRule("missing_keywords", "job_requirements", 40, _missing_keywords),
+    RecommendationRule("missing_skills", "job_requirements", 41, _missing_skills),
+    RecommendationRule("action_verbs", "has_experience", 50, _action_verbs),
+    RecommendationRule("quantified", "has_experience", 51, _quantified),
+    # ATS optimization
+    RecommendationRule(
+        "ats_format", "format_band:low", 60,
+        lambda features: [
+            "For better ATS compatibility:",
+            "- Use standard section headings (e.g., 'Skills', 'Experience', 'Education')",
+            "- Avoid tables, columns, headers/footers, and graphics",
+            "- Use standard fonts like Arial, Calibri, or Times New Roman",
+        ]
+    ),
+    RecommendationRule(
+        "ats_keywords", "content_band:low", 70,
+        lambda features: [
+            "For better keyword matching:",
+            "- Mirror the exact terminology from the job description",
+            "- Include both spelled-out terms and acronyms (e.g., 'Artificial Intelligence (AI)')",
+            "- Place important keywords near the beginning of bullet points",
+        ]
+    ),
+]
+
+
+class RuleIndex:
+    """Recommendation rules indexed by trigger feature, each trigger's rules in priority order."""
+
+    def __init__(self, rules: Iterable[RecommendationRule] = DEFAULT_RULES):
+        self._by_trigger: Dict[str, List[RecommendationRule]] = {}
+        for rule in rules:
+            self._by_trigger.setdefault(rule.trigger, []).append(rule)
+        for trigger_rules in self._by_trigger.values():
+            trigger_rules.sort(key=lambda rule: rule.priority)
+
+    def triggered(self, triggers: Iterable[str]) -> Iterator[RecommendationRule]:
+        """Rules of the given triggers, merged lazily in priority order."""
+        lists = [self._by_trigger[trigger] for trigger in triggers if trigger in self._by_trigger]
+        return heapq.merge(*lists, key=lambda rule: rule.priority)
+
+    def evaluate(self, features: RecommendationFeatures, limit: int, max_priority: Optional[int] = None) -> List[str]:
+        """
+        Render triggered rules until `limit` distinct recommendations are collected
+
+        Args:
+            features: Features of the scored resume
+            limit: Maximum number of recommendations
+            max_priority: If given, rules of a higher priority number are not evaluated
+
+        Returns:
+            Recommendations in priority order, without duplicates
+        """
+        recommendations: Dict[str, None] = {}
+        evaluated = 0
+        for rule in self.triggered(features.triggers()):
+            if max_priority is not None and rule.priority > max_priority:
+                break
+            evaluated += 1
+            rendered = rule.render(features)
+            if rendered is None:
+                continue
+            for recommendation in [rendered] if isinstance(rendered, str) else rendered:
+                recommendations.setdefault(recommendation)
+                if len(recommendations) >= limit:
+                    logger.debug(f"Recommendations filled after {evaluated} rules")
+                    return list(recommendations)
+        return list(recommendations)
+
+
+_default_index: Optional[RuleIndex] = None
+
+
+def get_rule_index() -> RuleIndex:
+    """Index of DEFAULT_RULES, built on first use."""
+    global _default_index
+    if _default_index is None:
+        _default_index = RuleIndex()
+    return _default_index
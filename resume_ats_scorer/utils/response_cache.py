@@ -0,0 +1,166 @@
+"""
+Memoization of final scoring responses.
+
+Clients retry and batch jobs re-run the same (resume, job description,
+platform) triples, so the final ResumeScoreResponse is cached under a key
+made of content hashes of the inputs and SCORER_VERSION. Entries live in a
+bounded in-memory LRU, optionally backed by a SQLite file shared by every
+worker process and kept across restarts.
+"""
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..models.schemas import ResumeScoreResponse
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever parsing, scoring or recommendation logic changes the response
+# for the same inputs; entries written by other versions are never read.
+SCORER_VERSION = "2026.10.6"
+
+
+def _jsonable(part: Any) -> Any:
+    if isinstance(part, BaseModel):
+        return part.model_dump(mode="json")
+    if isinstance(part, bytes):
+        return hashlib.sha256(part).hexdigest()
+    return part
+
+
+def content_hash(*parts: Any) -> str:
+    """Stable SHA-256 of strings, bytes, pydantic models and JSON-serializable values."""
+    payload = json.dumps([_jsonable(part) for part in parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def response_cache_key(kind: str, *parts: Any) -> str:
+    """
+    Cache key for one scoring entry point
+
+    Args:
+        kind: Name of the entry point, so different pipelines never share entries
+        parts: Inputs that determine the response (content hashes or values)
+
+    Returns:
+        Hex key that also covers SCORER_VERSION
+    """
+    return content_hash(SCORER_VERSION, kind, *parts)
+
+
+class ResponseCache:
+    """Bounded LRU of serialized responses with an optional SQLite tier."""
+
+    def __init__(self, max_size: int, path: Optional[str] = None, persistent_max_size: int = 0):
+        self.max_size = max_size
+        self.path = path
+        self.persistent_max_size = persistent_max_size
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path:
+            self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, version TEXT NOT NULL, value TEXT NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[ResumeScoreResponse]:
+        """Return a fresh copy of the cached response, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            elif self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT value FROM responses WHERE key = ? AND version = ?", (key, SCORER_VERSION)
+                ).fetchone()
+                if row is not None:
+                    value = row[0]
+                    self._connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+                    self._remember(key, value)
+
+        if value is None:
+            metrics.increment("response_cache_misses")
+            return None
+        metrics.increment("response_cache_hits")
+        return ResumeScoreResponse.model_validate_json(value)
+
+    def put(self, key: str, response: ResumeScoreResponse) -> None:
+        """Store a response in both tiers."""
+        value = response.model_dump_json()
+        with self._lock:
+            self._remember(key, value)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, version, value, accessed) VALUES (?, ?, ?, ?)",
+                    (key, SCORER_VERSION, value, time.time())
+                )
+                if self.persistent_max_size:
+                    # Keep the newest entries; stale versions go first
+                    self._connection.execute(
+                        "DELETE FROM responses WHERE version != ? OR key IN "
+                        "(SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                        (SCORER_VERSION, self.persistent_max_size)
+                    )
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM responses")
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache, or None when RESPONSE_CACHE_SIZE is 0."""
+    global _response_cache
+    if settings.RESPONSE_CACHE_SIZE <= 0:
+        return None
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache(
+                    settings.RESPONSE_CACHE_SIZE,
+                    settings.RESPONSE_CACHE_PATH,
+                    settings.RESPONSE_CACHE_PERSISTENT_SIZE
+                )
+                metrics.register_callback("response_cache_size", lambda: len(_response_cache))
+                logger.info(
+                    f"Response cache enabled: {settings.RESPONSE_CACHE_SIZE} entries in memory"
+                    + (f", persisted to {settings.RESPONSE_CACHE_PATH}" if settings.RESPONSE_CACHE_PATH else "")
+                )
+    return _response_cache
@@ -0,0 +1,965 @@
+"""
+Persistent inverted index of parsed resumes.
+
+The index maps canonical skills to postings of (resume, section, frequency)
+and stores each resume's ParsedResume (plus an optional caller payload).
+It lives in a directory of immutable segments:
+
+    index.json           manifest: segments and their sizes, tombstones,
+                         next document id
+    seg-000001.post      postings, delta + varint encoded
+    seg-000001.docs      stored documents, one JSON record each
+    seg-000001.json      term dictionary (offsets, document counts, skip
+                         entries) and document offsets
+
+Postings and documents are memory-mapped read-only, so every worker process
+that opens the index shares the page cache instead of loading its own copy.
+Writers append new segments and tombstone deleted resumes; segments of
+similar size are merged as they accumulate (and compact() merges them all),
+dropping deleted documents. Every manifest update is an
+atomic rename under an exclusive file lock, and readers take it shared
+while opening segments, so they always see a consistent set of segments
+and pick up changes on refresh().
+
+Queries do not decode whole postings lists: document frequencies come from
+the per-segment counts in the term dictionary less the tombstoned resumes
+containing the term, and WAND ranks over cursors that decode postings as
+they advance and use the skip entries to jump over the rest.
+
+    python -m resume_ats_scorer.utils.resume_index --index index_dir/ parsed_resumes.jsonl
+    python -m resume_ats_scorer.utils.resume_index --index index_dir/ --compact
+"""
+import os
+import sys
+import json
+import math
+import mmap
+import fcntl
+import logging
+import argparse
+import threading
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from ..core.config import settings
+from ..models.schemas import ParsedResume, ResumeSection
+from .ranking import (
+    PREFERRED_TERM_WEIGHT,
+    REQUIRED_TERM_WEIGHT,
+    ScoredCandidate,
+    normalize_skill,
+    skill_terms,
+    wand_top_k
+)
+from .skill_taxonomy import get_skill_matcher
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+MANIFEST = "index.json"
+LOCK_FILE = "index.lock"
+
+# Section codes stored in the postings; "keywords" holds skills that came
+# from keyword analysis rather than from a section of the resume text
+SECTIONS: Tuple[str, ...] = tuple(section.value for section in ResumeSection) + ("keywords",)
+SECTION_CODES: Dict[str, int] = {name: code for code, name in enumerate(SECTIONS)}
+KEYWORDS_SECTION = "keywords"
+# A term's dictionary entry has a skip entry for every SKIP_INTERVAL-th posting
+SKIP_INTERVAL = 32
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(buffer, position: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 varint; returns (value, next position)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def encode_postings(postings: Iterable[Tuple[int, Dict[str, int]]],
+                    skips: Optional[Tuple[List[int], List[int]]] = None) -> bytes:
+    """
+    Encode a term's postings
+
+    Args:
+        postings: (document id, {section: frequency}) in increasing document id order
+        skips: If given, (document ids, end offsets) lists that receive every
+            SKIP_INTERVAL-th posting's document id and the offset following it
+
+    Returns:
+        For each document: id delta, section count, then (section code, frequency) pairs, all varints
+    """
+    out = bytearray()
+    previous = 0
+    for index, (doc_id, sections) in enumerate(postings, 1):
+        encode_varint(doc_id - previous, out)
+        encode_varint(len(sections), out)
+        for section, frequency in sorted(sections.items(), key=lambda item: SECTION_CODES[item[0]]):
+            encode_varint(SECTION_CODES[section], out)
+            encode_varint(frequency, out)
+        previous = doc_id
+        if skips is not None and index % SKIP_INTERVAL == 0:
+            skips[0].append(doc_id)
+            skips[1].append(len(out))
+    return bytes(out)
+
+
+def decode_postings(buffer, start: int, end: int) -> List[Tuple[int, Dict[str, int]]]:
+    """Decode the postings stored in buffer[start:end] (inverse of encode_postings)."""
+    postings = []
+    doc_id = 0
+    position = start
+    while position < end:
+        delta, position = decode_varint(buffer, position)
+        count, position = decode_varint(buffer, position)
+        doc_id += delta
+        sections = {}
+        for _ in range(count):
+            code, position = decode_varint(buffer, position)
+            frequency, position = decode_varint(buffer, position)
+            sections[SECTIONS[code]] = frequency
+        postings.append((doc_id, sections))
+    return postings
+
+
+def resume_terms(resume: ParsedResume, keywords: Iterable[str] = ()) -> Dict[str, Dict[str, int]]:
+    """
+    Index terms of a parsed resume
+
+    Args:
+        resume: Output of ResumeParser
+        keywords: Extra keywords, e.g. the KeywordAnalyst's "all" list or a
+            KeywordAnalysis' hard and soft skills
+
+    Returns:
+        Canonical skill -> {section: occurrences}. Taxonomy skills are counted
+        per section (the raw text counts as "other" when no sections were
+        found); the resume's own and the extra keywords are indexed under
+        "keywords" with the same terms the ranking index uses.
+    """
+    matcher = get_skill_matcher()
+    terms: Dict[str, Dict[str, int]] = {}
+
+    section_texts = [(section.value, text) for section, text in resume.sections.items() if text]
+    if not section_texts:
+        section_texts = [(ResumeSection.OTHER.value, resume.raw_text)]
+    for section, text in section_texts:
+        for _, _, skill in matcher.iter_matches(text):
+            counts = terms.setdefault(skill, {})
+            counts[section] = counts.get(section, 0) + 1
+
+    for term in skill_terms(list(resume.keywords) + list(keywords)):
+        terms.setdefault(term, {}).setdefault(KEYWORDS_SECTION, 1)
+    return terms
+
+
+class _PostingsCursor:
+    """
+    WAND cursor over a term's encoded postings in every segment.
+
+    Only document ids are decoded, one posting at a time as the cursor
+    advances; seek() passes over segments whose documents all precede the
+    target and jumps to the last skip entry before it, so most postings of
+    common terms are never read.
+    """
+
+    __slots__ = ("weight", "doc", "_spans", "_span", "_passed", "_index", "_position", "_end", "_skip_docs",
+                 "_skip_offsets", "_start", "_last_doc")
+
+    def __init__(self, spans: List[Tuple["_Segment", List[Any]]], weight: float):
+        """
+        Args:
+            spans: (segment, term dictionary entry) of each segment containing the term, in segment order
+            weight: Query weight of the term
+        """
+        self.weight = weight
+        self._spans = spans
+        self._span = -1
+        self._passed = 0
+        self._index = 0
+        self._open(0)
+        self.next()
+
+    def _open(self, span: int) -> bool:
+        """Position before the first posting of a span; False (and exhausted) if there is none."""
+        if self._span >= 0:
+            self._passed += self._spans[self._span][1][2]
+        self._span = span
+        if span >= len(self._spans):
+            self._index = 0
+            self.doc = math.inf
+            return False
+        segment, entry = self._spans[span]
+        self._start = self._position = entry[0]
+        self._end = entry[0] + entry[1]
+        self._skip_docs, self._skip_offsets = (entry[3], entry[4]) if len(entry) > 3 else ((), ())
+        self._last_doc = segment.last_doc_id
+        self._index = 0
+        # Deltas restart from 0 in every segment
+        self.doc = 0
+        return True
+
+    def next(self) -> None:
+        """Move to the following posting."""
+        while self._position >= self._end:
+            if not self._open(self._span + 1):
+                return
+        buffer = self._spans[self._span][0].postings_buffer
+        delta, position = decode_varint(buffer, self._position)
+        count, position = decode_varint(buffer, position)
+        for _ in range(2 * count):
+            position = decode_varint(buffer, position)[1]
+        self._position = position
+        self._index += 1
+        self.doc += delta
+
+    def seek(self, target: int) -> int:
+        """Move to the first posting >= target; returns the number of postings skipped."""
+        if self.doc >= target:
+            return 0
+        start = self._passed + self._index
+        while self.doc < target:
+            if self._last_doc < target:
+                if not self._open(self._span + 1):
+                    break
+                self.next()
+                continue
+            skip = bisect_left(self._skip_docs, target) - 1
+            if skip >= 0 and (skip + 1) * SKIP_INTERVAL > self._index:
+                self.doc = self._skip_docs[skip]
+                self._position = self._start + self._skip_offsets[skip]
+                self._index = (skip + 1) * SKIP_INTERVAL
+            while self.doc < target:
+                self.next()
+        return self._passed + self._index - start
+
+
+class Posting(NamedTuple):
+    """One resume in a term's postings list."""
+    resume_id: str
+    sections: Dict[str, int]
+
+    @property
+    def frequency(self) -> int:
+        return sum(self.sections.values())
+
+
+class _Segment:
+    """One immutable, memory-mapped segment."""
+
+    def __init__(self, directory: str, name: str):
+        self.name = name
+        with open(os.path.join(directory, f"{name}.json"), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Segment {name} is not a version {FORMAT_VERSION} index segment")
+
+        # term -> [offset, length, document count] (+ [skip document ids], [skip offsets])
+        self.terms: Dict[str, List[Any]] = meta["terms"]
+        # document id -> [resume id, offset, length]
+        self.documents: Dict[int, List[Any]] = {int(doc_id): entry for doc_id, entry in meta["documents"].items()}
+        self.last_doc_id = max(self.documents, default=-1)
+        self._postings = self._map(os.path.join(directory, f"{name}.post"))
+        self._docs = self._map(os.path.join(directory, f"{name}.docs"))
+        self.postings = lru_cache(maxsize=4096)(self._decode)
+
+    @staticmethod
+    def _map(path: str):
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            # The mapping stays valid after the file is closed (and after compaction unlinks it)
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _decode(self, term: str) -> Tuple[Tuple[int, Dict[str, int]], ...]:
+        entry = self.terms.get(term)
+        if entry is None:
+            return ()
+        offset, length = entry[0], entry[1]
+        return tuple(decode_postings(self._postings, offset, offset + length))
+
+    @property
+    def postings_buffer(self):
+        return self._postings
+
+    def document(self, doc_id: int) -> Dict[str, Any]:
+        _, offset, length = self.documents[doc_id]
+        return json.loads(bytes(self._docs[offset:offset + length]).decode('utf-8'))
+
+    def document_terms(self, doc_id: int) -> List[str]:
+        """Index terms of a document, from its stored record (or its postings for records without them)."""
+        terms = self.document(doc_id).get("terms")
+        if terms is None:
+            terms = [term for term in self.terms if any(posting[0] == doc_id for posting in self.postings(term))]
+        return terms
+
+    def close(self) -> None:
+        for mapped in (self._postings, self._docs):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+
+def _read_manifest(directory: str) -> Dict[str, Any]:
+    path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(path):
+        return {"version": FORMAT_VERSION, "next_doc_id": 0, "segments": [], "tombstones": []}
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{directory} is not a version {FORMAT_VERSION} resume index")
+    return manifest
+
+
+def _segment_documents(directory: str, name: str) -> Dict[int, str]:
+    """Document id -> resume id of a segment, from its dictionary alone (without mapping its data)."""
+    with open(os.path.join(directory, f"{name}.json"), 'r', encoding='utf-8') as f:
+        return {int(doc_id): entry[0] for doc_id, entry in json.load(f)["documents"].items()}
+
+
+@contextmanager
+def _directory_lock(directory: str, operation: int):
+    """
+    Hold an flock on the index directory: LOCK_EX for writers, LOCK_SH for readers.
+
+    Readers open the lock file read-only and go without the lock while no
+    writer has created it, as there is then nothing to race with.
+    """
+    path = os.path.join(directory, LOCK_FILE)
+    if operation == fcntl.LOCK_SH and not os.path.exists(path):
+        yield
+        return
+    with open(path, 'r' if operation == fcntl.LOCK_SH else 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    temp_path = f"{path}.tmp{os.getpid()}"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def _bm25_idf(doc_count: int, document_frequency: int) -> float:
+    return math.log(1 + (doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+
+class ResumeIndex:
+    """
+    Reader over the segments listed in an index directory's manifest.
+
+    Document ids increase across segments, so a term's postings are the
+    concatenation of its per-segment postings; tombstoned documents are
+    filtered out at query time until compaction removes them.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.RLock()
+        self._segments: Dict[str, _Segment] = {}
+        self._manifest_mtime: Optional[int] = None
+        # Tombstoned document id -> its terms, read once per deleted document
+        self._deleted_terms: Dict[int, List[str]] = {}
+        self.refresh(force=True)
+
+    def _manifest_version(self) -> Optional[int]:
+        try:
+            return os.stat(os.path.join(self.directory, MANIFEST)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-read the manifest if it changed on disk; returns whether the view was updated."""
+        if not force and self._manifest_version() == self._manifest_mtime:
+            return False
+
+        # A shared lock, so compaction cannot remove segments between reading the manifest and mapping them
+        with self._lock, _directory_lock(self.directory, fcntl.LOCK_SH):
+            mtime = self._manifest_version()
+            manifest = _read_manifest(self.directory)
+            segments = {
+                name: self._segments.get(name) or _Segment(self.directory, name)
+                for name in manifest["segments"]
+            }
+            # Segments dropped by compaction stay mapped for queries still using them
+            self._segments = segments
+            self._order = [segments[name] for name in manifest["segments"]]
+            self._tombstones = frozenset(manifest["tombstones"])
+
+            self._doc_ids: Dict[str, int] = {}
+            self._resume_ids: Dict[int, str] = {}
+            self._segment_of: Dict[int, _Segment] = {}
+            deleted_terms: Dict[int, List[str]] = {}
+            self._deleted_frequency: Counter = Counter()
+            for segment in self._order:
+                for doc_id, (resume_id, _, _) in segment.documents.items():
+                    if doc_id in self._tombstones:
+                        terms = self._deleted_terms.get(doc_id)
+                        if terms is None:
+                            terms = segment.document_terms(doc_id)
+                        deleted_terms[doc_id] = terms
+                        self._deleted_frequency.update(terms)
+                        continue
+                    self._doc_ids[resume_id] = doc_id
+                    self._resume_ids[doc_id] = resume_id
+                    self._segment_of[doc_id] = segment
+            self._deleted_terms = deleted_terms
+            self._next_doc_id = manifest["next_doc_id"]
+            self._manifest_mtime = mtime
+        return True
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._doc_ids
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._order)
+
+    @property
+    def deleted_count(self) -> int:
+        return len(self._tombstones)
+
+    def resume_ids(self) -> List[str]:
+        """Live resume ids in indexing order."""
+        return [self._resume_ids[doc_id] for doc_id in sorted(self._resume_ids)]
+
+    def _live(self, doc_id: int) -> bool:
+        return doc_id in self._resume_ids
+
+    def _term_postings(self, term: str) -> Iterator[Tuple[int, Dict[str, int]]]:
+        for segment in self._order:
+            for doc_id, sections in segment.postings(term):
+                if doc_id in self._resume_ids:
+                    yield doc_id, sections
+
+    def postings(self, term: str) -> List[Posting]:
+        """Live postings of a canonical skill, in indexing order."""
+        term = normalize_skill(term)
+        with self._lock:
+            return [Posting(self._resume_ids[doc_id], sections) for doc_id, sections in self._term_postings(term)]
+
+    def document_frequency(self, term: str) -> int:
+        """Number of live resumes containing the term (from the segment counts, without reading postings)."""
+        term = normalize_skill(term)
+        with self._lock:
+            stored = sum(segment.terms[term][2] for segment in self._order if term in segment.terms)
+            return stored - self._deleted_frequency[term]
+
+    def document(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        """Stored record of a resume: {"resume_id", "resume", "payload", "terms"}."""
+        with self._lock:
+            doc_id = self._doc_ids.get(resume_id)
+            if doc_id is None:
+                return None
+            return self._segment_of[doc_id].document(doc_id)
+
+    def get_resume(self, resume_id: str) -> Optional[ParsedResume]:
+        """Stored ParsedResume of a resume."""
+        record = self.document(resume_id)
+        return ParsedResume.model_validate(record["resume"]) if record else None
+
+    def get(self, resume_id: str) -> Optional[Any]:
+        """Stored payload of a resume."""
+        record = self.document(resume_id)
+        return record["payload"] if record else None
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency of a term over the live resumes."""
+        document_frequency = self.document_frequency(term)
+        return _bm25_idf(len(self), document_frequency)
+
+    def query_weights(self, required_skills: Iterable[str], preferred_skills: Iterable[str]) -> Dict[str, float]:
+        """Weight each job skill term by its rarity and by whether it is required or preferred."""
+        weights: Dict[str, float] = {}
+        with self._lock:
+            for skills, importance in ((required_skills, REQUIRED_TERM_WEIGHT), (preferred_skills, PREFERRED_TERM_WEIGHT)):
+                for skill in skills:
+                    term = normalize_skill(skill)
+                    document_frequency = self.document_frequency(term)
+                    if document_frequency:
+                        idf = _bm25_idf(len(self), document_frequency)
+                        weights[term] = max(weights.get(term, 0.0), importance * idf)
+        return weights
+
+    def top_k(self, weights: Dict[str, float], k: int) -> List[ScoredCandidate]:
+        """
+        Retrieve the k resumes with the highest total weight of matched terms
+
+        Args:
+            weights: Query term weights (see query_weights)
+            k: Number of resumes to return
+
+        Returns:
+            Resumes ordered by descending score, with their stored payloads
+        """
+        if k <= 0:
+            return []
+
+        with self._lock:
+            if not weights:
+                return [ScoredCandidate(resume_id, 0.0, self.get(resume_id)) for resume_id in self.resume_ids()[:k]]
+
+            cursors = []
+            for term, weight in weights.items():
+                spans = [(segment, segment.terms[term]) for segment in self._order if term in segment.terms]
+                if spans:
+                    cursors.append(_PostingsCursor(spans, weight))
+            ranked = wand_top_k(cursors, k, self._live)
+            return [
+                ScoredCandidate(self._resume_ids[doc_id], score, self.get(self._resume_ids[doc_id]))
+                for score, doc_id in ranked
+            ]
+
+    def close(self) -> None:
+        """Release the memory maps of all open segments."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+            self._segments = {}
+            self._order = []
+
+
+class ResumeIndexWriter:
+    """
+    Buffers added and deleted resumes and commits them as a new segment.
+
+    Re-adding a resume id replaces the stored version. Document ids are
+    assigned at commit time under the directory lock, so several processes
+    can write to the same index. The writer keeps the live resume id ->
+    document id map between commits and only reads the segments and
+    tombstones other writers published since, so a commit costs the size of
+    the change rather than of the index.
+
+    Segments are merged by size tier: whenever merge_factor adjacent segments
+    fall in the same tier (the same power of merge_factor documents), they are
+    merged into one in the next tier. Every document is therefore rewritten
+    about log(number of documents) times, and the segment count stays
+    logarithmic in the index size.
+    """
+
+    def __init__(self, directory: str, merge_factor: Optional[int] = None):
+        self.directory = directory
+        self.merge_factor = max(2, merge_factor if merge_factor is not None else settings.RESUME_INDEX_MERGE_FACTOR)
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # resume id -> (terms, stored record), or None for a pending delete
+        self._pending: Dict[str, Optional[Tuple[Dict[str, Dict[str, int]], Dict[str, Any]]]] = {}
+        self._forget_live()
+
+    @property
+    def pending(self) -> Dict[str, bool]:
+        """Resume ids with uncommitted changes: True for an add, False for a delete."""
+        with self._lock:
+            return {resume_id: entry is not None for resume_id, entry in self._pending.items()}
+
+    def add(self, resume_id: str, resume: ParsedResume, keywords: Iterable[str] = (), payload: Any = None) -> int:
+        """
+        Queue a resume for indexing
+
+        Args:
+            resume_id: Caller's identifier for the resume
+            resume: Parsed resume (stored alongside the postings)
+            keywords: Extra keywords from keyword analysis
+            payload: JSON-serializable data returned with the resume
+
+        Returns:
+            Number of distinct index terms
+        """
+        terms = resume_terms(resume, keywords)
+        record = {"resume_id": resume_id, "resume": resume.model_dump(mode="json"), "payload": payload}
+        with self._lock:
+            self._pending[resume_id] = (terms, record)
+        return len(terms)
+
+    def delete(self, resume_id: str) -> None:
+        """Queue the removal of a resume."""
+        with self._lock:
+            self._pending[resume_id] = None
+
+    def commit(self) -> Dict[str, int]:
+        """
+        Write the pending changes and publish them in the manifest
+
+        Returns:
+            Counts of added and deleted resumes
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return {"added": 0, "deleted": 0}
+
+        with _directory_lock(self.directory, fcntl.LOCK_EX):
+            manifest = _read_manifest(self.directory)
+            try:
+                live = self._sync_live(manifest)
+                tombstones = self._live_tombstones
+
+                deleted = 0
+                for resume_id in pending:
+                    doc_id = live.pop(resume_id, None)
+                    if doc_id is not None:
+                        del self._live_resumes[doc_id]
+                        tombstones.add(doc_id)
+                        if pending[resume_id] is None:
+                            deleted += 1
+
+                documents = []
+                for resume_id, entry in pending.items():
+                    if entry is not None:
+                        doc_id = manifest["next_doc_id"]
+                        documents.append((doc_id, entry[0], entry[1]))
+                        live[resume_id] = doc_id
+                        self._live_resumes[doc_id] = resume_id
+                        manifest["next_doc_id"] += 1
+
+                if documents:
+                    name = self._write_segment(manifest, documents)
+                    manifest["segments"].append(name)
+                    self._live_segments.add(name)
+                manifest["tombstones"] = sorted(tombstones)
+                self._publish(manifest)
+
+                self._merge_tiers(manifest)
+            except BaseException:
+                # The cached view may be ahead of what was published; rebuild it on the next commit
+                self._forget_live()
+                raise
+
+        logger.info(f"Committed {len(documents)} resumes and {deleted} deletions to {self.directory}")
+        return {"added": len(documents), "deleted": deleted}
+
+    def compact(self) -> None:
+        """Merge all segments into one, dropping deleted resumes."""
+        with _directory_lock(self.directory, fcntl.LOCK_EX):
+            manifest = _read_manifest(self.directory)
+            if len(manifest["segments"]) > 1 or manifest["tombstones"]:
+                self._merge(manifest, list(manifest["segments"]))
+
+    def _forget_live(self) -> None:
+        # resume id -> document id and back, of the live documents in the last synced manifest
+        self._live: Dict[str, int] = {}
+        self._live_resumes: Dict[int, str] = {}
+        self._live_segments: Set[str] = set()
+        self._live_tombstones: Set[int] = set()
+
+    def _sync_live(self, manifest: Dict[str, Any]) -> Dict[str, int]:
+        """Bring the live document map up to date with a manifest, reading only segments not seen before."""
+        tombstones = set(manifest["tombstones"])
+        for doc_id in tombstones - self._live_tombstones:
+            resume_id = self._live_resumes.pop(doc_id, None)
+            if resume_id is not None:
+                del self._live[resume_id]
+
+        for name in manifest["segments"]:
+            if name in self._live_segments:
+                continue
+            # A segment merged by another writer only holds documents already known (or tombstoned)
+            for doc_id, resume_id in sorted(_segment_documents(self.directory, name).items()):
+                if doc_id in tombstones or doc_id in self._live_resumes:
+                    continue
+                previous = self._live.get(resume_id)
+                if previous is not None:
+                    if previous > doc_id:
+                        continue
+                    del self._live_resumes[previous]
+                self._live[resume_id] = doc_id
+                self._live_resumes[doc_id] = resume_id
+
+        self._live_segments = set(manifest["segments"])
+        self._live_tombstones = tombstones
+        return self._live
+
+    def _segment_size(self, manifest: Dict[str, Any], name: str) -> int:
+        sizes = manifest.setdefault("segment_sizes", {})
+        if name not in sizes:
+            # Manifests written before segment sizes were recorded
+            sizes[name] = len(_segment_documents(self.directory, name))
+        return sizes[name]
+
+    def _tier(self, size: int) -> int:
+        tier = 0
+        while size >= self.merge_factor:
+            size //= self.merge_factor
+            tier += 1
+        return tier
+
+    def _merge_tiers(self, manifest: Dict[str, Any]) -> None:
+        """Merge runs of merge_factor adjacent segments of the same tier, lowest tier first, until none is left."""
+        while True:
+            segments = manifest["segments"]
+            tiers = [self._tier(self._segment_size(manifest, name)) for name in segments]
+            runs = [
+                start for start in range(len(segments) - self.merge_factor + 1)
+                if len(set(tiers[start:start + self.merge_factor])) == 1
+            ]
+            if not runs:
+                return
+            start = min(runs, key=lambda run: (tiers[run], -run))
+            self._merge(manifest, segments[start:start + self.merge_factor])
+
+    def _merge(self, manifest: Dict[str, Any], names: List[str]) -> None:
+        """Replace adjacent segments by one holding their live documents, dropping their tombstones."""
+        self._sync_live(manifest)
+        tombstones = set(manifest["tombstones"])
+        dropped = set()
+        documents = []
+        for name in names:
+            segment = _Segment(self.directory, name)
+            try:
+                doc_terms: Dict[int, Dict[str, Dict[str, int]]] = {}
+                for term in segment.terms:
+                    for doc_id, sections in segment.postings(term):
+                        if doc_id not in tombstones:
+                            doc_terms.setdefault(doc_id, {})[term] = sections
+                for doc_id in sorted(segment.documents):
+                    if doc_id in tombstones:
+                        dropped.add(doc_id)
+                    else:
+                        documents.append((doc_id, doc_terms.get(doc_id, {}), segment.document(doc_id)))
+            finally:
+                segment.close()
+
+        # Adjacent segments keep document ids increasing across the merged one
+        merged = [self._write_segment(manifest, documents)] if documents else []
+        position = manifest["segments"].index(names[0])
+        manifest["segments"][position:position + len(names)] = merged
+        manifest["tombstones"] = sorted(tombstones - dropped)
+        sizes = manifest.setdefault("segment_sizes", {})
+        for name in names:
+            sizes.pop(name, None)
+        self._publish(manifest)
+        self._live_segments.difference_update(names)
+        self._live_segments.update(merged)
+        self._live_tombstones -= dropped
+
+        for name in names:
+            for suffix in (".post", ".docs", ".json"):
+                try:
+                    os.remove(os.path.join(self.directory, f"{name}{suffix}"))
+                except FileNotFoundError:
+                    pass
+        logger.info(f"Merged {len(names)} segments of {self.directory} into {len(merged)} ({len(documents)} resumes)")
+
+    def _write_segment(self, manifest: Dict[str, Any],
+                       documents: List[Tuple[int, Dict[str, Dict[str, int]], Dict[str, Any]]]) -> str:
+        manifest["segment_counter"] = manifest.get("segment_counter", 0) + 1
+        name = f"seg-{manifest['segment_counter']:06d}"
+        manifest.setdefault("segment_sizes", {})[name] = len(documents)
+
+        docs_data = bytearray()
+        doc_entries: Dict[str, List[Any]] = {}
+        postings: Dict[str, List[Tuple[int, Dict[str, int]]]] = {}
+        for doc_id, terms, record in documents:
+            # The terms let readers discount a deleted document from the counts without reading postings
+            record = dict(record, terms=sorted(terms))
+            encoded = json.dumps(record, separators=(",", ":")).encode('utf-8')
+            doc_entries[str(doc_id)] = [record["resume_id"], len(docs_data), len(encoded)]
+            docs_data += encoded
+            for term, sections in terms.items():
+                postings.setdefault(term, []).append((doc_id, sections))
+
+        postings_data = bytearray()
+        term_entries: Dict[str, List[Any]] = {}
+        for term in sorted(postings):
+            skips: Tuple[List[int], List[int]] = ([], [])
+            encoded = encode_postings(postings[term], skips)
+            term_entries[term] = [len(postings_data), len(encoded), len(postings[term])]
+            if skips[0]:
+                term_entries[term].extend(skips)
+            postings_data += encoded
+
+        # Data files first: a segment is only visible once its dictionary and the manifest exist
+        _write_atomic(os.path.join(self.directory, f"{name}.post"), bytes(postings_data))
+        _write_atomic(os.path.join(self.directory, f"{name}.docs"), bytes(docs_data))
+        meta = {"version": FORMAT_VERSION, "terms": term_entries, "documents": doc_entries}
+        _write_atomic(os.path.join(self.directory, f"{name}.json"), json.dumps(meta).encode('utf-8'))
+        return name
+
+    def _publish(self, manifest: Dict[str, Any]) -> None:
+        _write_atomic(os.path.join(self.directory, MANIFEST), json.dumps(manifest).encode('utf-8'))
+
+
+class PersistentCandidateIndex:
+    """
+    Candidate store for the ranking API backed by an on-disk resume index.
+
+    Offers the same operations as ranking.CandidateIndex. Changes are
+    buffered and committed together as one segment commit_interval seconds
+    after the first of them (add_many and flush commit right away), so other
+    worker processes see them shortly after; queries in this process commit
+    pending changes first and so always see its own writes.
+    """
+
+    def __init__(self, directory: str, commit_interval: Optional[float] = None):
+        self.writer = ResumeIndexWriter(directory)
+        self.reader = ResumeIndex(directory)
+        self.commit_interval = (
+            commit_interval if commit_interval is not None else settings.RESUME_INDEX_COMMIT_INTERVAL_SECONDS
+        )
+        self._timer_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def __len__(self) -> int:
+        # Counted from the pending changes rather than by committing them
+        self.reader.refresh()
+        count = len(self.reader)
+        for candidate_id, added in self.writer.pending.items():
+            if added and candidate_id not in self.reader:
+                count += 1
+            elif not added and candidate_id in self.reader:
+                count -= 1
+        return count
+
+    def add(self, candidate_id: str, resume: ParsedResume, keywords: Iterable[str] = (), payload: Any = None) -> int:
+        """Queue a candidate for indexing, replacing any previous version; returns the number of index terms."""
+        indexed_terms = self.writer.add(candidate_id, resume, keywords, payload)
+        self._schedule_flush()
+        return indexed_terms
+
+    def add_many(self, candidates: Iterable[Tuple[str, ParsedResume, Iterable[str], Any]]) -> List[int]:
+        """
+        Index several candidates in one commit
+
+        Args:
+            candidates: (candidate id, parsed resume, keywords, payload) tuples
+
+        Returns:
+            Number of index terms of each candidate
+        """
+        indexed_terms = [
+            self.writer.add(candidate_id, resume, keywords, payload)
+            for candidate_id, resume, keywords, payload in candidates
+        ]
+        self.flush()
+        return indexed_terms
+
+    def remove(self, candidate_id: str) -> bool:
+        """Remove a candidate; returns whether it was indexed."""
+        self._sync()
+        if candidate_id not in self.reader:
+            return False
+        self.writer.delete(candidate_id)
+        self._schedule_flush()
+        return True
+
+    def flush(self) -> None:
+        """Commit the buffered changes and refresh the reader."""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.writer.commit()
+        self.reader.refresh()
+
+    def get(self, candidate_id: str) -> Optional[Any]:
+        self._sync()
+        return self.reader.get(candidate_id)
+
+    def query_weights(self, required_skills: Iterable[str], preferred_skills: Iterable[str]) -> Dict[str, float]:
+        self._sync()
+        return self.reader.query_weights(required_skills, preferred_skills)
+
+    def top_k(self, weights: Dict[str, float], k: int) -> List[ScoredCandidate]:
+        return self.reader.top_k(weights, k)
+
+    def _sync(self) -> None:
+        if self.writer.pending:
+            self.flush()
+        else:
+            self.reader.refresh()
+
+    def _schedule_flush(self) -> None:
+        if self.commit_interval <= 0:
+            self.flush()
+            return
+        with self._timer_lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self.commit_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+
+_indexes: Dict[str, PersistentCandidateIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_persistent_candidate_index(directory: str) -> PersistentCandidateIndex:
+    """Return the process-wide store for an index directory, opening it on first use."""
+    with _indexes_lock:
+        index = _indexes.get(directory)
+        if index is None:
+            index = _indexes[directory] = PersistentCandidateIndex(directory)
+            logger.info(f"Opened resume index {directory} with {len(index.reader)} resumes")
+        return index
+
+
+def flush_persistent_candidate_indexes() -> None:
+    """Commit the buffered changes of every open store (on shutdown)."""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        index.flush()
+
+
+def _iter_parsed_resumes(paths: List[str]) -> Iterator[Tuple[str, ParsedResume, List[str]]]:
+    """Yield (resume id, parsed resume, keywords) from .jsonl files of ParsedResume records."""
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                resume_id = str(record.pop("resume_id", None) or f"{os.path.basename(path)}:{line_number}")
+                keywords = record.pop("keyword_analysis", None) or {}
+                if isinstance(keywords, dict):
+                    keywords = keywords.get("all") or keywords.get("hard_skills", []) + keywords.get("soft_skills", [])
+                yield resume_id, ParsedResume.model_validate(record), list(keywords)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Add parsed resumes to an index directory, or compact it."""
+    parser = argparse.ArgumentParser(description="Build or update the persistent resume index")
+    parser.add_argument("inputs", nargs="*", help=".jsonl files of ParsedResume records (with optional resume_id)")
+    parser.add_argument("--index", required=True, help="Index directory")
+    parser.add_argument("--compact", action="store_true", help="Merge all segments after adding")
+    args = parser.parse_args(argv)
+
+    writer = ResumeIndexWriter(args.index)
+    added = 0
+    for resume_id, resume, keywords in _iter_parsed_resumes(args.inputs):
+        writer.add(resume_id, resume, keywords)
+        added += 1
+    writer.commit()
+    if args.compact:
+        writer.compact()
+
+    logger.info(f"Added {added} resumes to {args.index}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
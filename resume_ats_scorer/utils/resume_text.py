@@ -0,0 +1,90 @@
+"""
+Raw text extraction from resume files.
+
+Kept free of agent and NLP imports so the functions can run in the
+extraction worker processes (core/extraction_pool.py) without loading
+CrewAI or spaCy there.
+"""
+import logging
+
+import PyPDF2
+import docx
+from bs4 import BeautifulSoup
+
+from ..core.exceptions import ParsingError, UnsupportedFileTypeError
+from ..models.schemas import FileType
+
+logger = logging.getLogger(__name__)
+
+
+def extract_resume_text(file_path: str, file_type: FileType) -> str:
+    """Extract raw text from resume file based on file type."""
+    try:
+        if file_type == FileType.PDF:
+            return _extract_from_pdf(file_path)
+        elif file_type == FileType.DOCX:
+            return _extract_from_docx(file_path)
+        elif file_type == FileType.HTML:
+            return _extract_from_html(file_path)
+        elif file_type == FileType.TXT:
+            return _extract_from_txt(file_path)
+        else:
+            raise UnsupportedFileTypeError(f"Unsupported file type: {file_type}")
+    except Exception as e:
+        raise ParsingError(f"Error extracting text from {file_type} file: {str(e)}")
+
+
+def _extract_from_pdf(file_path: str) -> str:
+    """Extract text from PDF file."""
+    try:
+        text = ""
+        with open(file_path, 'rb') as file:
+            reader = PyPDF2.PdfReader(file)
+            if len(reader.pages) == 0:
+                raise ParsingError("PDF file contains no pages")
+            for page in reader.pages:
+                page_text = page.extract_text()
+                if not page_text.strip():
+                    logger.warning("Empty page detected in PDF")
+                text += page_text
+        return text
+    except PyPDF2.PdfReadError as e:
+        raise ParsingError(f"Invalid PDF file: {str(e)}")
+
+
+def _extract_from_docx(file_path: str) -> str:
+    """Extract text from DOCX file."""
+    try:
+        doc = docx.Document(file_path)
+        if not doc.paragraphs:
+            raise ParsingError("DOCX file contains no text")
+        return "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
+    except Exception as e:
+        raise ParsingError(f"Error reading DOCX file: {str(e)}")
+
+
+def _extract_from_html(file_path: str) -> str:
+    """Extract text from HTML file."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            soup = BeautifulSoup(file.read(), 'html.parser')
+            text = soup.get_text(separator="\n")
+            if not text.strip():
+                raise ParsingError("HTML file contains no text content")
+            return text
+    except Exception as e:
+        raise ParsingError(f"Error parsing HTML file: {str(e)}")
+
+
+def _extract_from_txt(file_path: str) -> str:
+    """Extract text from TXT file."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            text = file.read()
+            if not text.strip():
+                raise ParsingError("TXT file is empty")
+            return text
+    except UnicodeDecodeError:
+        raise ParsingError("TXT file contains invalid characters")
+    except Exception as e:
+        raise ParsingError(f"Error reading TXT file: {str(e)}")
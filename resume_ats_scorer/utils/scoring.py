@@ -1,7 +1,6 @@
+import time
 import logging
-import re
-from typing import List, Dict, Any, Tuple
-import datetime
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
 from resume_ats_scorer.models.schemas import (
     ResumeScoreResponse,
@@ -11,8 +10,27 @@ from resume_ats_scorer.models.schemas import (
     OverallScore,
     SectionScore,
     KeywordAnalysis,
-    JobRequirements
+    JobRequirements,
+    AnalysisLevel,
+    DegradationLevel
 )
+from resume_ats_scorer.core.config import settings
+from resume_ats_scorer.core.load_monitor import get_load_monitor
+from resume_ats_scorer.core.metrics import metrics
+from resume_ats_scorer.utils.analysis_levels import (
+    applied_degradation,
+    includes_deep_analysis,
+    includes_recommendations,
+    job_requirements_text,
+    latency_budget_ms,
+    layout_analysis,
+    record_analysis_latency,
+    semantic_similarity
+)
+from resume_ats_scorer.utils.format_analyzer import analyze_format
+from resume_ats_scorer.utils.phrase_index import PhraseIndex
+from resume_ats_scorer.utils.response_cache import content_hash, get_response_cache, response_cache_key
+from resume_ats_scorer.utils.section_segmenter import SectionSegmenter
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +54,22 @@ FORMAT_PATTERNS = {
     "consistent_tense": r"\b(ing|ed)\b"
 }
 
+# Symbols counted as bullets when scoring, and as separators between listed skills
+SCORING_BULLETS = ("•", "*", "-", "+")
+SKILL_SEPARATORS = ("•", "*", "-")
+
+# Header phrases that open each scored section
+SECTION_HEADERS = {
+    "contact_info": ["contact", "contact information", "personal details"],
+    "summary": ["summary", "professional summary", "profile", "objective"],
+    "experience": ["experience", "work experience", "employment", "professional experience"],
+    "education": ["education", "educational background", "academic"],
+    "skills": ["skills", "technical skills", "core competencies", "expertise"],
+    "certifications": ["certifications", "certificates", "licenses", "accreditations"],
+}
+
+_RESUME_SEGMENTER = SectionSegmenter(SECTION_HEADERS)
+
 
 def identify_resume_sections(resume_text: str) -> Dict[str, str]:
     """
@@ -47,27 +81,9 @@ def identify_resume_sections(resume_text: str) -> Dict[str, str]:
     Returns:
         Dictionary mapping section names to section content
     """
-    sections = {}
-    
-    # Define patterns to identify common resume sections
-    section_patterns = {
-        "contact_info": r"(?:CONTACT|CONTACT INFORMATION|PERSONAL DETAILS).*?(?=\n\n|\n[A-Z])",
-        "summary": r"(?:SUMMARY|PROFESSIONAL SUMMARY|PROFILE|OBJECTIVE).*?(?=\n\n|\n[A-Z])",
-        "experience": r"(?:EXPERIENCE|WORK EXPERIENCE|EMPLOYMENT|PROFESSIONAL EXPERIENCE).*?(?=\n\n|\n[A-Z])",
-        "education": r"(?:EDUCATION|EDUCATIONAL BACKGROUND|ACADEMIC).*?(?=\n\n|\n[A-Z])",
-        "skills": r"(?:SKILLS|TECHNICAL SKILLS|CORE COMPETENCIES|EXPERTISE).*?(?=\n\n|\n[A-Z])",
-        "certifications": r"(?:CERTIFICATIONS|CERTIFICATES|LICENSES|ACCREDITATIONS).*?(?=\n\n|\n[A-Z])",
-    }
-    
-    # Extract each section using regex patterns
-    for section_name, pattern in section_patterns.items():
-        matches = re.findall(pattern, resume_text, re.IGNORECASE | re.DOTALL)
-        if matches:
-            sections[section_name] = matches[0]
-        else:
-            sections[section_name] = ""
-    
-    return sections
+    # Header lines are found in one pass; each section runs up to the next header
+    found = _RESUME_SEGMENTER.sections(resume_text, include_header=True)
+    return {section_name: found.get(section_name, "") for section_name in RESUME_SECTIONS}
 
 
 def analyze_format_compatibility(resume_text: str, file_type: str) -> Tuple[float, List[str], str]:
@@ -85,16 +101,19 @@ def analyze_format_compatibility(resume_text: str, file_type: str) -> Tuple[floa
     max_score = 20.0
     score = max_score
     
+    # All format features are collected in one pass over the text
+    features = analyze_format(resume_text)
+    
     # Check for proper formatting according to FORMAT_PATTERNS
-    if not re.search(FORMAT_PATTERNS["bullet_points"], resume_text):
+    if not features.has_bullets(SCORING_BULLETS):
         issues.append("No bullet points detected for listing experiences/skills")
         score -= 3
     
-    if not re.search(FORMAT_PATTERNS["dates_consistent"], resume_text):
+    if not features.has_date_range:
         issues.append("Inconsistent date formatting detected")
         score -= 3
     
-    if not re.search(FORMAT_PATTERNS["action_verbs"], resume_text):
+    if not features.action_verb_count:
         issues.append("Few action verbs detected in experience descriptions")
         score -= 3
     
@@ -102,13 +121,13 @@ def analyze_format_compatibility(resume_text: str, file_type: str) -> Tuple[floa
         issues.append("Resume length is not optimal (too short or too long)")
         score -= 3
     
-    if re.search(FORMAT_PATTERNS["no_personal_pronouns"], resume_text, re.IGNORECASE):
+    if features.pronoun_count:
         issues.append("Personal pronouns detected (avoid I, me, my)")
         score -= 2
     
     # Assess consistency in tense usage
-    past_tense = len(re.findall(r"\b\w+ed\b", resume_text))
-    present_tense = len(re.findall(r"\b\w+ing\b", resume_text))
+    past_tense = features.past_tense_count
+    present_tense = features.present_tense_count
     if past_tense > 0 and present_tense > 0 and min(past_tense, present_tense) / max(past_tense, present_tense) > 0.4:
         issues.append("Mixed tenses detected in experience descriptions")
         score -= 2
@@ -160,11 +179,12 @@ def evaluate_section_scores(sections: Dict[str, str]) -> Tuple[float, List[Secti
             feedback = f"Missing {section_name.replace('_', ' ')} section"
         else:
             content_length = len(section_content)
+            features = analyze_format(section_content)
             if section_name == "contact_info":
                 # Check for email, phone, LinkedIn
-                has_email = bool(re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', section_content))
-                has_phone = bool(re.search(r'[\+\(]?[0-9][0-9 \-\(\)]{8,}[0-9]', section_content))
-                has_linkedin = bool(re.search(r'linkedin\.com/in/[a-zA-Z0-9\-]+', section_content))
+                has_email = features.has_email
+                has_phone = features.has_phone
+                has_linkedin = features.has_linkedin
                 
                 score = 0
                 if has_email:
@@ -183,7 +203,7 @@ def evaluate_section_scores(sections: Dict[str, str]) -> Tuple[float, List[Secti
                     feedback += "incomplete or poorly formatted."
             
             elif section_name == "summary":
-                word_count = len(section_content.split())
+                word_count = features.word_count
                 
                 if 50 <= word_count <= 200:
                     score = max_score
@@ -196,9 +216,9 @@ def evaluate_section_scores(sections: Dict[str, str]) -> Tuple[float, List[Secti
                     feedback = "Summary is too long, consider condensing."
             
             elif section_name == "experience":
-                has_dates = bool(re.search(FORMAT_PATTERNS["dates_consistent"], section_content))
-                has_bullets = bool(re.search(FORMAT_PATTERNS["bullet_points"], section_content))
-                has_action_verbs = bool(re.search(FORMAT_PATTERNS["action_verbs"], section_content))
+                has_dates = features.has_date_range
+                has_bullets = features.has_bullets(SCORING_BULLETS)
+                has_action_verbs = features.action_verb_count > 0
                 
                 score = 0
                 if has_dates:
@@ -217,9 +237,9 @@ def evaluate_section_scores(sections: Dict[str, str]) -> Tuple[float, List[Secti
                     feedback += "poorly structured or missing key elements."
             
             elif section_name == "education":
-                has_institution = bool(re.search(r'(University|College|Institute|School)', section_content, re.IGNORECASE))
-                has_degree = bool(re.search(r'(Bachelor|Master|PhD|Doctorate|BSc|BA|MS|MA|MBA)', section_content, re.IGNORECASE))
-                has_dates = bool(re.search(r'\b(19|20)\d{2}\b', section_content))
+                has_institution = features.has_institution
+                has_degree = features.has_degree
+                has_dates = features.has_year
                 
                 score = 0
                 if has_institution:
@@ -239,7 +259,7 @@ def evaluate_section_scores(sections: Dict[str, str]) -> Tuple[float, List[Secti
             
             elif section_name == "skills":
                 # Check for organized skills
-                skill_count = len(re.findall(r',|\n|\•|\*|\-', section_content)) + 1
+                skill_count = features.comma_count + features.newline_count + features.bullet_count(SKILL_SEPARATORS) + 1
                 
                 if skill_count >= 10:
                     score = max_score
@@ -306,14 +326,14 @@ def calculate_content_match_score(
     # Combine skills from resume
     resume_skills = resume_keywords.hard_skills + resume_keywords.soft_skills
     
-    # Calculate matches
-    matched_required = [skill for skill in job_requirements.required_skills if any(
-        re.search(rf'\b{re.escape(skill)}\b', rs, re.IGNORECASE) for rs in resume_skills
-    )]
+    # Index the resume skills once; each job skill is then a set lookup
+    skill_index = PhraseIndex.for_phrases(
+        resume_skills, job_requirements.required_skills + job_requirements.preferred_skills
+    )
     
-    matched_preferred = [skill for skill in job_requirements.preferred_skills if any(
-        re.search(rf'\b{re.escape(skill)}\b', rs, re.IGNORECASE) for rs in resume_skills
-    )]
+    # Calculate matches
+    matched_required = [skill for skill in job_requirements.required_skills if skill_index.contains(skill)]
+    matched_preferred = [skill for skill in job_requirements.preferred_skills if skill_index.contains(skill)]
     
     # Calculate missing skills
     missing_required = [skill for skill in job_requirements.required_skills if skill not in matched_required]
@@ -329,8 +349,9 @@ def calculate_content_match_score(
     # Calculate education match
     education_match = 0.0
     if job_requirements.education_required and resume_keywords.education:
+        education_index = PhraseIndex.for_phrases(resume_keywords.education, job_requirements.education_required)
         for edu_req in job_requirements.education_required:
-            if any(re.search(rf'\b{re.escape(edu_req)}\b', edu, re.IGNORECASE) for edu in resume_keywords.education):
+            if education_index.contains(edu_req):
                 education_match = 1.0
                 break
     else:
@@ -423,7 +444,8 @@ def calculate_overall_impression_score(
 def generate_improvement_suggestions(
     content_match: ContentMatch,
     format_compatibility: FormatCompatibility,
-    section_analysis: SectionAnalysis
+    section_analysis: SectionAnalysis,
+    core_only: bool = False
 ) -> List[str]:
     """
     Generate improvement suggestions based on scoring results
@@ -432,6 +454,7 @@ def generate_improvement_suggestions(
         content_match: Content match results
         format_compatibility: Format compatibility results
         section_analysis: Section analysis results
+        core_only: Only the missing skill and formatting suggestions (used under load)
         
     Returns:
         List of improvement suggestions
@@ -462,6 +485,9 @@ def generate_improvement_suggestions(
         elif "pdf" in issue.lower():
             suggestions.append("Ensure your PDF contains searchable text rather than scanned images")
     
+    if core_only:
+        return suggestions[:10]
+    
     # Add section-specific suggestions
     weak_sections = [s for s in section_analysis.sections if s.score < (s.max_score * 0.7)]
     for section in weak_sections[:3]:
@@ -482,30 +508,25 @@ def generate_improvement_suggestions(
     return suggestions[:10]
 
 
-def calculate_resume_score(
+def score_resume_components(
     resume_text: str,
-    resume_filename: str,
     resume_keywords: KeywordAnalysis,
     job_requirements: JobRequirements,
-    job_title: str,
     file_type: str
-) -> ResumeScoreResponse:
+) -> Tuple[ContentMatch, FormatCompatibility, SectionAnalysis, OverallScore, float]:
     """
-    Calculate the complete resume score across all dimensions
+    Score a resume on every dimension without building the full response
     
     Args:
         resume_text: The text content of the resume
-        resume_filename: The name of the resume file
         resume_keywords: Keywords extracted from the resume
         job_requirements: Requirements extracted from the job description
-        job_title: The job title
         file_type: The file type of the resume
         
     Returns:
-        Complete resume score response
+        Tuple containing content match, format compatibility, section analysis,
+        overall impression and the total score
     """
-    logger.info(f"Calculating score for resume: {resume_filename}")
-    
     # Identify sections in the resume
     sections = identify_resume_sections(resume_text)
     
@@ -550,24 +571,177 @@ def calculate_resume_score(
     # Calculate total score
     total_score = content_score + format_score + section_score + overall_score
     
-    # Generate improvement suggestions
-    suggestions = generate_improvement_suggestions(
-        content_match, format_compatibility, section_analysis
+    return content_match, format_compatibility, section_analysis, overall, total_score
+
+
+class ResumeAnalysis(NamedTuple):
+    """Everything computed for one resume at a given analysis level."""
+    content_match: ContentMatch
+    format_compatibility: FormatCompatibility
+    section_analysis: SectionAnalysis
+    overall: OverallScore
+    total_score: float
+    suggestions: List[str]
+    similarity_score: Optional[float]
+    layout_analysis: Dict[str, float]
+
+
+def analyze_resume(
+    resume_text: str,
+    resume_keywords: KeywordAnalysis,
+    job_requirements: JobRequirements,
+    file_type: str,
+    analysis_level: AnalysisLevel = AnalysisLevel.STANDARD,
+    degradation: DegradationLevel = DegradationLevel.NONE
+) -> ResumeAnalysis:
+    """
+    Run the analyses of one analysis level
+    
+    Args:
+        resume_text: The text content of the resume
+        resume_keywords: Keywords extracted from the resume
+        job_requirements: Requirements extracted from the job description
+        file_type: The file type of the resume
+        analysis_level: quick skips suggestions, deep adds similarity and layout analysis
+        degradation: Optional work to skip under load (see DegradationLevel)
+        
+    Returns:
+        Component scores, suggestions and the deep-only results (None / empty below deep)
+    """
+    content_match, format_compatibility, section_analysis, overall, total_score = score_resume_components(
+        resume_text, resume_keywords, job_requirements, file_type
     )
     
+    suggestions = []
+    if includes_recommendations(analysis_level):
+        suggestions = generate_improvement_suggestions(
+            content_match, format_compatibility, section_analysis,
+            core_only=degradation >= DegradationLevel.MINIMAL
+        )
+    
+    similarity_score = None
+    layout = {}
+    if includes_deep_analysis(analysis_level) and degradation < DegradationLevel.REDUCED:
+        similarity_score = semantic_similarity(resume_text, job_requirements_text(job_requirements))
+        layout = layout_analysis(resume_text)
+    
+    return ResumeAnalysis(
+        content_match, format_compatibility, section_analysis, overall, total_score,
+        suggestions, similarity_score, layout
+    )
+
+
+def calculate_resume_score(
+    resume_text: str,
+    resume_filename: str,
+    resume_keywords: KeywordAnalysis,
+    job_requirements: JobRequirements,
+    job_title: str,
+    file_type: str,
+    analysis_level: AnalysisLevel = AnalysisLevel.STANDARD
+) -> ResumeScoreResponse:
+    """
+    Calculate the complete resume score across all dimensions
+    
+    Args:
+        resume_text: The text content of the resume
+        resume_filename: The name of the resume file
+        resume_keywords: Keywords extracted from the resume
+        job_requirements: Requirements extracted from the job description
+        job_title: The job title
+        file_type: The file type of the resume
+        analysis_level: Depth of the analysis (see analyze_resume)
+        
+    Returns:
+        Complete resume score response
+    """
+    response, _ = calculate_resume_score_with_cache_status(
+        resume_text, resume_filename, resume_keywords, job_requirements, job_title, file_type, analysis_level
+    )
+    return response
+
+
+def calculate_resume_score_with_cache_status(
+    resume_text: str,
+    resume_filename: str,
+    resume_keywords: KeywordAnalysis,
+    job_requirements: JobRequirements,
+    job_title: str,
+    file_type: str,
+    analysis_level: AnalysisLevel = AnalysisLevel.STANDARD
+) -> Tuple[ResumeScoreResponse, bool]:
+    """
+    Calculate the resume score, reusing a memoized response for identical inputs
+    
+    While the service is overloaded, optional analysis is skipped and the
+    response is marked degraded; degraded responses are not memoized.
+    
+    Returns:
+        The score response and whether it came from the response cache
+    """
+    analysis_level = AnalysisLevel(analysis_level)
+    cache = get_response_cache()
+    key = None
+    if cache is not None:
+        key = response_cache_key(
+            "calculate_resume_score",
+            content_hash(resume_text, resume_keywords),
+            content_hash(job_requirements, job_title),
+            file_type,
+            analysis_level.value
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info(f"Serving cached score for resume: {resume_filename}")
+            # The same content may have been cached under another file name
+            cached.filename = resume_filename
+            return cached, True
+
+    degradation = DegradationLevel.NONE
+    if settings.DEGRADATION_ENABLED:
+        degradation = applied_degradation(analysis_level, get_load_monitor().level())
+    
+    logger.info(
+        f"Calculating {analysis_level.value} score for resume: {resume_filename}"
+        + (f" (degraded: {degradation.name.lower()})" if degradation else "")
+    )
+    started = time.perf_counter()
+    
+    analysis = analyze_resume(resume_text, resume_keywords, job_requirements, file_type, analysis_level, degradation)
+    
     # Create response
     response = ResumeScoreResponse(
-        timestamp=datetime.datetime.now(),
+        success=True,
         filename=resume_filename,
-        content_match=content_match,
-        format_compatibility=format_compatibility,
-        section_analysis=section_analysis,
-        overall_score=overall,
-        total_score=total_score,
-        keyword_analysis=resume_keywords,
-        job_requirements=job_requirements,
-        improvement_suggestions=suggestions
+        overall_score=round(analysis.total_score, 2),
+        content_score=analysis.content_match.score,
+        format_score=analysis.format_compatibility.score,
+        section_scores={
+            section.name.lower().replace(' ', '_'): section.score
+            for section in analysis.section_analysis.sections
+        },
+        recommendations=analysis.suggestions,
+        analysis_level=analysis_level,
+        similarity_score=analysis.similarity_score,
+        layout_analysis=analysis.layout_analysis,
+        breakdown={
+            "content_match": {"score": analysis.content_match.score, "max_score": 40.0},
+            "format_compatibility": {"score": analysis.format_compatibility.score, "max_score": 20.0},
+            "section_analysis": {"score": analysis.section_analysis.score, "max_score": 30.0},
+            "overall": {"score": analysis.overall.score, "max_score": 10.0}
+        }
     )
     
-    logger.info(f"Resume score calculated: {total_score}/100")
-    return response
\ No newline at end of file
+    elapsed = time.perf_counter() - started
+    record_analysis_latency(analysis_level, elapsed)
+    budget_ms = latency_budget_ms(analysis_level)
+    get_load_monitor().observe(elapsed, budget_ms / 1000 if budget_ms else None)
+    logger.info(f"Resume score calculated: {analysis.total_score}/100")
+    
+    if degradation:
+        response.degraded = True
+        response.degradation_level = degradation
+        metrics.increment(f"degraded_responses_{degradation.name.lower()}")
+    elif cache is not None:
+        cache.put(key, response)
+    return response, False
@@ -0,0 +1,158 @@
+import re
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Words of a header line; "&" and "/" are kept so "Honors & Awards" tokenizes cleanly
+_HEADER_TOKEN = re.compile(r"[^\W_]+|[&/]")
+# Decoration tolerated before a header ("## Skills") and after it ("SKILLS:", "Skills --")
+_LEADING_DECORATION = " \t#*=>"
+_TRAILING_DECORATION = " \t\r:-–—=|*#"
+_INLINE_SEPARATORS = ":–—|"
+
+_TERMINAL = "\0"
+
+
+class SectionSpan(NamedTuple):
+    """Location of one section in a document."""
+    name: str
+    header_start: int
+    start: int
+    end: int
+
+
+class SectionSegmenter:
+    """
+    Split a document into sections in a single line-oriented pass.
+
+    Header phrases are compiled once into a token trie. Each line is checked
+    by walking the trie from its first word, so the cost of a pass grows with
+    the document length and not with the number of headers. A line is a
+    header when a header phrase is all it contains (apart from decoration
+    such as a trailing colon), or, with ``allow_inline``, when the phrase is
+    followed by a separator and the section content ("Skills: Python, SQL").
+    """
+
+    def __init__(self, headers: Dict[str, Iterable[str]], allow_inline: bool = True):
+        """
+        Args:
+            headers: Mapping of section name to the header phrases that open it
+            allow_inline: Accept "Header: content" lines as section starts
+        """
+        self.allow_inline = allow_inline
+        self._trie: Dict[str, dict] = {}
+        self.max_header_words = 0
+
+        for name, phrases in headers.items():
+            for phrase in phrases:
+                tokens = _HEADER_TOKEN.findall(phrase.lower())
+                if not tokens:
+                    continue
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node.setdefault(_TERMINAL, name)
+                self.max_header_words = max(self.max_header_words, len(tokens))
+
+    def match_header(self, line: str) -> Optional[Tuple[str, int]]:
+        """
+        Check whether a line opens a section
+
+        Args:
+            line: A single line of text, without its newline
+
+        Returns:
+            Tuple of section name and the offset in the line where the section
+            content starts, or None if the line is not a header
+        """
+        position = len(line) - len(line.lstrip(_LEADING_DECORATION))
+        node = self._trie
+        best: Optional[Tuple[str, int]] = None
+
+        for _ in range(self.max_header_words):
+            token = _HEADER_TOKEN.match(line, position)
+            word = token.group().lower() if token else None
+            if word not in node:
+                break
+            node = node[word]
+            position = token.end()
+            if _TERMINAL in node:
+                best = (node[_TERMINAL], position)
+            # Only whitespace may separate the words of a header phrase
+            next_position = position
+            while next_position < len(line) and line[next_position] in " \t":
+                next_position += 1
+            if next_position == position:
+                break
+            position = next_position
+
+        if best is None:
+            return None
+
+        name, header_end = best
+        rest = line[header_end:]
+        if not rest.strip(_TRAILING_DECORATION):
+            return name, len(line)
+
+        stripped = rest.lstrip(" \t")
+        if self.allow_inline and stripped[:1] in _INLINE_SEPARATORS:
+            return name, len(line) - len(stripped) + 1
+        return None
+
+    def segment(self, text: str) -> List[SectionSpan]:
+        """
+        Find all sections in a document
+
+        Args:
+            text: Document text
+
+        Returns:
+            Section spans in document order; each section ends where the next
+            one's header starts (or at the end of the text)
+        """
+        spans: List[SectionSpan] = []
+        open_section: Optional[Tuple[str, int, int]] = None
+        line_start = 0
+        length = len(text)
+
+        while line_start <= length:
+            line_end = text.find("\n", line_start)
+            if line_end == -1:
+                line_end = length
+            line = text[line_start:line_end]
+
+            header = self.match_header(line) if line.strip() else None
+            if header is not None:
+                if open_section is not None:
+                    spans.append(SectionSpan(open_section[0], open_section[1], open_section[2], line_start))
+                name, content_offset = header
+                content_start = line_start + content_offset
+                if content_offset >= len(line):
+                    content_start = min(line_end + 1, length)
+                open_section = (name, line_start, content_start)
+
+            line_start = line_end + 1
+
+        if open_section is not None:
+            spans.append(SectionSpan(open_section[0], open_section[1], open_section[2], length))
+        return spans
+
+    def sections(self, text: str, include_header: bool = False) -> Dict[str, str]:
+        """
+        Extract section contents
+
+        Args:
+            text: Document text
+            include_header: Keep the header line at the start of each section
+
+        Returns:
+            Mapping of section name to stripped content; when a section occurs
+            more than once, the first occurrence is kept
+        """
+        result: Dict[str, str] = {}
+        for span in self.segment(text):
+            if span.name not in result:
+                start = span.header_start if include_header else span.start
+                result[span.name] = text[start:span.end].strip()
+        return result
@@ -0,0 +1,156 @@
+"""
+Coalescing of identical concurrent requests, and idempotency-key replay.
+
+SingleFlight runs one computation per key at a time: a request whose key is
+already being computed waits for that computation instead of starting its
+own, and every waiter receives the same result (or exception). Requests
+carrying a client Idempotency-Key additionally get the stored result of an
+earlier request with the same key for IDEMPOTENCY_RETENTION_SECONDS, as long
+as the request itself is the same; reusing a key for a different request is
+an error.
+
+A computation is cancelled only when every caller waiting for it has gone
+away (e.g. all of their clients disconnected); while one caller remains, the
+others leaving does not affect it.
+
+Both work per process and per event loop, which is where the API serves
+requests; duplicates landing on different workers are still answered from
+the shared response cache once the first one finishes.
+"""
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+from ..core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+LEADER = "leader"
+FOLLOWER = "follower"
+REPLAYED = "replayed"
+
+
+class IdempotencyKeyMismatch(ValueError):
+    """An idempotency key was reused for a request with different content."""
+
+
+class _StoredResult(NamedTuple):
+    fingerprint: str
+    expires: float
+    value: Any
+
+
+class SingleFlight:
+    """Per-key coalescing of concurrent async computations, with idempotency-key retention."""
+
+    def __init__(self, name: str, retention_seconds: float = 0.0, max_retained: int = 10_000):
+        """
+        Args:
+            name: Prefix of the metrics recorded for this group
+            retention_seconds: How long results of requests with an idempotency key are kept
+            max_retained: Maximum number of retained idempotency-key results
+        """
+        self.name = name
+        self.retention_seconds = retention_seconds
+        self.max_retained = max_retained
+        self._in_flight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._waiters: Dict[str, int] = {}
+        self._retained: "OrderedDict[str, _StoredResult]" = OrderedDict()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def _retained_result(self, idempotency_key: str, fingerprint: str) -> Optional[_StoredResult]:
+        now = time.monotonic()
+        while self._retained:
+            oldest = next(iter(self._retained.values()))
+            if oldest.expires > now:
+                break
+            self._retained.popitem(last=False)
+
+        stored = self._retained.get(idempotency_key)
+        if stored is not None and stored.fingerprint != fingerprint:
+            metrics.increment(f"{self.name}_idempotency_conflicts")
+            raise IdempotencyKeyMismatch(f"Idempotency key {idempotency_key!r} was already used for a different request")
+        return stored
+
+    def _retain(self, idempotency_key: str, fingerprint: str, value: Any) -> None:
+        self._retained[idempotency_key] = _StoredResult(fingerprint, time.monotonic() + self.retention_seconds, value)
+        self._retained.move_to_end(idempotency_key)
+        while len(self._retained) > self.max_retained:
+            self._retained.popitem(last=False)
+
+    def _forget(self, key: str, task: "asyncio.Task[Any]") -> None:
+        """Drop key's entry, unless a newer computation has taken it over."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            self._waiters.pop(key, None)
+
+    def _leave(self, key: str) -> int:
+        """Drop one waiter of key; returns how many remain."""
+        remaining = self._waiters.get(key, 1) - 1
+        if key in self._waiters:
+            self._waiters[key] = remaining
+        return remaining
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        idempotency_key: Optional[str] = None
+    ) -> Tuple[Any, str]:
+        """
+        Run func once for all concurrent callers with the same key
+
+        Args:
+            key: Fingerprint of the request (e.g. a content hash of its inputs)
+            func: Coroutine function computing the result
+            idempotency_key: Optional client-supplied key; its result is replayed
+                to later requests with the same key and fingerprint
+
+        Returns:
+            The result and how it was obtained: "leader" (computed for this
+            call), "follower" (shared with a concurrent identical call) or
+            "replayed" (stored result of an earlier call with the same
+            idempotency key)
+
+        Raises:
+            IdempotencyKeyMismatch: If the idempotency key was used for a different request
+            Whatever func raised, for the leader and every follower
+        """
+        if idempotency_key and self.retention_seconds > 0:
+            stored = self._retained_result(idempotency_key, key)
+            if stored is not None:
+                metrics.increment(f"{self.name}_replayed")
+                return stored.value, REPLAYED
+
+        task = self._in_flight.get(key)
+        role = FOLLOWER
+        if task is None:
+            role = LEADER
+            task = self._in_flight[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            metrics.increment(f"{self.name}_coalesced")
+            logger.info(f"Attaching to in-flight {self.name} computation {key[:12]}")
+
+        # A caller that goes away must not cancel the computation others wait for,
+        # but the last one to leave cancels it. The key is released right away, as
+        # the task may take a while to unwind and a new caller must not attach to it
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            value = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._leave(key) == 0 and not task.done():
+                metrics.increment(f"{self.name}_cancelled")
+                logger.info(f"Cancelling {self.name} computation {key[:12]}: no callers left")
+                self._forget(key, task)
+                task.cancel()
+            raise
+        self._leave(key)
+        if idempotency_key and self.retention_seconds > 0:
+            self._retain(idempotency_key, key, value)
+        return value, role
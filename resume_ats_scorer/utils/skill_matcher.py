@@ -0,0 +1,128 @@
+import re
+import logging
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if the character is part of a word (same rule as regex \\w)."""
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton that finds every vocabulary skill in a text.
+
+    The automaton is compiled once from the vocabulary, so a lookup is a
+    single linear scan over the text regardless of how many skills the
+    vocabulary contains. Matches are only reported on word boundaries, so
+    "java" does not match inside "javascript". Aliases are compiled into the
+    same automaton and reported under their canonical skill.
+    """
+
+    def __init__(self, skills: Iterable[str], aliases: Optional[Dict[str, str]] = None):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._patterns: List[str] = []
+        self._labels: List[str] = []
+
+        seen = set()
+        terms = [(skill, skill) for skill in skills] + list((aliases or {}).items())
+        for term, label in terms:
+            pattern = self.normalize(term)
+            if pattern and pattern not in seen:
+                seen.add(pattern)
+                self._add_pattern(pattern, self.normalize(label))
+
+        self._build_failure_links()
+        logger.debug(f"Compiled skill matcher with {len(self._patterns)} patterns and {len(self._goto)} states")
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase text and collapse whitespace runs into single spaces."""
+        return _WHITESPACE_PATTERN.sub(' ', text.lower()).strip()
+
+    @property
+    def patterns(self) -> List[str]:
+        """Normalized skills and aliases compiled into the automaton."""
+        return list(self._patterns)
+
+    def _add_pattern(self, pattern: str, label: str) -> None:
+        """Insert a normalized pattern into the goto trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+
+        self._output[state] = self._output[state] + (len(self._patterns),)
+        self._patterns.append(pattern)
+        self._labels.append(label)
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _on_boundary(self, text: str, start: int, end: int, pattern: str) -> bool:
+        """Check that a match is not glued to surrounding word characters."""
+        if start > 0 and _is_word_char(pattern[0]) and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(pattern[-1]) and _is_word_char(text[end]):
+            return False
+        return True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield every skill occurrence in the text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Iterator of (start, end, skill) tuples with offsets into the
+            normalized text; skill is the canonical label of the pattern
+        """
+        text = self.normalize(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        patterns, labels = self._patterns, self._labels
+
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for pattern_id in output[state]:
+                pattern = patterns[pattern_id]
+                start = index - len(pattern) + 1
+                if self._on_boundary(text, start, index + 1, pattern):
+                    yield start, index + 1, labels[pattern_id]
+
+    def find_skills(self, text: str) -> List[str]:
+        """Return the distinct skills found in the text, in order of first occurrence."""
+        found = {}
+        for _, _, skill in self.iter_matches(text):
+            found.setdefault(skill, None)
+        return list(found)
+
@@ -0,0 +1,230 @@
+import os
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import settings
+from ..core.exceptions import TaxonomyError
+from .fuzzy_matcher import FuzzySkillMatcher
+from .skill_matcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent.parent / "data" / "skill_taxonomy.json"
+
+SKILL_TYPES = ("hard", "soft")
+
+# Key marking the end of a phrase in the token trie
+_TERMINAL = ""
+
+
+@dataclass(frozen=True)
+class Skill:
+    """A canonical skill entry from the taxonomy."""
+    id: str
+    aliases: Tuple[str, ...]
+    category: str
+    type: str
+
+
+class SkillTaxonomy:
+    """
+    Compiled in-memory index over a versioned skill taxonomy.
+
+    Holds a normalized alias -> canonical id map for single-term lookups, a
+    multi-token phrase trie for matching token streams, Aho-Corasick
+    matchers for scanning free text and a symmetric-delete index for
+    typo-tolerant lookups. Instances are immutable once built, so
+    a reload builds a new instance and swaps the reference.
+    """
+
+    def __init__(self, version: str, skills: Sequence[Skill], source: Optional[str] = None):
+        self.version = version
+        self.source = source
+        self.skills: Dict[str, Skill] = {skill.id: skill for skill in skills}
+
+        self._alias_index: Dict[str, str] = {}
+        self._phrase_trie: Dict[str, Any] = {}
+        for skill in skills:
+            for term in (skill.id,) + skill.aliases:
+                normalized = SkillMatcher.normalize(term)
+                existing = self._alias_index.get(normalized)
+                if existing and existing != skill.id:
+                    raise TaxonomyError(f"Alias '{term}' maps to both '{existing}' and '{skill.id}'")
+                self._alias_index[normalized] = skill.id
+                self._insert_phrase(normalized.split(' '), skill.id)
+
+        self._matchers: Dict[Optional[str], SkillMatcher] = {}
+        for skill_type in (None,) + SKILL_TYPES:
+            selected = [skill for skill in skills if skill_type is None or skill.type == skill_type]
+            self._matchers[skill_type] = SkillMatcher(
+                [skill.id for skill in selected],
+                aliases={alias: skill.id for skill in selected for alias in skill.aliases}
+            )
+
+        self.fuzzy = FuzzySkillMatcher(
+            {term: skill.id for skill in skills for term in (skill.id,) + skill.aliases}
+        )
+
+    def _insert_phrase(self, tokens: List[str], skill_id: str) -> None:
+        """Add a tokenized term to the phrase trie."""
+        node = self._phrase_trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[_TERMINAL] = skill_id
+
+    def canonicalize(self, term: str) -> Optional[str]:
+        """Return the canonical skill id for a skill name or alias, if known."""
+        return self._alias_index.get(SkillMatcher.normalize(term))
+
+    def get(self, skill_id: str) -> Optional[Skill]:
+        """Return the skill entry for a canonical id."""
+        return self.skills.get(skill_id)
+
+    def skills_of_type(self, skill_type: str) -> List[str]:
+        """Return the canonical ids of all hard or soft skills."""
+        return [skill.id for skill in self.skills.values() if skill.type == skill_type]
+
+    def matcher(self, skill_type: Optional[str] = None) -> SkillMatcher:
+        """Return the compiled text matcher for all skills or a single skill type."""
+        return self._matchers[skill_type]
+
+    def match_tokens(self, tokens: Sequence[str]) -> List[str]:
+        """
+        Find skills in a token stream using the phrase trie
+
+        Args:
+            tokens: Normalized (lowercase) tokens
+
+        Returns:
+            Canonical skill ids in order of occurrence, preferring the
+            longest phrase at each position
+        """
+        found = []
+        index = 0
+        while index < len(tokens):
+            node = self._phrase_trie
+            longest: Optional[Tuple[int, str]] = None
+            position = index
+            while position < len(tokens) and tokens[position] in node:
+                node = node[tokens[position]]
+                position += 1
+                if _TERMINAL in node:
+                    longest = (position, node[_TERMINAL])
+
+            if longest:
+                index, skill_id = longest
+                found.append(skill_id)
+            else:
+                index += 1
+
+        return found
+
+
+def load_taxonomy(path: Optional[str] = None) -> SkillTaxonomy:
+    """
+    Load and compile a skill taxonomy file
+
+    Args:
+        path: Path to the taxonomy JSON file; defaults to the bundled file
+
+    Returns:
+        Compiled skill taxonomy
+    """
+    taxonomy_path = Path(path) if path else DEFAULT_TAXONOMY_PATH
+    try:
+        with open(taxonomy_path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+    except (OSError, ValueError) as e:
+        raise TaxonomyError(f"Could not read skill taxonomy {taxonomy_path}: {str(e)}")
+
+    if "version" not in document or not isinstance(document.get("skills"), list):
+        raise TaxonomyError(f"Skill taxonomy {taxonomy_path} must define 'version' and a 'skills' list")
+
+    skills = []
+    for entry in document["skills"]:
+        skill_type = entry.get("type", "hard")
+        if "id" not in entry or skill_type not in SKILL_TYPES:
+            raise TaxonomyError(f"Invalid skill entry in {taxonomy_path}: {entry}")
+        skills.append(Skill(
+            id=SkillMatcher.normalize(entry["id"]),
+            aliases=tuple(entry.get("aliases", [])),
+            category=entry.get("category", "other"),
+            type=skill_type
+        ))
+
+    taxonomy = SkillTaxonomy(str(document["version"]), skills, source=str(taxonomy_path))
+    logger.info(f"Loaded skill taxonomy version {taxonomy.version} with {len(skills)} skills from {taxonomy_path}")
+    return taxonomy
+
+
+_current_taxonomy: Optional[SkillTaxonomy] = None
+_current_mtime: Optional[float] = None
+_last_checked = 0.0
+_reload_lock = threading.Lock()
+
+
+def _taxonomy_path() -> Path:
+    return Path(settings.SKILL_TAXONOMY_PATH) if settings.SKILL_TAXONOMY_PATH else DEFAULT_TAXONOMY_PATH
+
+
+def reload_taxonomy() -> SkillTaxonomy:
+    """
+    Rebuild the taxonomy index from disk and swap it in atomically.
+
+    The new index is fully compiled before the shared reference is replaced,
+    so concurrent readers see either the old or the new version, never a
+    partially built one. If loading fails the previous index stays active.
+    """
+    global _current_taxonomy, _current_mtime, _last_checked
+    with _reload_lock:
+        path = _taxonomy_path()
+        try:
+            mtime = os.path.getmtime(path)
+            taxonomy = load_taxonomy(str(path))
+        except (OSError, TaxonomyError) as e:
+            if _current_taxonomy is None:
+                raise TaxonomyError(f"Could not load skill taxonomy {path}: {str(e)}")
+            logger.error(f"Keeping skill taxonomy version {_current_taxonomy.version}, reload failed: {str(e)}")
+            _last_checked = time.monotonic()
+            return _current_taxonomy
+
+        _current_taxonomy = taxonomy
+        _current_mtime = mtime
+        _last_checked = time.monotonic()
+        return taxonomy
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """
+    Return the active skill taxonomy.
+
+    Every worker process checks the taxonomy file's modification time at most
+    once per SKILL_TAXONOMY_RELOAD_INTERVAL and hot-swaps the index when the
+    file has changed, so taxonomy updates roll out without restarts.
+    """
+    global _last_checked
+    taxonomy = _current_taxonomy
+    if taxonomy is None:
+        return reload_taxonomy()
+
+    interval = settings.SKILL_TAXONOMY_RELOAD_INTERVAL
+    if interval > 0 and time.monotonic() - _last_checked >= interval:
+        try:
+            changed = os.path.getmtime(_taxonomy_path()) != _current_mtime
+        except OSError:
+            changed = False
+        if changed:
+            return reload_taxonomy()
+        _last_checked = time.monotonic()
+
+    return taxonomy
+
+
+def get_skill_matcher(skill_type: Optional[str] = None) -> SkillMatcher:
+    """Return the text matcher compiled from the active taxonomy."""
+    return get_taxonomy().matcher(skill_type)
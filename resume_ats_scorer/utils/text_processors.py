@@ -7,9 +7,15 @@ from pdfminer.high_level import extract_text as pdf_extract_text
 import docx2txt
 from bs4 import BeautifulSoup
 import nltk
-from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
+
+from ..models.schemas import JobSource
+from .format_analyzer import analyze_format
+from .idf import weighted_match_ratio
+from .job_posting_parsers import parse_structured_posting
+from .section_segmenter import SectionSegmenter
+from .skill_taxonomy import get_skill_matcher
+from .token_cache import get_token_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -100,16 +106,11 @@ class TextExtractor:
 
 class KeywordExtractor:
     """Extract keywords from text."""
-    
+
     def __init__(self):
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
-        # Add common words that aren't useful for ATS matching
-        self.stop_words.update([
-            'resume', 'curriculum', 'vitae', 'cv', 'page', 'contact',
-            'email', 'phone', 'address', 'linkedin', 'github'
-        ])
-    
+        # Lemmatization and stopword checks go through the shared token cache
+        self.token_cache = get_token_cache()
+
     def preprocess_text(self, text: str) -> str:
         """Preprocess text for keyword extraction."""
         # Convert to lowercase
@@ -127,11 +128,15 @@ class KeywordExtractor:
         # Tokenize
         tokens = word_tokenize(preprocessed_text)
         
-        # Remove stopwords and lemmatize
-        filtered_tokens = [
-            self.lemmatizer.lemmatize(token) for token in tokens
-            if token not in self.stop_words and len(token) > 2
-        ]
+        # Remove stopwords and lemmatize (memoized per distinct token)
+        normalize = self.token_cache.normalize
+        filtered_tokens = []
+        for token in tokens:
+            if len(token) <= 2:
+                continue
+            lemma, is_stop_word = normalize(token)
+            if not is_stop_word:
+                filtered_tokens.append(lemma)
         
         # Use spaCy for named entity recognition and noun chunks
         doc = nlp(preprocessed_text)
@@ -161,37 +166,8 @@ class KeywordExtractor:
     
     def extract_technical_skills(self, text: str) -> List[str]:
         """Extract technical skills from text."""
-        # Common programming languages, tools, frameworks, etc.
-        tech_keywords = {
-            'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php',
-            'html', 'css', 'sql', 'nosql', 'react', 'angular', 'vue',
-            'node.js', 'express', 'django', 'flask', 'spring', 'hibernate',
-            'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform',
-            'jenkins', 'git', 'github', 'gitlab', 'bitbucket', 'jira',
-            'agile', 'scrum', 'kanban', 'devops', 'ci/cd', 'rest', 'graphql',
-            'machine learning', 'deep learning', 'ai', 'data science',
-            'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas',
-            'numpy', 'scipy', 'matplotlib', 'seaborn', 'tableau', 'power bi',
-            'hadoop', 'spark', 'kafka', 'elasticsearch', 'mongodb', 'mysql',
-            'postgresql', 'oracle', 'sqlserver', 'redis', 'rabbitmq',
-            'react native', 'flutter', 'swift', 'kotlin', 'objective-c',
-            'android', 'ios', 'typescript', 'redux', 'vuex', 'webpack',
-            'sass', 'less', 'tailwind', 'bootstrap', 'material-ui',
-            'linux', 'bash', 'powershell', 'aws lambda', 'serverless',
-            'microservices', 'restful api', 'oauth', 'jwt', 'authentication',
-            'authorization', 'cybersecurity', 'blockchain', 'ethereum'
-        }
-        
-        # Preprocess text
-        preprocessed_text = self.preprocess_text(text)
-        
-        # Find technical skills in text
-        found_skills = []
-        for skill in tech_keywords:
-            if re.search(r'\b' + re.escape(skill) + r'\b', preprocessed_text):
-                found_skills.append(skill)
-        
-        return found_skills
+        # Single scan with the taxonomy's hard-skill automaton instead of one regex per skill
+        return get_skill_matcher("hard").find_skills(text)
 
 
 class SectionExtractor:
@@ -216,40 +192,17 @@ class SectionExtractor:
         text = re.sub(r'\r\n', '\n', text)  # Normalize newlines
         text = re.sub(r'\n+', '\n', text)   # Remove multiple consecutive newlines
         
-        # Create a list of section header patterns
-        section_patterns = {}
-        for section_name, headers in self.SECTION_HEADERS.items():
-            patterns = [re.escape(header) for header in headers]
-            # Match full words with variations in capitalization and optional following characters
-            section_patterns[section_name] = re.compile(
-                r'(?i)^(?:' + '|'.join(patterns) + r')[\s:]*$',
-                re.MULTILINE
-            )
-        
-        # Find the positions of all section headers
-        matches = []
-        for section_name, pattern in section_patterns.items():
-            for match in pattern.finditer(text):
-                matches.append((match.start(), match.end(), section_name))
-        
-        # Sort matches by position
-        matches.sort()
-        
-        # Extract text between section headers
-        for i, (start, end, section_name) in enumerate(matches):
-            # Section text goes from the end of this header to the start of the next one
-            section_start = end
-            if i < len(matches) - 1:
-                section_end = matches[i + 1][0]
-            else:
-                section_end = len(text)
-            
-            section_text = text[section_start:section_end].strip()
-            sections[section_name] = section_text
+        # Single pass over the lines, matching headers against the precompiled trie
+        for span in _SECTION_SEGMENTER.segment(text):
+            if span.name not in sections:
+                sections[span.name] = text[span.start:span.end].strip()
         
         return sections
 
 
+_SECTION_SEGMENTER = SectionSegmenter(SectionExtractor.SECTION_HEADERS)
+
+
 class JobDescriptionParser:
     """Parse job descriptions from various sources."""
     
@@ -303,17 +256,22 @@ class JobDescriptionParser:
         
         return requirements
     
+    def parse_job(self, job_text: str, source: JobSource = JobSource.OTHER) -> Dict[str, List[str]]:
+        """Parse a job description with its platform's structured parser, falling back to the generic one."""
+        requirements = parse_structured_posting(job_text, source)
+        if requirements is None:
+            requirements = self.extract_requirements(job_text)
+        return requirements
+    
     def parse_linkedin_job(self, job_text: str) -> Dict[str, List[str]]:
         """Parse a LinkedIn job description."""
-        # Currently uses the generic parser
-        # Could be extended with LinkedIn-specific patterns
-        return self.extract_requirements(job_text)
+        # Reads the Qualifications / Skills blocks when the LinkedIn template is recognized
+        return self.parse_job(job_text, JobSource.LINKEDIN)
     
     def parse_naukri_job(self, job_text: str) -> Dict[str, List[str]]:
         """Parse a Naukri job description."""
-        # Currently uses the generic parser
-        # Could be extended with Naukri-specific patterns
-        return self.extract_requirements(job_text)
+        # Reads the Key Skills / Education / Role fields when the Naukri template is recognized
+        return self.parse_job(job_text, JobSource.NAUKRI)
 
 
 class MatchingAlgorithm:
@@ -344,9 +302,8 @@ class MatchingAlgorithm:
         # Calculate matches
         matches = resume_keywords_set.intersection(job_keywords_set)
         
-        # Calculate score as percentage of job keywords found in resume
-        score = len(matches) / len(job_keywords_set)
-        return score
+        # Calculate score as IDF-weighted percentage of job keywords found in resume
+        return weighted_match_ratio(matches, job_keywords_set)
     
     def section_match_score(self, resume_sections: Dict[str, str], 
                             job_requirements: Dict[str, List[str]]) -> Dict[str, float]:
@@ -393,61 +350,40 @@ class MatchingAlgorithm:
 class ATSFormatChecker:
     """Check resume format for ATS compatibility."""
     
+    BULLET_SYMBOLS = ('•', '■', '○', '►', '✓', '✔', '-', '*')
+    
     def check_format(self, resume_text: str) -> Dict[str, float]:
         """Check resume format and return scores for ATS compatibility."""
         format_scores = {}
         
-        # Check for bullet points (preferred by ATS)
-        bullet_patterns = [r'•', r'■', r'○', r'►', r'✓', r'✔', r'-', r'\*']
-        has_bullets = any(re.search(pattern, resume_text) for pattern in bullet_patterns)
-        format_scores['bullet_points'] = 1.0 if has_bullets else 0.0
-        
-        # Check for consistent formatting of dates
-        date_patterns = [
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[\s\.]+ \d{4}\b',
-            r'\b\d{2}/\d{2}/\d{4}\b',
-            r'\b\d{4}-\d{2}-\d{2}\b',
-            r'\b\d{4}-\d{2}\b',
-            r'\b\d{2}/\d{4}\b'
-        ]
+        # All format features are collected in one pass over the text
+        features = analyze_format(resume_text)
         
-        date_formats = [set() for _ in range(len(date_patterns))]
-        for i, pattern in enumerate(date_patterns):
-            matches = re.findall(pattern, resume_text)
-            date_formats[i] = set(matches)
+        # Check for bullet points (preferred by ATS)
+        format_scores['bullet_points'] = 1.0 if features.has_bullets(self.BULLET_SYMBOLS) else 0.0
         
         # Check if dates are consistent (using only one format)
-        non_empty_formats = sum(1 for format_set in date_formats if format_set)
-        format_scores['date_consistency'] = 1.0 if non_empty_formats <= 1 else 0.5
+        format_scores['date_consistency'] = 1.0 if len(features.date_formats) <= 1 else 0.5
         
         # Check for appropriate section headers
-        section_headers = SectionExtractor.SECTION_HEADERS
-        section_patterns = []
-        for headers in section_headers.values():
-            section_patterns.extend([re.escape(header) for header in headers])
-        
-        section_pattern = r'(?i)^(?:' + '|'.join(section_patterns) + r')[\s:]*$'
-        sections_found = len(re.findall(section_pattern, resume_text, re.MULTILINE))
+        sections_found = len(_SECTION_SEGMENTER.segment(resume_text))
         format_scores['section_headers'] = min(1.0, sections_found / 4.0)  # At least 4 sections is ideal
         
         # Check for appropriate line spacing
-        newline_count = resume_text.count('\n')
-        text_length = len(resume_text)
+        newline_count = features.newline_count
+        text_length = features.length
         newline_ratio = newline_count / max(1, text_length)
         format_scores['line_spacing'] = 1.0 if 0.01 <= newline_ratio <= 0.05 else 0.5
         
         # Check for common ATS issues
         issues = []
         # Check for tables
-        if '|' in resume_text or '\t' in resume_text:
+        if features.has_table_chars:
             issues.append('tables')
         
         # Check for headers/footers (approximate)
-        lines = resume_text.split('\n')
-        if len(lines) > 10:
-            repeated_first_line = lines[0] == lines[-1]
-            if repeated_first_line:
-                issues.append('headers_footers')
+        if features.line_count > 10 and features.first_line_repeated:
+            issues.append('headers_footers')
         
         # Check for images (can't really detect in text, but we can check if text is too sparse)
         if text_length / max(1, newline_count) < 20:  # Average less than 20 chars per line
@@ -0,0 +1,150 @@
+"""
+Memoized token normalization shared by keyword extraction.
+
+The process-wide cache lives here rather than in text_processors so it can
+be created and warmed (e.g. at API startup) without loading spaCy.
+"""
+import logging
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from ..core.config import settings
+from ..core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Common words that aren't useful for ATS matching
+EXTRA_STOP_WORDS = [
+    'resume', 'curriculum', 'vitae', 'cv', 'page', 'contact',
+    'email', 'phone', 'address', 'linkedin', 'github'
+]
+
+
+class TokenNormalizationCache:
+    """
+    Bounded memo of token -> (normalized form, stopword flag).
+
+    Resume vocabulary is highly repetitive, so lemmatizing every token of
+    every document mostly recomputes the same results. Lookups go through a
+    C-implemented LRU cache; the cache can be warmed from a frequency list
+    so the most common tokens are hits from the first request.
+    """
+
+    def __init__(self, normalizer: Callable[[str], str], stop_words: Set[str], max_size: int = 100_000):
+        self._normalizer = normalizer
+        self._stop_words = frozenset(stop_words)
+        self.max_size = max_size
+        self._lookup = lru_cache(maxsize=max_size)(self._compute)
+        # Lookups made while warming are not counted towards the hit rate
+        self._warm_hits = 0
+        self._warm_misses = 0
+
+    def _compute(self, token: str) -> Tuple[str, bool]:
+        return self._normalizer(token), token in self._stop_words
+
+    def normalize(self, token: str) -> Tuple[str, bool]:
+        """Return the normalized form of a token and whether it is a stopword."""
+        return self._lookup(token)
+
+    def warm(self, tokens: Iterable[str]) -> int:
+        """
+        Pre-populate the cache
+
+        Args:
+            tokens: Tokens to normalize, most frequent first
+
+        Returns:
+            Number of tokens loaded
+        """
+        before = self._lookup.cache_info()
+        loaded = 0
+        for token in tokens:
+            if loaded >= self.max_size:
+                break
+            self._lookup(token)
+            loaded += 1
+
+        after = self._lookup.cache_info()
+        self._warm_hits += after.hits - before.hits
+        self._warm_misses += after.misses - before.misses
+        return loaded
+
+    def warm_from_file(self, path: str) -> int:
+        """
+        Warm the cache from a frequency list file
+
+        Args:
+            path: File with one token per line, optionally followed by a count
+                  ("token<whitespace>count"); lines are assumed sorted by frequency
+
+        Returns:
+            Number of tokens loaded
+        """
+        def read_tokens():
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.split()
+                    if parts:
+                        yield parts[0].lower()
+
+        loaded = self.warm(read_tokens())
+        logger.info(f"Warmed token normalization cache with {loaded} tokens from {path}")
+        return loaded
+
+    def clear(self) -> None:
+        """Drop all cached entries and statistics."""
+        self._lookup.cache_clear()
+        self._warm_hits = 0
+        self._warm_misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return request hits, misses, hit rate and current size."""
+        info = self._lookup.cache_info()
+        hits = info.hits - self._warm_hits
+        misses = info.misses - self._warm_misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+            "size": info.currsize,
+        }
+
+
+_token_cache: Optional[TokenNormalizationCache] = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenNormalizationCache:
+    """Return the process-wide token normalization cache, creating it on first use."""
+    global _token_cache
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                # NLTK data is only needed once the cache is created
+                from nltk.corpus import stopwords
+                from nltk.stem import WordNetLemmatizer
+
+                stop_words = set(stopwords.words('english'))
+                stop_words.update(EXTRA_STOP_WORDS)
+                cache = TokenNormalizationCache(
+                    WordNetLemmatizer().lemmatize,
+                    stop_words,
+                    max_size=settings.TOKEN_CACHE_SIZE
+                )
+                metrics.register_callback("token_cache_hit_rate", lambda: cache.stats()["hit_rate"])
+                metrics.register_callback("token_cache_size", lambda: cache.stats()["size"])
+                _token_cache = cache
+    return _token_cache
+
+
+def warm_token_cache() -> int:
+    """Warm the token cache from TOKEN_CACHE_WARM_PATH, if configured."""
+    if not settings.TOKEN_CACHE_WARM_PATH:
+        return 0
+    try:
+        return get_token_cache().warm_from_file(settings.TOKEN_CACHE_WARM_PATH)
+    except OSError as e:
+        logger.warning(f"Could not warm token cache from {settings.TOKEN_CACHE_WARM_PATH}: {e}")
+        return 0
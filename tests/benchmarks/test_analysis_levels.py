@@ -0,0 +1,97 @@
+import importlib.util
+import time
+import unittest
+
+import pytest
+
+from resume_ats_scorer.core.config import settings
+from resume_ats_scorer.models.schemas import AnalysisLevel, JobRequirements, KeywordAnalysis
+from resume_ats_scorer.utils.scoring import analyze_resume
+
+RESUME = "\n".join([
+    "Jane Doe",
+    "jane.doe@example.com | +1 555 123 4567 | linkedin.com/in/janedoe",
+    "",
+    "PROFESSIONAL SUMMARY",
+    "Backend engineer with 7 years of experience building Python services on AWS.",
+    "",
+    "EXPERIENCE",
+] + [
+    f"• Led migration of service {number} to Kubernetes, reducing deployment time by {number + 10}% (Jan 2019 - Mar 2021)"
+    for number in range(40)
+] + [
+    "",
+    "EDUCATION",
+    "B.S. Computer Science, State University, 2016",
+    "",
+    "SKILLS",
+    "Python, Django, AWS, Docker, Kubernetes, PostgreSQL, Terraform, Leadership, Communication",
+    "",
+    "CERTIFICATIONS",
+    "AWS Certified Solutions Architect, 2020",
+])
+
+KEYWORDS = KeywordAnalysis(
+    hard_skills=["python", "django", "aws", "docker", "kubernetes", "postgresql", "terraform"],
+    soft_skills=["leadership", "communication"],
+    education=["B.S. Computer Science"]
+)
+
+REQUIREMENTS = JobRequirements(
+    required_skills=["python", "aws", "kubernetes", "go"],
+    preferred_skills=["terraform", "kafka", "leadership"],
+    experience_required=5,
+    education_required=["bachelor"]
+)
+
+
+def _has_spacy_model() -> bool:
+    if importlib.util.find_spec("spacy") is None:
+        return False
+    import spacy
+    return spacy.util.is_package("en_core_web_sm")
+
+
+@pytest.mark.slow
+class TestAnalysisLevelBudgets(unittest.TestCase):
+    """Benchmark every analysis level against its configured latency budget."""
+
+    ROUNDS = 20
+
+    def _p95_ms(self, level: AnalysisLevel) -> float:
+        analyze_resume(RESUME, KEYWORDS, REQUIREMENTS, "pdf", level)  # warm caches and models
+        timings = []
+        for _ in range(self.ROUNDS):
+            started = time.perf_counter()
+            analyze_resume(RESUME, KEYWORDS, REQUIREMENTS, "pdf", level)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        return timings[int(0.95 * (len(timings) - 1))]
+
+    def _assert_within_budget(self, level: AnalysisLevel):
+        p95 = self._p95_ms(level)
+        budget = settings.ANALYSIS_LATENCY_BUDGETS_MS[level.value]
+        self.assertLess(p95, budget, f"{level.value}: p95 {p95:.1f}ms (budget {budget:.0f}ms)")
+
+    def test_quick_budget(self):
+        """Test that quick analysis stays within its budget and produces no suggestions."""
+        self._assert_within_budget(AnalysisLevel.QUICK)
+        analysis = analyze_resume(RESUME, KEYWORDS, REQUIREMENTS, "pdf", AnalysisLevel.QUICK)
+        self.assertEqual(analysis.suggestions, [])
+        self.assertIsNone(analysis.similarity_score)
+
+    def test_standard_budget(self):
+        """Test that standard analysis stays within its budget."""
+        self._assert_within_budget(AnalysisLevel.STANDARD)
+
+    @unittest.skipUnless(_has_spacy_model(), "spaCy model en_core_web_sm is not installed")
+    def test_deep_budget(self):
+        """Test that deep analysis stays within its budget and adds similarity and layout results."""
+        self._assert_within_budget(AnalysisLevel.DEEP)
+        analysis = analyze_resume(RESUME, KEYWORDS, REQUIREMENTS, "pdf", AnalysisLevel.DEEP)
+        self.assertIsNotNone(analysis.similarity_score)
+        self.assertIn("bullet_points", analysis.layout_analysis)
+
+
+if __name__ == "__main__":
+    unittest.main()
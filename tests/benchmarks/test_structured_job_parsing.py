@@ -0,0 +1,104 @@
+import asyncio
+import time
+import unittest
+
+import pytest
+
+from resume_ats_scorer.agents.job_description_parser import JobDescriptionParser
+from resume_ats_scorer.models.schemas import JobSource
+
+LINKEDIN_POSTING = "\n".join([
+    "About the job",
+] + [
+    f"Acme runs payments for merchant group {number}, with 3 teams in Berlin and a B.A. friendly culture."
+    for number in range(30)
+] + [
+    "",
+    "Responsibilities",
+] + [
+    f"- Operate service {number} in Python on AWS with 2 years of on-call history"
+    for number in range(20)
+] + [
+    "",
+    "Qualifications",
+    "- 5+ years of experience building backend services in Python",
+    "- Bachelor's degree in Computer Science or a related field",
+    "- Experience with Kubernetes, Docker and Terraform",
+    "",
+    "Benefits",
+    "- Competitive salary, equity and a yearly learning budget",
+])
+
+NAUKRI_POSTING = "\n".join([
+    "Senior Java Developer",
+    "Infotech Solutions Pvt Ltd",
+    "4-8 years",
+    "",
+    "Job description",
+] + [
+    f"Maintain Spring Boot module {number} for banking clients, a degree of ownership expected."
+    for number in range(40)
+] + [
+    "",
+    "Role: Software Developer",
+    "Industry Type: IT Services & Consulting",
+    "Role Category: Software Development",
+    "",
+    "Education",
+    "UG: B.Tech/B.E. in Computers",
+    "",
+    "Key Skills",
+    "Java, Spring Boot, Microservices, SQL, Hibernate, AWS",
+])
+
+
+@pytest.mark.slow
+class TestStructuredJobParsing(unittest.TestCase):
+    """Benchmark job description parsing with the LinkedIn / Naukri parsers against the generic extractor."""
+
+    ROUNDS = 200
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = JobDescriptionParser()
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def _parse(self, text: str, source: JobSource):
+        return self.loop.run_until_complete(self.parser.parse_job_description(text, source))
+
+    def _mean_ms(self, text: str, source: JobSource) -> float:
+        self._parse(text, source)  # warm the skill automaton
+        started = time.perf_counter()
+        for _ in range(self.ROUNDS):
+            self._parse(text, source)
+        return (time.perf_counter() - started) * 1000 / self.ROUNDS
+
+    def _compare(self, text: str, source: JobSource):
+        generic = self._mean_ms(text, JobSource.OTHER)
+        structured = self._mean_ms(text, source)
+        self.assertLess(
+            structured, generic,
+            f"{source.value}: structured {structured:.3f}ms, generic {generic:.3f}ms"
+        )
+        return self._parse(text, JobSource.OTHER), self._parse(text, source)
+
+    def test_linkedin(self):
+        """Test that the LinkedIn parser is faster and ignores mentions outside the qualification blocks."""
+        generic, structured = self._compare(LINKEDIN_POSTING, JobSource.LINKEDIN)
+        self.assertTrue(structured.metadata["structured"])
+        self.assertEqual(structured.keywords, ['python', 'kubernetes', 'docker', 'terraform'])
+        self.assertIn('aws', generic.keywords)
+
+    def test_naukri(self):
+        """Test that the Naukri parser is faster and reads skills from the Key Skills field."""
+        generic, structured = self._compare(NAUKRI_POSTING, JobSource.NAUKRI)
+        self.assertIn('hibernate', structured.keywords)
+        self.assertIn(('experience', '4-8 years'), [(req.category, req.description) for req in structured.requirements])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import time
+import unittest
+
+from resume_ats_scorer.agents.job_description_parser import (
+    MAX_BLOCK_REQUIREMENTS,
+    JobDescriptionParser,
+    extract_requirements,
+)
+from resume_ats_scorer.models.schemas import JobSource
+
+JOB_DESCRIPTION = """Senior Python Engineer
+Acme Corp
+Requirements:
+- 5+ years of Python development
+- Experience with AWS and Kubernetes
+- Kafka experience is a plus
+Skills and qualifications
+- Docker and Kubernetes in production
+- 5+ years of Python development
+Benefits:
+- Unlimited coffee and snacks"""
+
+
+class TestRequirementExtraction(unittest.TestCase):
+    """Test single-pass requirement extraction from job descriptions."""
+
+    def test_blocks_categories_and_classification(self):
+        """Test that header blocks are categorized, deduplicated and classified as required or preferred."""
+        requirements = extract_requirements(JOB_DESCRIPTION.split("\n"))
+        self.assertEqual(
+            [(req.category, req.description, req.required) for req in requirements],
+            [
+                ("experience", "5+ years of Python development", True),
+                ("experience", "Experience with AWS and Kubernetes", True),
+                ("experience", "Kafka experience is a plus", False),
+                ("skill", "Docker and Kubernetes in production", True),
+            ]
+        )
+        self.assertEqual(requirements[2].importance, 0.5)
+
+    def test_bullet_fallback(self):
+        """Test that bullet lists are used when the posting has no requirements header."""
+        lines = ["We are hiring", "1. Strong SQL", "2) Go is nice to have", "• Strong SQL"]
+        requirements = extract_requirements(lines)
+        self.assertEqual([(req.category, req.description, req.required) for req in requirements], [
+            ("general", "Strong SQL", True),
+            ("general", "Go is nice to have", False),
+        ])
+
+    def test_block_length_is_bounded(self):
+        """Test that a block ends after MAX_BLOCK_REQUIREMENTS requirements."""
+        lines = ["Requirements:"] + [f"Requirement number {number}" for number in range(30)]
+        self.assertEqual(len(extract_requirements(lines)), MAX_BLOCK_REQUIREMENTS)
+
+    def test_linear_in_length(self):
+        """Test that headers on every line do not cause rescanning."""
+        lines = ["Skills:", "Experience with distributed systems"] * 20000
+        started = time.perf_counter()
+        requirements = extract_requirements(lines)
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(len(requirements), 1)
+
+
+NAUKRI_POSTING = """Senior Java Developer
+Infotech Solutions Pvt Ltd
+4-8 years
+
+Job description
+Maintain Java services for banking clients. Perks include free Python workshops.
+
+Role: Software Developer
+
+Education
+UG: B.Tech/B.E. in Computers
+
+Key Skills
+Java, Spring Boot, SQL"""
+
+
+class TestParseJobDescription(unittest.TestCase):
+    """Test that parse_job_description uses the structured posting parsers."""
+
+    def setUp(self):
+        self.parser = JobDescriptionParser()
+
+    def test_structured_posting(self):
+        """Test that a Naukri posting is read from its Key Skills, Education and experience fields."""
+        parsed = asyncio.run(self.parser.parse_job_description(NAUKRI_POSTING, JobSource.NAUKRI))
+        self.assertTrue(parsed.metadata["structured"])
+        self.assertEqual(parsed.keywords, ["java", "spring", "sql"])
+        self.assertEqual(
+            [(req.category, req.description) for req in parsed.requirements],
+            [
+                ("skill", "java"),
+                ("skill", "spring"),
+                ("skill", "sql"),
+                ("experience", "4-8 years"),
+                ("education", "B.Tech/B.E. in Computers"),
+            ]
+        )
+
+    def test_generic_fallback(self):
+        """Test that platforms without a structured parser use the generic extractor."""
+        parsed = asyncio.run(self.parser.parse_job_description(JOB_DESCRIPTION, JobSource.INDEED))
+        self.assertFalse(parsed.metadata["structured"])
+        self.assertEqual(
+            [req.description for req in parsed.requirements],
+            [req.description for req in extract_requirements(JOB_DESCRIPTION.split("\n"))]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
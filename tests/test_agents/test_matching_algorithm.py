@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+
+from resume_ats_scorer.agents.matching_algorithm import MatchingAlgorithm
+from resume_ats_scorer.models.schemas import JobRequirement, ParsedJobDescription, ParsedResume, ResumeSection
+from resume_ats_scorer.utils.job_profile import get_job_profile
+
+JOB = ParsedJobDescription(
+    title="Platform Engineer",
+    company="Acme",
+    description="Kubernetes and PostgreSQL",
+    requirements=[JobRequirement(category="skill", description="Kubernetes and PostgreSQL")],
+    keywords=["kubernetes", "postgresql"]
+)
+
+
+class TestAliasAndFuzzyMatching(unittest.TestCase):
+    """Test that skill aliases count as full matches and only typos as fuzzy ones."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.matcher = MatchingAlgorithm()
+
+    def test_alias_hits_are_not_fuzzy(self):
+        """Test that distance-0 alias lookups are returned as exact matches."""
+        aliases, fuzzy = self.matcher._fuzzy_skill_matches({"kubernetes", "postgresql"}, ["k8s", "postgress"])
+        self.assertEqual(aliases, {"kubernetes": "k8s"})
+        self.assertEqual(fuzzy, {"postgresql": "postgress"})
+
+    def test_candidate_choice_is_deterministic(self):
+        """Test that the closest, then alphabetically first, resume term is reported regardless of order."""
+        terms = ["postgrsql", "postgress", "postgrs"]
+        for ordering in (terms, terms[::-1], set(terms)):
+            _, fuzzy = self.matcher._fuzzy_skill_matches({"postgresql"}, ordering)
+            self.assertEqual(fuzzy, {"postgresql": "postgress"})
+        aliases, fuzzy = self.matcher._fuzzy_skill_matches({"postgresql"}, ["postgrs", "postgres"])
+        self.assertEqual((aliases, fuzzy), ({"postgresql": "postgres"}, {}))
+
+    def test_alias_gets_full_credit(self):
+        """Test that an alias scores like the canonical skill and is not reported as fuzzy."""
+        profile = get_job_profile(JOB)
+        canonical = ParsedResume(raw_text="kubernetes postgresql", keywords=["kubernetes", "postgresql"])
+        aliased = ParsedResume(raw_text="k8s postgresql", keywords=["k8s", "postgresql"])
+
+        canonical_score = self.matcher._calculate_content_match(canonical, profile)[0]
+        aliased_score, _, _, fuzzy_matches, _ = self.matcher._calculate_content_match(aliased, profile)
+        self.assertEqual(fuzzy_matches, {})
+        self.assertAlmostEqual(aliased_score, canonical_score)
+
+    def test_skills_section_reports_aliases_as_matches(self):
+        """Test that the skills section counts aliases as matches and lists typos as fuzzy matches."""
+        resume = ParsedResume(
+            raw_text="SKILLS\nk8s, postgress",
+            sections={ResumeSection.SKILLS: "k8s, postgress"},
+            keywords=["k8s", "postgress"]
+        )
+        skills = self.matcher._calculate_section_scores(resume, get_job_profile(JOB))[0]
+        self.assertEqual(skills.name, ResumeSection.SKILLS.value)
+        self.assertEqual(skills.matches, ["kubernetes"])
+        self.assertEqual(skills.fuzzy_matches, ["postgresql"])
+        self.assertEqual(skills.missing, [])
+
+
+class TestGenerateScore(unittest.TestCase):
+    """Test the score response built by the matching algorithm."""
+
+    def test_response_totals_its_components(self):
+        """Test that generate_score fills the response schema and the overall score sums its parts."""
+        resume = ParsedResume(
+            raw_text="SKILLS\nKubernetes, PostgreSQL",
+            sections={ResumeSection.SKILLS: "Kubernetes, PostgreSQL"},
+            keywords=["kubernetes", "postgresql"]
+        )
+        result = asyncio.run(MatchingAlgorithm().generate_score(resume, JOB))
+        self.assertTrue(result.success)
+        self.assertEqual(set(result.section_scores), {"skills", "experience", "education", "formatting"})
+        self.assertAlmostEqual(
+            result.overall_score,
+            result.content_score + result.format_score + sum(result.section_scores.values()),
+            places=1
+        )
+        self.assertEqual(result.breakdown["section_scores"]["skills"], 0.2)
+        self.assertTrue(result.recommendations)
+
+
+if __name__ == '__main__':
+    unittest.main()
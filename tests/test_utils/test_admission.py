@@ -0,0 +1,110 @@
+import time
+import asyncio
+import unittest
+
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from resume_ats_scorer.core.admission import AdmissionController, AdmissionMiddleware, Overloaded
+from resume_ats_scorer.core.metrics import metrics
+
+
+def _create_app(controller, work_seconds):
+    async def score(request):
+        await request.body()
+        await asyncio.sleep(work_seconds)
+        return JSONResponse({"score": 80})
+
+    async def health(request):
+        return JSONResponse({"status": "healthy"})
+
+    app = Starlette(routes=[Route("/score", score, methods=["POST"]), Route("/health", health)])
+    app.add_middleware(AdmissionMiddleware, controller=controller, paths=["/score"])
+    return app
+
+
+class TestAdmissionController(unittest.TestCase):
+    """Test the concurrency limit and bounded queue."""
+
+    def test_queue_is_served_in_order_and_overflow_rejected(self):
+        """Test that waiters get freed slots in FIFO order and a full queue rejects at once."""
+        controller = AdmissionController("test_admission_fifo", max_concurrent=1, max_queue=2, queue_timeout=5)
+        order = []
+
+        async def request(name):
+            await controller.acquire()
+            order.append(name)
+            await asyncio.sleep(0.02)
+            controller.release()
+
+        async def scenario():
+            tasks = [asyncio.ensure_future(request(name)) for name in ("a", "b", "c")]
+            await asyncio.sleep(0)
+            with self.assertRaises(Overloaded) as raised:
+                await controller.acquire()
+            await asyncio.gather(*tasks)
+            return raised.exception
+
+        rejected = asyncio.run(scenario())
+        self.assertEqual(order, ["a", "b", "c"])
+        self.assertGreaterEqual(rejected.retry_after, 1)
+        self.assertEqual((controller.active, controller.queued), (0, 0))
+        self.assertEqual(metrics.snapshot()["counters"]["test_admission_fifo_rejected_queue_full"], 1)
+
+    def test_queue_timeout_rejects_and_keeps_slots_consistent(self):
+        """Test that a request waiting longer than queue_timeout is rejected without leaking a slot."""
+        controller = AdmissionController("test_admission_timeout", max_concurrent=1, max_queue=5, queue_timeout=0.05)
+
+        async def scenario():
+            await controller.acquire()
+            with self.assertRaises(Overloaded):
+                await controller.acquire()
+            controller.release()
+            await controller.acquire()
+            controller.release()
+
+        asyncio.run(scenario())
+        self.assertEqual((controller.active, controller.queued), (0, 0))
+        self.assertEqual(metrics.snapshot()["counters"]["test_admission_timeout_rejected_queue_timeout"], 1)
+
+
+class TestAdmissionMiddleware(unittest.TestCase):
+    """Test load shedding of scoring routes through the ASGI middleware."""
+
+    def test_overload_is_shed_with_retry_after_and_health_stays_fast(self):
+        """Test that excess requests get 503 quickly while /health is unaffected."""
+        controller = AdmissionController("test_admission_http", max_concurrent=2, max_queue=2, queue_timeout=5)
+        app = _create_app(controller, work_seconds=0.3)
+
+        async def timed(call):
+            started = time.perf_counter()
+            response = await call
+            return response, time.perf_counter() - started
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                scoring = [
+                    asyncio.ensure_future(timed(client.post("/score", content=b"resume")))
+                    for _ in range(8)
+                ]
+                await asyncio.sleep(0.05)
+                health = await timed(client.get("/health"))
+                return await asyncio.gather(*scoring), health
+
+        scored, (health, health_seconds) = asyncio.run(scenario())
+        statuses = sorted(response.status_code for response, _ in scored)
+        self.assertEqual(statuses, [200] * 4 + [503] * 4)
+        for response, seconds in scored:
+            if response.status_code == 503:
+                self.assertGreaterEqual(int(response.headers["Retry-After"]), 1)
+                self.assertLess(seconds, 0.1)
+        self.assertEqual(health.status_code, 200)
+        self.assertLess(health_seconds, 0.1)
+        self.assertEqual((controller.active, controller.queued), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
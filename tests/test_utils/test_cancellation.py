@@ -0,0 +1,212 @@
+import time
+import asyncio
+import unittest
+
+from resume_ats_scorer.core.cancellation import CancellationToken, ClientDisconnected, cancel_on_disconnect
+from resume_ats_scorer.core.exceptions import ScoringCancelled
+from resume_ats_scorer.core.extraction_pool import ExtractionPool
+from resume_ats_scorer.core.metrics import metrics
+from resume_ats_scorer.core.pipeline import CANCELLATION, THREAD, StageGraph
+from resume_ats_scorer.utils.single_flight import SingleFlight
+
+
+def _sleep_and_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def _fail(message):
+    raise ValueError(message)
+
+
+class _FakeRequest:
+    """Starlette request stand-in whose client disconnects after a delay."""
+
+    class url:
+        path = "/score"
+
+    def __init__(self, disconnect_after):
+        self.disconnect_at = time.monotonic() + disconnect_after
+
+    async def is_disconnected(self):
+        return time.monotonic() >= self.disconnect_at
+
+
+class TestCancellationToken(unittest.TestCase):
+    """Test the cooperative cancellation token."""
+
+    def test_cancel_runs_callbacks_once(self):
+        """Test that callbacks run once, and immediately when added after cancellation."""
+        token = CancellationToken()
+        calls = []
+        token.add_callback(lambda: calls.append("early"))
+        token.raise_if_cancelled()
+        token.cancel("client disconnected")
+        token.cancel("again")
+        token.add_callback(lambda: calls.append("late"))
+
+        self.assertTrue(token.cancelled)
+        self.assertEqual(token.reason, "client disconnected")
+        self.assertEqual(calls, ["early", "late"])
+        with self.assertRaises(ScoringCancelled):
+            token.raise_if_cancelled()
+
+    def test_cancel_on_disconnect_cancels_work(self):
+        """Test that work is cancelled once the client disconnects."""
+        cancelled = []
+
+        async def work():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def scenario():
+            return await cancel_on_disconnect(_FakeRequest(0.05), work(), poll_interval=0.01)
+
+        started = time.perf_counter()
+        with self.assertRaises(ClientDisconnected):
+            asyncio.run(scenario())
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(cancelled, [True])
+
+
+class TestPipelineCancellation(unittest.TestCase):
+    """Test cancellation checkpoints between pipeline stages."""
+
+    def test_stages_after_cancellation_do_not_run(self):
+        """Test that a cancelled token stops the graph before its next stage."""
+        ran = []
+
+        def first(cancellation):
+            ran.append("first")
+            cancellation.cancel("client disconnected")
+            return 1
+
+        graph = StageGraph("test_cancel_pipeline", inputs=("request",))
+        graph.add("first", first, requires=(CANCELLATION,), executor=THREAD)
+        graph.add("second", lambda first: ran.append("second"), requires=("first",))
+        graph.add("third", lambda second: ran.append("third"), requires=("second",))
+
+        with self.assertRaises(ScoringCancelled):
+            asyncio.run(graph.run(CancellationToken(), request=None))
+        self.assertEqual(ran, ["first"])
+        self.assertEqual(metrics.snapshot()["counters"]["test_cancel_pipeline_stages_cancelled"], 2)
+
+    def test_failed_run_cancels_token(self):
+        """Test that a failing stage cancels the token handed to the other stages."""
+        token = CancellationToken()
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        graph = StageGraph("test_cancel_on_failure")
+        graph.add("failing", failing)
+        with self.assertRaises(RuntimeError):
+            asyncio.run(graph.run(token))
+        self.assertTrue(token.cancelled)
+
+
+class TestSingleFlightCancellation(unittest.TestCase):
+    """Test that shared computations are cancelled only when no caller waits."""
+
+    def test_last_waiter_leaving_cancels_computation(self):
+        """Test that the computation survives one caller leaving and stops when all have left."""
+        cancelled = []
+
+        async def compute():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def scenario():
+            flight = SingleFlight("test_flight_cancel")
+            first = asyncio.ensure_future(flight.do("key", compute))
+            second = asyncio.ensure_future(flight.do("key", compute))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            await asyncio.sleep(0.01)
+            still_running = list(cancelled)
+            second.cancel()
+            await asyncio.gather(first, second, return_exceptions=True)
+            await asyncio.sleep(0.01)
+            return flight, still_running
+
+        flight, still_running = asyncio.run(scenario())
+        self.assertEqual(still_running, [])
+        self.assertEqual(cancelled, [True])
+        self.assertEqual(flight.in_flight, 0)
+        self.assertEqual(metrics.snapshot()["counters"]["test_flight_cancel_cancelled"], 1)
+
+    def test_new_caller_does_not_attach_to_cancelled_computation(self):
+        """Test that a caller arriving while a cancelled computation unwinds starts a new one."""
+
+        async def compute():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                await asyncio.sleep(0.05)
+                raise
+            return "stale"
+
+        async def fresh():
+            return "fresh"
+
+        async def scenario():
+            flight = SingleFlight("test_flight_restart")
+            first = asyncio.ensure_future(flight.do("key", compute))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            await asyncio.sleep(0.01)
+            result = await flight.do("key", fresh)
+            await asyncio.sleep(0.1)
+            return flight, result
+
+        flight, result = asyncio.run(scenario())
+        self.assertEqual(result, ("fresh", "leader"))
+        self.assertEqual(flight.in_flight, 0)
+
+
+class TestExtractionPool(unittest.TestCase):
+    """Test the cancellable extraction worker pool."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ExtractionPool(1, start_method="spawn")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_runs_jobs_and_reraises_errors(self):
+        """Test results and exceptions are returned from the worker process."""
+        self.assertEqual(self.pool.run(_sleep_and_return, 0, "text"), "text")
+        with self.assertRaises(ValueError):
+            self.pool.run(_fail, "bad file")
+        self.assertEqual(self.pool.run(_sleep_and_return, 0, "again"), "again")
+
+    def test_cancellation_terminates_running_job(self):
+        """Test that cancelling the token kills a running job and the pool recovers."""
+        token = CancellationToken()
+        terminated = metrics.snapshot()["counters"].get("extraction_jobs_terminated", 0)
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            job = loop.run_in_executor(None, lambda: self.pool.run(_sleep_and_return, 10, "late", cancellation=token))
+            await asyncio.sleep(0.5)
+            token.cancel("client disconnected")
+            return await job
+
+        started = time.perf_counter()
+        with self.assertRaises(ScoringCancelled):
+            asyncio.run(scenario())
+        self.assertLess(time.perf_counter() - started, 5)
+        self.assertEqual(metrics.snapshot()["counters"]["extraction_jobs_terminated"], terminated + 1)
+        self.assertEqual(self.pool.run(_sleep_and_return, 0, "next"), "next")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import asyncio
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from resume_ats_scorer.core import crew_manager
+from resume_ats_scorer.core.config import settings
+from resume_ats_scorer.core.crew_manager import ResumeCrewManager
+from resume_ats_scorer.models.schemas import AnalysisLevel, DegradationLevel, FileType, ResumeUploadRequest
+from resume_ats_scorer.utils.response_cache import ResponseCache
+
+RESUME = """Jane Doe
+SUMMARY
+Backend engineer building Python services.
+EXPERIENCE
+Senior Developer at Acme, 2018-2024. Built Python and Django REST APIs on AWS with Docker and Kubernetes.
+EDUCATION
+BS in Computer Science
+SKILLS
+Python, Django, AWS, Docker, Kubernetes, SQL
+"""
+
+JOB_DESCRIPTION = """Senior Python Engineer
+Requirements:
+- 5+ years of Python
+- Experience with AWS and Docker
+- Kubernetes preferred
+"""
+
+
+class TestResumeCrewManager(unittest.TestCase):
+    """Test the scoring workflow end to end on a plain text resume."""
+
+    def setUp(self):
+        """Set up test environment."""
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write(RESUME)
+        self.path = f.name
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def test_score_txt_resume_with_cache_status(self):
+        """Test that a .txt resume gets a complete score response, served from the cache the second time."""
+        request = ResumeUploadRequest(
+            job_description=JOB_DESCRIPTION,
+            resume_file_path=self.path,
+            file_type=FileType.TXT,
+            analysis_level=AnalysisLevel.STANDARD
+        )
+        with patch.object(settings, "EXTRACTION_PROCESS_WORKERS", 0), \
+                patch.object(settings, "DEGRADATION_ENABLED", False), \
+                patch.object(crew_manager, "get_response_cache", return_value=ResponseCache(max_size=4)):
+            manager = ResumeCrewManager()
+            result, cache_hit = asyncio.run(manager.score_resume_with_cache_status(request))
+            cached, cached_hit = asyncio.run(manager.score_resume_with_cache_status(request))
+
+        self.assertTrue(result.success)
+        self.assertFalse(cache_hit)
+        self.assertTrue(cached_hit)
+        self.assertEqual(cached.overall_score, result.overall_score)
+        self.assertGreater(result.content_score, 0)
+        self.assertGreater(result.format_score, 0)
+        self.assertAlmostEqual(
+            result.overall_score,
+            result.content_score + result.format_score + sum(result.section_scores.values()),
+            places=1
+        )
+        self.assertEqual(set(result.section_scores), {"skills", "experience", "education", "formatting"})
+        self.assertIn("content_match", result.breakdown)
+        self.assertIn("python", result.requirement_matches.values())
+        self.assertTrue(result.recommendations)
+        self.assertIn("python", result.keyword_analysis["skills"])
+        self.assertEqual(cached.keyword_analysis, result.keyword_analysis)
+
+    def test_keyword_analysis_is_a_leaf_stage(self):
+        """Test that scoring does not wait for keyword analysis, which only runs for standard and deep requests."""
+        with patch.object(settings, "EXTRACTION_PROCESS_WORKERS", 0):
+            manager = ResumeCrewManager()
+        standard = {stage.name: stage for stage in manager.pipelines[(AnalysisLevel.STANDARD, DegradationLevel.NONE)].stages}
+        quick = {stage.name for stage in manager.pipelines[(AnalysisLevel.QUICK, DegradationLevel.NONE)].stages}
+        self.assertNotIn("keyword_analysis", standard["score"].requires)
+        self.assertIn("keyword_analysis", standard)
+        self.assertNotIn("keyword_analysis", quick)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+import numpy as np
+
+from resume_ats_scorer.models.schemas import JobRequirements, KeywordAnalysis
+from resume_ats_scorer.utils.feature_vectors import (
+    FEATURE_INDEX,
+    FEATURE_NAMES,
+    build_feature_matrix,
+    extract_features,
+    score_matrix,
+)
+from resume_ats_scorer.utils.scoring import score_resume_components
+
+SECTIONS = [
+    "CONTACT\njane.doe@example.com | +1 555 123 4567 | linkedin.com/in/janedoe",
+    "CONTACT\njane.doe@example.com",
+    "PROFESSIONAL SUMMARY\n" + " ".join(["Backend engineer building Python services on AWS."] * 9),
+    "SUMMARY\nI build things.",
+    "PROFESSIONAL SUMMARY\n" + " ".join(["Engineer"] * 220),
+    "EXPERIENCE\n• Led migration to Kubernetes, reducing deploy time by 40% (Jan 2019 - Mar 2021)\n"
+    "• Developed Django REST APIs used by 2M users and led the on-call rotation",
+    "EXPERIENCE\nWorked on services and managing releases; I improved builds",
+    "EDUCATION\nBachelor of Science in Computer Science, State University, 2016",
+    "EDUCATION\nSelf-taught",
+    "SKILLS\nPython, Django, AWS, Docker, Kubernetes, PostgreSQL, Terraform, Leadership, Communication, SQL",
+    "SKILLS\nPython, Go, SQL, Git, Linux",
+    "SKILLS\nPython",
+    "CERTIFICATIONS\nAWS Certified Solutions Architect, 2020; Certified Kubernetes Administrator, 2021",
+    "CERTIFICATIONS\nCKA",
+]
+SKILLS = ["python", "django", "aws", "docker", "kubernetes", "go", "sql", "leadership", "communication", "terraform"]
+
+
+def _random_pair(rng: random.Random):
+    text = "Jane Doe\n" + "\n\n".join(rng.sample(SECTIONS, rng.randint(0, 7)))
+    if rng.random() < 0.1:
+        text += "\ncould not extract text from page 2"
+    keywords = KeywordAnalysis(
+        hard_skills=rng.sample(SKILLS[:7], rng.randint(0, 7)),
+        soft_skills=rng.sample(SKILLS[7:], rng.randint(0, 2)),
+        experience={"software": rng.randint(0, 9)} if rng.random() < 0.7 else {},
+        education=rng.choice([[], ["B.S. Computer Science"], ["Master of Business Administration"]])
+    )
+    requirements = JobRequirements(
+        required_skills=rng.sample(SKILLS, rng.randint(0, 6)),
+        preferred_skills=rng.sample(SKILLS, rng.randint(0, 4)),
+        experience_required=rng.choice([None, 3, 5, 7]),
+        education_required=rng.choice([None, ["computer science"], ["mba", "bachelor"]])
+    )
+    return text, keywords, requirements, rng.choice(["pdf", "docx", "txt"])
+
+
+class TestFeatureVectors(unittest.TestCase):
+    """Test feature extraction and vectorized scoring."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.resume_text = "\n\n".join([SECTIONS[0], SECTIONS[2], SECTIONS[5], SECTIONS[7], SECTIONS[9]])
+        self.keywords = KeywordAnalysis(hard_skills=["python", "aws", "docker"], experience={"software": 4})
+        self.requirements = JobRequirements(
+            required_skills=["python", "aws", "go", "kubernetes"],
+            preferred_skills=["docker"],
+            experience_required=5
+        )
+
+    def test_extract_features(self):
+        """Test that features are in range and describe the pair."""
+        vector = extract_features(self.resume_text, self.keywords, self.requirements, "pdf")
+        self.assertEqual(vector.shape, (len(FEATURE_NAMES),))
+        self.assertTrue(np.all((vector >= 0) & (vector <= 1)))
+        self.assertEqual(vector[FEATURE_INDEX["required_skill_ratio"]], 0.5)
+        self.assertEqual(vector[FEATURE_INDEX["preferred_skill_ratio"]], 1.0)
+        self.assertEqual(vector[FEATURE_INDEX["experience_match"]], 0.8)
+        self.assertEqual(vector[FEATURE_INDEX["experience_dates"]], 1.0)
+        self.assertEqual(vector[FEATURE_INDEX["certifications_detail"]], 0.0)
+
+    def test_scores_match_scalar_scorer(self):
+        """Test that score_matrix gives exactly the score_resume_components total for every pair."""
+        rng = random.Random(7)
+        pairs = [(self.resume_text, self.keywords, self.requirements, "pdf")] + [_random_pair(rng) for _ in range(300)]
+        expected = [score_resume_components(*pair)[4] for pair in pairs]
+        self.assertEqual(score_matrix(build_feature_matrix(pairs)).tolist(), expected)
+
+    def test_score_matrix_matches_rows(self):
+        """Test that scoring a matrix equals scoring each row."""
+        empty = ("", KeywordAnalysis(), self.requirements, "txt")
+        matrix = build_feature_matrix([(self.resume_text, self.keywords, self.requirements, "pdf"), empty])
+        scores = score_matrix(matrix)
+        self.assertEqual(scores.shape, (2,))
+        self.assertGreater(scores[0], scores[1])
+        for row, score in zip(matrix, scores):
+            self.assertEqual(score_matrix(row), score)
+
+        self.assertEqual(build_feature_matrix([]).shape, (0, len(FEATURE_NAMES)))
+        self.assertEqual(score_matrix(build_feature_matrix([])).shape, (0,))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from resume_ats_scorer.utils.format_analyzer import analyze_format
+from resume_ats_scorer.utils.scoring import analyze_format_compatibility, evaluate_section_scores
+
+
+class TestFormatAnalyzer(unittest.TestCase):
+    """Test the single-pass format feature analyzer."""
+
+    def test_contact_features(self):
+        """Test email, phone and LinkedIn detection."""
+        features = analyze_format("jane.doe@example.com | +1 (555) 123-4567\nlinkedin.com/in/jane-doe")
+        self.assertTrue(features.has_email)
+        self.assertTrue(features.has_phone)
+        self.assertTrue(features.has_linkedin)
+        self.assertTrue(features.has_table_chars)
+
+    def test_date_formats(self):
+        """Test that each date notation is counted once."""
+        features = analyze_format("Jan 2019 - Mar 2021\n2020-01-15\n05/2018")
+        self.assertTrue(features.has_date_range)
+        self.assertEqual(features.date_formats, {'month_year', 'iso', 'mm_yyyy'})
+
+        self.assertEqual(analyze_format("2020-01-15, 2021-02-01").date_formats, {'iso'})
+
+    def test_word_features(self):
+        """Test pronoun, action verb, tense and education tokens."""
+        features = analyze_format("I led a team and developed tools while learning Go.\n"
+                                  "Bachelor of Science, Stanford University, 2018")
+        self.assertEqual(features.pronoun_count, 1)
+        self.assertEqual(features.action_verb_count, 2)
+        self.assertEqual(features.past_tense_count, 2)
+        self.assertEqual(features.present_tense_count, 1)
+        self.assertTrue(features.has_degree)
+        self.assertTrue(features.has_institution)
+        self.assertTrue(features.has_year)
+
+    def test_bullets_and_lines(self):
+        """Test bullet counts and repeated first/last lines."""
+        features = analyze_format("Page 1\n• Python\n• SQL\n- Go\nPage 1")
+        self.assertEqual(features.bullet_count(['•', '-']), 3)
+        self.assertEqual(features.newline_count, 4)
+        self.assertTrue(features.first_line_repeated)
+
+
+class TestFormatScoring(unittest.TestCase):
+    """Test the scorers that read format features."""
+
+    def test_analyze_format_compatibility(self):
+        """Test issues reported for a poorly formatted resume."""
+        score, issues, _ = analyze_format_compatibility("I am managing my projects and testing things", "txt")
+        self.assertIn("No bullet points detected for listing experiences/skills", issues)
+        self.assertIn("Personal pronouns detected (avoid I, me, my)", issues)
+        self.assertLess(score, 20.0)
+
+    def test_evaluate_section_scores(self):
+        """Test per-section checks on section contents."""
+        _, section_scores, _ = evaluate_section_scores({
+            'contact_info': "jane@example.com\n+1 555 123 4567",
+            'experience': "Jan 2019 - Present\n- Developed APIs\n- led migrations",
+            'skills': "Python, SQL, Go, Docker, Kubernetes\nAWS, GCP, Terraform, Linux, Git",
+        })
+        scores = {section.name: section.score for section in section_scores}
+        self.assertAlmostEqual(scores['Contact Info'], 3.5)
+        self.assertAlmostEqual(scores['Experience'], 8.0)
+        self.assertAlmostEqual(scores['Skills'], 6.0)
+        self.assertEqual(scores['Education'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from resume_ats_scorer.utils.fuzzy_matcher import FuzzySkillMatcher, bounded_edit_distance
+
+
+class TestFuzzySkillMatcher(unittest.TestCase):
+    """Test typo-tolerant skill lookups."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.matcher = FuzzySkillMatcher({
+            'kubernetes': 'kubernetes',
+            'k8s': 'kubernetes',
+            'postgresql': 'postgresql',
+            'postgres': 'postgresql',
+            'tensorflow': 'tensorflow',
+            'java': 'java',
+            'react': 'react',
+        })
+
+    def test_misspelled_skills(self):
+        """Test that common misspellings resolve to the canonical skill."""
+        for query, skill in [('Kubernates', 'kubernetes'), ('Postgress', 'postgresql'), ('Tensorflow2', 'tensorflow')]:
+            match = self.matcher.lookup(query)
+            self.assertIsNotNone(match, query)
+            self.assertEqual(match.skill, skill)
+            self.assertGreater(match.distance, 0)
+
+    def test_exact_and_alias_hits(self):
+        """Test that exact terms and aliases are reported with distance 0."""
+        self.assertEqual(self.matcher.lookup('K8s').distance, 0)
+        self.assertEqual(self.matcher.lookup('K8s').skill, 'kubernetes')
+
+    def test_short_terms_require_exact_match(self):
+        """Test that short terms are not matched approximately."""
+        self.assertIsNone(self.matcher.lookup('jav'))
+        self.assertIsNone(self.matcher.lookup('reach'))
+
+    def test_bounded_edit_distance(self):
+        """Test the bounded edit distance used to verify candidates."""
+        self.assertEqual(bounded_edit_distance('kubernates', 'kubernetes', 2), 1)
+        self.assertEqual(bounded_edit_distance('ab', 'ba', 1), 1)
+        self.assertIsNone(bounded_edit_distance('python', 'java', 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
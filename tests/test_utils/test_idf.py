@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from resume_ats_scorer.utils import idf
+from resume_ats_scorer.utils.idf import IDFTable, IDFTableBuilder, weighted_match_ratio
+
+
+class TestIDFTable(unittest.TestCase):
+    """Test building, reading and updating the on-disk IDF table."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "idf.bin")
+
+        builder = IDFTableBuilder()
+        builder.add_document("Team player with Python and Kubernetes experience")
+        builder.add_document("Python developer, strong team communication")
+        builder.add_document("Java developer in a small team")
+        builder.write(self.path)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.temp_dir.cleanup()
+
+    def test_document_frequencies(self):
+        """Test that document frequencies are stored per term."""
+        table = IDFTable(self.path)
+        try:
+            self.assertEqual(table.doc_count, 3)
+            self.assertEqual(table.document_frequency("team"), 3)
+            self.assertEqual(table.document_frequency("Python"), 2)
+            self.assertEqual(table.document_frequency("k8s"), 0)
+            self.assertGreater(table.idf("kubernetes"), table.idf("team"))
+        finally:
+            table.close()
+
+    def test_incremental_update(self):
+        """Test adding documents to an existing table."""
+        builder = IDFTableBuilder.from_table(self.path)
+        builder.add_document("Kubernetes operator written in Go")
+        builder.write(self.path)
+
+        table = IDFTable(self.path)
+        try:
+            self.assertEqual(table.doc_count, 4)
+            self.assertEqual(table.document_frequency("kubernetes"), 2)
+            self.assertEqual(table.document_frequency("team"), 3)
+        finally:
+            table.close()
+
+    def test_weighted_match_ratio(self):
+        """Test that rare keywords weigh more than common ones."""
+        with patch.multiple(idf.settings, IDF_TABLE_PATH=self.path, IDF_TABLE_RELOAD_INTERVAL=0):
+            rare_match = weighted_match_ratio({"kubernetes"}, {"kubernetes", "team"})
+            common_match = weighted_match_ratio({"team"}, {"kubernetes", "team"})
+
+        self.assertGreater(rare_match, 0.5)
+        self.assertLess(common_match, 0.5)
+        self.assertAlmostEqual(rare_match + common_match, 1.0)
+
+    def test_unweighted_without_table(self):
+        """Test that every keyword weighs the same when no table is configured."""
+        with patch.object(idf.settings, "IDF_TABLE_PATH", None):
+            self.assertEqual(weighted_match_ratio({"team"}, {"kubernetes", "team"}), 0.5)
+            self.assertEqual(weighted_match_ratio(set(), set()), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
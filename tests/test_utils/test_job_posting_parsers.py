@@ -0,0 +1,76 @@
+import unittest
+
+from resume_ats_scorer.core.metrics import metrics
+from resume_ats_scorer.models.schemas import JobSource
+from resume_ats_scorer.utils.job_posting_parsers import (
+    parse_linkedin_posting,
+    parse_naukri_posting,
+    parse_structured_posting
+)
+
+LINKEDIN_POSTING = """About the job
+Acme builds payments infrastructure for merchants in 40 countries.
+
+Responsibilities
+- Design and operate Python services; 10 years of uptime matter to us
+
+Qualifications
+- 5+ years of experience building backend services in Python
+- Bachelor's degree in Computer Science or a related field
+- Experience with Kubernetes, Docker and Terraform
+
+Benefits
+- Java lunch and learn sessions every Friday
+"""
+
+NAUKRI_POSTING = """Senior Java Developer
+Infotech Solutions Pvt Ltd
+4-8 years
+
+Job description
+Develop and maintain Spring Boot microservices for banking clients.
+
+Role: Software Developer
+Industry Type: IT Services & Consulting
+Role Category: Software Development
+
+Education
+UG: B.Tech/B.E. in Computers
+PG: MCA in Computers
+
+Key Skills
+Java, Spring Boot, Microservices, SQL
+"""
+
+
+class TestJobPostingParsers(unittest.TestCase):
+    """Test the structure-aware LinkedIn and Naukri posting parsers."""
+
+    def test_linkedin_reads_qualification_blocks(self):
+        """Test that only the qualification blocks of a LinkedIn posting are read."""
+        requirements = parse_linkedin_posting(LINKEDIN_POSTING)
+        self.assertEqual(requirements['skills'], ['python', 'kubernetes', 'docker', 'terraform'])
+        self.assertEqual(requirements['education'], ["Bachelor's degree in Computer Science or a related field"])
+        self.assertEqual(requirements['experience'], ['5+ years of experience building backend services in Python'])
+
+    def test_naukri_reads_fields(self):
+        """Test that Key Skills, Education and the experience range of a Naukri posting are read."""
+        requirements = parse_naukri_posting(NAUKRI_POSTING)
+        self.assertEqual(set(requirements['skills']), {'java', 'spring', 'microservices', 'sql'})
+        self.assertEqual(requirements['education'], ['B.Tech/B.E. in Computers', 'MCA in Computers'])
+        self.assertEqual(requirements['experience'], ['4-8 years'])
+
+    def test_unrecognized_structure_falls_back(self):
+        """Test that postings without the platform template are left to the generic parser."""
+        free_text = "Backend Engineer\nWe need someone with 3 years of Python."
+        self.assertIsNone(parse_linkedin_posting(free_text))
+        self.assertIsNone(parse_naukri_posting(LINKEDIN_POSTING))
+        self.assertIsNone(parse_structured_posting(LINKEDIN_POSTING, JobSource.INDEED))
+
+        before = metrics.snapshot()["counters"].get("job_parser_fallback_naukri", 0)
+        self.assertIsNone(parse_structured_posting(free_text, JobSource.NAUKRI))
+        self.assertEqual(metrics.snapshot()["counters"]["job_parser_fallback_naukri"], before + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+
+from resume_ats_scorer.models.schemas import JobRequirement, ParsedJobDescription
+from resume_ats_scorer.utils import job_profile
+from resume_ats_scorer.utils.job_profile import compile_job_profile, get_job_profile
+
+
+def _job(description="Backend role", keywords=("Python", "AWS")):
+    return ParsedJobDescription(
+        title="Backend Engineer",
+        company="Acme",
+        description=description,
+        requirements=[
+            JobRequirement(category="Experience", description="5 years building Python services"),
+            JobRequirement(category="education", description="Bachelor degree in Computer Science"),
+            JobRequirement(category="skill", description="AWS"),
+        ],
+        keywords=list(keywords),
+        metadata={},
+    )
+
+
+class TestJobProfile(unittest.TestCase):
+    """Test compiling and caching job description profiles."""
+
+    def setUp(self):
+        """Set up test environment."""
+        job_profile._profiles.clear()
+
+    def test_compile(self):
+        """Test the derived keyword sets, buckets and education filter."""
+        profile = compile_job_profile(_job())
+        self.assertEqual(profile.keyword_set, frozenset(["Python", "AWS"]))
+        self.assertEqual(profile.lowered_keywords, ("python", "aws"))
+        self.assertEqual([req.description for req in profile.requirements_in("experience")],
+                         ["5 years building Python services"])
+        self.assertEqual(profile.requirements_in("experience")[0].match_tokens,
+                         ("years", "building", "python", "services"))
+        self.assertEqual([req.category for req in profile.education_requirements], ["education"])
+        self.assertEqual(profile.requirements_in("certification"), ())
+
+    def test_cached_by_content(self):
+        """Test that equal job descriptions share one profile and the cache is bounded."""
+        first = get_job_profile(_job())
+        self.assertIs(get_job_profile(_job()), first)
+        self.assertIsNot(get_job_profile(_job(keywords=("Go",))), first)
+
+        with patch.object(job_profile.settings, "JOB_PROFILE_CACHE_SIZE", 1):
+            get_job_profile(_job(description="Another role"))
+        self.assertEqual(len(job_profile._profiles), 1)
+
+    def test_match_requirements(self):
+        """Test token/phrase requirement matching and the keyword reported per requirement."""
+        profile = compile_job_profile(_job())
+        matches = profile.match_requirements(["javascript", "Computer Science", "python", "aws", "services"])
+        self.assertEqual(matches, ["python", "Computer Science", "aws"])
+
+        # Substrings of tokens do not count as matches
+        self.assertEqual(profile.match_requirements(["pyth", "degre"]), [None, None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
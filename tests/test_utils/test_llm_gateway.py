@@ -0,0 +1,120 @@
+import json
+import time
+import threading
+import unittest
+
+import httpx
+
+from resume_ats_scorer.core.llm_gateway import GatewayLLM, LLMGateway, LLMGatewayError
+from resume_ats_scorer.core.llm_stub_server import serve_in_background
+from resume_ats_scorer.core.metrics import metrics
+
+
+class TestLLMGateway(unittest.TestCase):
+    """Test the agent LLM call layer against the local stub server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._server = serve_in_background(latency_ms=50)
+        cls.base_url = cls._server.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._server.__exit__(None, None, None)
+
+    def _completions(self) -> int:
+        return httpx.get(f"{self.base_url}/stats").json()["completions"]
+
+    def test_prompt_cache(self):
+        """Test that repeated prompts are served from the cache, whitespace differences included."""
+        gateway = LLMGateway(self.base_url, cache_size=2)
+        before = self._completions()
+        first = gateway.complete("Score this   resume", "stub")
+        self.assertTrue(first.startswith("Final Answer: stub-"))
+        self.assertEqual(gateway.complete([{"role": "user", "content": "Score this resume\n"}], "stub"), first)
+        self.assertEqual(self._completions() - before, 1)
+
+        # Sampled calls are never cached
+        gateway.complete("Score this resume", "stub", temperature=0.7)
+        gateway.complete("Score this resume", "stub", temperature=0.7)
+        self.assertEqual(self._completions() - before, 3)
+
+        # The oldest entry is evicted
+        gateway.complete("second", "stub")
+        gateway.complete("third", "stub")
+        self.assertEqual(len(gateway), 2)
+        gateway.complete("Score this resume", "stub")
+        self.assertEqual(self._completions() - before, 6)
+
+    def test_messages_are_sent_unchanged(self):
+        """Test that whitespace is only collapsed for the cache key, not in the request sent upstream."""
+        sent = []
+
+        def handler(request):
+            sent.append(json.loads(request.content)["messages"])
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Final Answer: ok"}}]})
+
+        client = httpx.Client(base_url="http://upstream", transport=httpx.MockTransport(handler))
+        gateway = LLMGateway("http://upstream", client=client)
+        table = "| skill |  years |\n|-------|--------|\n| python |  5 |"
+        gateway.complete([{"role": "system", "content": "Be  brief."}, {"role": "user", "content": table}], "stub")
+        gateway.complete([{"role": "system", "content": "Be brief."}, {"role": "user", "content": " ".join(table.split())}], "stub")
+        self.assertEqual(sent, [[{"role": "system", "content": "Be  brief."}, {"role": "user", "content": table}]])
+
+    def test_concurrency_limit_and_coalescing(self):
+        """Test that identical in-flight prompts share one call and distinct ones respect the limit."""
+        gateway = LLMGateway(self.base_url, max_concurrency=2)
+        before = self._completions()
+        coalesced = metrics.snapshot()["counters"].get("llm_calls_coalesced", 0)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(gateway.complete("same prompt", "stub")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(self._completions() - before, 1)
+        self.assertGreater(metrics.snapshot()["counters"]["llm_calls_coalesced"], coalesced)
+
+        # Six distinct prompts on six threads through two slots: three rounds of 50ms
+        started = time.perf_counter()
+        threads = [threading.Thread(target=gateway.complete, args=(f"limited {n}", "stub")) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.perf_counter() - started, 0.15)
+        self.assertGreaterEqual(metrics.snapshot()["summaries"]["llm_queue_seconds"]["max"], 0.04)
+
+        # Batches send duplicates once and skip cached prompts
+        prompts = ["batch 1", "batch 2", "batch 1", "limited 0"]
+        self.assertEqual(len(gateway.complete_many(prompts, "stub")), 4)
+        self.assertEqual(self._completions() - before, 9)
+
+        # Concurrent sampled calls are not coalesced
+        threads = [
+            threading.Thread(target=gateway.complete, args=("sampled prompt", "stub"), kwargs={"temperature": 0.7})
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self._completions() - before, 11)
+
+    def test_crewai_llm_and_errors(self):
+        """Test the CrewAI LLM adapter and that upstream failures raise LLMGatewayError."""
+        gateway = LLMGateway(self.base_url)
+        llm = GatewayLLM(gateway, "stub", temperature=0.0)
+        self.assertEqual(llm.call("hello"), gateway.complete("hello", "stub", 0.0, []))
+
+        broken = LLMGateway(self.base_url.replace("/v1", "/missing"))
+        with self.assertRaises(LLMGatewayError):
+            broken.complete("hello", "stub")
+
+
+if __name__ == "__main__":
+    unittest.main()
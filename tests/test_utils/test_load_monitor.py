@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import patch
+
+from resume_ats_scorer.core.load_monitor import LoadMonitor
+from resume_ats_scorer.models.schemas import AnalysisLevel, DegradationLevel, JobRequirements, KeywordAnalysis
+from resume_ats_scorer.utils import scoring
+from resume_ats_scorer.utils.analysis_levels import applied_degradation
+from resume_ats_scorer.utils.response_cache import ResponseCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLoadMonitor(unittest.TestCase):
+    """Test the load-driven degradation level and its hysteresis."""
+
+    def setUp(self):
+        self.clock = _Clock()
+        self.queue = 0
+        self.monitor = LoadMonitor(
+            queue_thresholds=[4, 12],
+            latency_thresholds=[1.5, 3.0],
+            recovery_fraction=0.5,
+            min_hold_seconds=10,
+            window_seconds=30,
+            clock=self.clock
+        )
+        self.monitor.watch_queue(lambda: self.queue)
+
+    def test_queue_depth_escalates_immediately(self):
+        """Test that a deep queue jumps straight to the matching level."""
+        self.assertEqual(self.monitor.level(), DegradationLevel.NONE)
+        self.queue = 12
+        self.assertEqual(self.monitor.level(), DegradationLevel.MINIMAL)
+
+    def test_latency_relative_to_budget(self):
+        """Test that p95 latency over budget raises the level and old samples expire."""
+        for _ in range(20):
+            self.monitor.observe(0.5, budget_seconds=0.25)
+        self.assertEqual(self.monitor.level(), DegradationLevel.REDUCED)
+
+        self.clock.now += 31
+        self.assertEqual(self.monitor.level(), DegradationLevel.NONE)
+
+    def test_recovery_is_held_and_stepwise(self):
+        """Test that the level holds for min_hold_seconds and then drops one level at a time."""
+        self.queue = 12
+        self.assertEqual(self.monitor.level(), DegradationLevel.MINIMAL)
+
+        # Load dropped, but not for long enough
+        self.queue = 0
+        self.clock.now += 5
+        self.assertEqual(self.monitor.level(), DegradationLevel.MINIMAL)
+
+        self.clock.now += 5
+        self.assertEqual(self.monitor.level(), DegradationLevel.REDUCED)
+        self.assertEqual(self.monitor.level(), DegradationLevel.REDUCED)
+        self.clock.now += 10
+        self.assertEqual(self.monitor.level(), DegradationLevel.NONE)
+
+    def test_no_flapping_near_threshold(self):
+        """Test that load just under the entering threshold does not leave the level."""
+        self.queue = 4
+        self.assertEqual(self.monitor.level(), DegradationLevel.REDUCED)
+        self.queue = 3
+        self.clock.now += 60
+        self.assertEqual(self.monitor.level(), DegradationLevel.REDUCED)
+        self.queue = 1
+        self.assertEqual(self.monitor.level(), DegradationLevel.NONE)
+
+    def test_rejects_wrong_threshold_count(self):
+        """Test that each degradation level needs a threshold."""
+        with self.assertRaises(ValueError):
+            LoadMonitor(queue_thresholds=[4], latency_thresholds=[1.5])
+
+    def test_applied_degradation(self):
+        """Test that only degradation that removes work from a level is applied."""
+        self.assertEqual(applied_degradation(AnalysisLevel.QUICK, DegradationLevel.MINIMAL), DegradationLevel.NONE)
+        self.assertEqual(applied_degradation(AnalysisLevel.STANDARD, DegradationLevel.REDUCED), DegradationLevel.NONE)
+        self.assertEqual(applied_degradation(AnalysisLevel.STANDARD, DegradationLevel.MINIMAL), DegradationLevel.MINIMAL)
+        self.assertEqual(applied_degradation(AnalysisLevel.DEEP, DegradationLevel.REDUCED), DegradationLevel.REDUCED)
+        self.assertEqual(applied_degradation(AnalysisLevel.DEEP, DegradationLevel.NONE), DegradationLevel.NONE)
+
+
+class TestDegradedScoring(unittest.TestCase):
+    """Test degradation in the text scoring entry point (calculate_resume_score_with_cache_status)."""
+
+    def test_overload_skips_deep_analysis_and_is_not_cached(self):
+        """Test that an overloaded deep request skips similarity and layout, is marked degraded and feeds the monitor."""
+        monitor = LoadMonitor(queue_thresholds=[4, 12], latency_thresholds=[1.5, 3.0])
+        monitor.watch_queue(lambda: 12)
+        cache = ResponseCache(max_size=4)
+        arguments = dict(
+            resume_text="SUMMARY\nBackend developer\nEXPERIENCE\nBuilt Python services on AWS\nSKILLS\nPython, AWS",
+            resume_filename="jane.txt",
+            resume_keywords=KeywordAnalysis(hard_skills=["python", "aws"]),
+            job_requirements=JobRequirements(required_skills=["python", "aws", "docker"]),
+            job_title="Backend Engineer",
+            file_type="txt",
+            analysis_level=AnalysisLevel.DEEP
+        )
+        with patch.object(scoring, "get_load_monitor", return_value=monitor), \
+                patch.object(scoring, "get_response_cache", return_value=cache):
+            response, cache_hit = scoring.calculate_resume_score_with_cache_status(**arguments)
+
+        self.assertFalse(cache_hit)
+        self.assertTrue(response.degraded)
+        self.assertEqual(response.degradation_level, DegradationLevel.MINIMAL)
+        self.assertIsNone(response.similarity_score)
+        self.assertEqual(response.layout_analysis, {})
+        self.assertTrue(response.recommendations)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(len(monitor._samples), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
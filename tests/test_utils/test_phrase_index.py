@@ -0,0 +1,72 @@
+import random
+import re
+import unittest
+
+from resume_ats_scorer.models.schemas import JobRequirements, KeywordAnalysis
+from resume_ats_scorer.utils.phrase_index import PhraseIndex
+from resume_ats_scorer.utils.scoring import calculate_content_match_score
+
+RESUME_SKILLS = [
+    "Python", "JavaScript", "C++", "C#", ".NET Core", "Node.js", "machine learning",
+    "Amazon Web Services (AWS)", "CI/CD pipelines", "team leadership", "SQL-Server",
+    "scikit-learn", "Go", "R&D", "data_engineering", "Müller analytics", "",
+]
+JOB_SKILLS = [
+    "python", "java", "javascript", "c++", "c", "c#", ".net", "net core", "node.js", "node",
+    "js", "machine learning", "learning", "aws", "amazon web services", "(aws)", "ci/cd",
+    "cd", "leadership", "team leadership skills", "sql", "server", "sql-server", "scikit",
+    "learn", "go", "r&d", "d", "data", "data_engineering", "müller", "MÜLLER ANALYTICS", "",
+]
+
+
+def _reference_contains(phrase, texts):
+    """The per-pair regex search the index replaces."""
+    return any(re.search(rf'\b{re.escape(phrase)}\b', text, re.IGNORECASE) for text in texts)
+
+
+class TestPhraseIndex(unittest.TestCase):
+    """Test that the phrase index answers like the regex it replaces."""
+
+    def test_equivalence_corpus(self):
+        """Test every job skill against the resume skill corpus."""
+        index = PhraseIndex.for_phrases(RESUME_SKILLS, JOB_SKILLS)
+        for phrase in JOB_SKILLS:
+            self.assertEqual(index.contains(phrase), _reference_contains(phrase, RESUME_SKILLS), phrase)
+
+    def test_equivalence_random(self):
+        """Test randomly generated phrases built from word and separator pieces."""
+        rng = random.Random(7)
+        pieces = ["a", "b", "ab", "c", "+", "#", ".", " ", "-", "/", "_", "1"]
+
+        def make():
+            return "".join(rng.choice(pieces) for _ in range(rng.randint(1, 6)))
+
+        for _ in range(200):
+            texts = [make() for _ in range(rng.randint(0, 4))]
+            phrases = [make() for _ in range(5)]
+            index = PhraseIndex.for_phrases(texts, phrases)
+            for phrase in phrases:
+                self.assertEqual(index.contains(phrase), _reference_contains(phrase, texts), (phrase, texts))
+
+    def test_content_match_score(self):
+        """Test matched and missing skills reported by the content scorer."""
+        resume = KeywordAnalysis(
+            hard_skills=["Python", "Node.js", "C++"],
+            soft_skills=["team leadership"],
+            experience={},
+            education=["B.S. Computer Science"],
+        )
+        requirements = JobRequirements(
+            required_skills=["python", "java", "c++"],
+            preferred_skills=["leadership", "node"],
+            experience_required=None,
+            education_required=["Computer Science"],
+        )
+        _, matched, missing, _ = calculate_content_match_score(resume, requirements)
+        # Word-boundary semantics are unchanged, so "c++" still needs a word character after it
+        self.assertEqual(matched, ["python", "leadership", "node"])
+        self.assertEqual(missing, ["java", "c++"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import asyncio
+import time
+import unittest
+
+from resume_ats_scorer.core.metrics import metrics
+from resume_ats_scorer.core.pipeline import THREAD, StageGraph
+
+
+def _sleep_then(value, seconds=0.1):
+    time.sleep(seconds)
+    return value
+
+
+class TestStageGraph(unittest.TestCase):
+    """Test concurrent execution of declared pipeline stages."""
+
+    def test_independent_stages_overlap(self):
+        """Test that independent blocking stages run concurrently and results flow to dependents."""
+        pipeline = (
+            StageGraph("test_overlap", inputs=("text",))
+            .add("upper", lambda text: _sleep_then(text.upper()), requires=("text",), executor=THREAD)
+            .add("length", lambda text: _sleep_then(len(text)), requires=("text",), executor=THREAD)
+            .add("report", lambda upper, length: f"{upper}:{length}", requires=("upper", "length"))
+        )
+        run = asyncio.run(pipeline.run(text="abc"))
+
+        self.assertEqual(run.results["report"], "ABC:3")
+        self.assertLess(run.elapsed, 0.18)
+        self.assertLess(run.critical_path, sum(run.timings.values()))
+        self.assertGreaterEqual(run.critical_path, 0.1)
+        self.assertIn("test_overlap_stage_seconds_upper", metrics.snapshot()["summaries"])
+
+    def test_coroutine_stages(self):
+        """Test that coroutine stages run on the loop or on a worker thread's own loop."""
+        async def double(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        pipeline = (
+            StageGraph("test_coroutines", inputs=("value",))
+            .add("on_loop", double, requires=("value",))
+            .add("on_thread", lambda on_loop: double(on_loop), requires=("on_loop",), executor=THREAD)
+        )
+        self.assertEqual(asyncio.run(pipeline.run(value=3)).results["on_thread"], 12)
+
+    def test_failure_propagates(self):
+        """Test that a failing stage raises its exception and dependents never run."""
+        ran = []
+
+        def fail():
+            raise RuntimeError("parse failed")
+
+        pipeline = (
+            StageGraph("test_failure")
+            .add("broken", fail)
+            .add("after", lambda broken: ran.append(broken), requires=("broken",))
+        )
+        with self.assertRaisesRegex(RuntimeError, "parse failed"):
+            asyncio.run(pipeline.run())
+        self.assertEqual(ran, [])
+
+    def test_declaration_errors(self):
+        """Test that unknown dependencies, duplicates and missing inputs are rejected."""
+        pipeline = StageGraph("test_declaration", inputs=("request",))
+        with self.assertRaises(ValueError):
+            pipeline.add("score", lambda parsed: parsed, requires=("parsed",))
+        pipeline.add("parsed", lambda request: request, requires=("request",))
+        with self.assertRaises(ValueError):
+            pipeline.add("parsed", lambda request: request, requires=("request",))
+        with self.assertRaises(ValueError):
+            asyncio.run(pipeline.run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from resume_ats_scorer.core.metrics import metrics
+from resume_ats_scorer.models.schemas import JobRequirement, ParsedJobDescription, ParsedResume, ResumeSection
+from resume_ats_scorer.utils.prompt_summaries import (
+    build_job_summary,
+    build_resume_summary,
+    estimate_tokens,
+    summarize_resume
+)
+
+EXPERIENCE = "\n".join(
+    f"• Led migration of service {number} to Kubernetes, reducing deployment time by {number}%"
+    for number in range(200)
+)
+
+RESUME = ParsedResume(
+    raw_text="Jane Doe\nSUMMARY\nBackend engineer.\nEXPERIENCE\n" + EXPERIENCE + "\nSKILLS\nPython, AWS",
+    sections={
+        ResumeSection.SUMMARY: "SUMMARY\nBackend engineer.",
+        ResumeSection.EXPERIENCE: "EXPERIENCE\n" + EXPERIENCE,
+        ResumeSection.SKILLS: "SKILLS\nPython, AWS",
+    },
+    keywords=["python", "aws", "kubernetes"]
+)
+
+
+class TestPromptSummaries(unittest.TestCase):
+    """Test token-budgeted resume and job description summaries."""
+
+    def test_resume_summary_within_budget(self):
+        """Test that every section is represented and the summary respects the budget."""
+        summary = build_resume_summary(RESUME, token_budget=300)
+        self.assertLessEqual(estimate_tokens(summary), 300)
+        self.assertTrue(summary.startswith("Sections: summary, experience, skills\nKeywords: python, aws, kubernetes"))
+        # Short sections are kept whole; the long one is cut
+        self.assertIn("[summary]\nSUMMARY\nBackend engineer.", summary)
+        self.assertIn("[skills]\nSKILLS\nPython, AWS", summary)
+        self.assertIn("service 1 to Kubernetes", summary)
+        self.assertNotIn("service 199", summary)
+
+    def test_job_summary(self):
+        """Test that job summaries list requirements and fall back to an excerpt without them."""
+        job = ParsedJobDescription(
+            title="Backend Engineer",
+            company="Acme",
+            description="Long posting " * 500,
+            requirements=[
+                JobRequirement(category="skill", description="Python"),
+                JobRequirement(category="skill", description="Kafka is a plus", required=False),
+            ],
+            keywords=["python", "kafka"]
+        )
+        self.assertEqual(
+            build_job_summary(job, token_budget=100),
+            "Title: Backend Engineer\nCompany: Acme\nRequired: Python\nPreferred: Kafka is a plus\nKeywords: python, kafka"
+        )
+        excerpt = build_job_summary(job.model_copy(update={"requirements": []}), token_budget=100)
+        self.assertLessEqual(estimate_tokens(excerpt), 101)
+        self.assertIn("Long posting", excerpt)
+
+    def test_cached_and_savings_recorded(self):
+        """Test that summaries are cached by content and token savings are counted."""
+        counters = metrics.snapshot()["counters"]
+        hits, saved = counters.get("prompt_summary_cache_hits", 0), counters.get("prompt_tokens_saved", 0)
+        first = summarize_resume(RESUME, token_budget=250)
+        self.assertEqual(summarize_resume(RESUME.model_copy(), token_budget=250), first)
+
+        counters = metrics.snapshot()["counters"]
+        self.assertEqual(counters["prompt_summary_cache_hits"], hits + 1)
+        self.assertGreater(counters["prompt_tokens_saved"] - saved, 2 * (estimate_tokens(RESUME.raw_text) - 250))
+
+
+if __name__ == "__main__":
+    unittest.main()
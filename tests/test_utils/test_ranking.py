@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from resume_ats_scorer.utils.ranking import CandidateIndex, skill_terms
+
+
+class TestCandidateIndex(unittest.TestCase):
+    """Test WAND top-k retrieval over the candidate skill index."""
+
+    def setUp(self):
+        """Set up test environment."""
+        rng = random.Random(11)
+        vocabulary = ["python", "java", "aws", "docker", "kubernetes", "react", "sql", "go",
+                      "terraform", "spark", "leadership", "communication"]
+        self.index = CandidateIndex()
+        self.skills = {}
+        for number in range(300):
+            skills = rng.sample(vocabulary, rng.randint(1, 6))
+            self.skills[f"cand-{number}"] = skills
+            self.index.add(f"cand-{number}", skills, payload=number)
+
+    def _brute_force(self, weights, k):
+        scored = []
+        for candidate_id, skills in self.skills.items():
+            terms = skill_terms(skills)
+            scored.append((sum(weight for term, weight in weights.items() if term in terms), candidate_id))
+        scored = [item for item in scored if item[0] > 0]
+        return sorted(score for score, _ in scored)[::-1][:k]
+
+    def test_top_k_matches_exhaustive_scoring(self):
+        """Test that pruning returns the same top scores as scoring every candidate."""
+        weights = self.index.query_weights(["python", "kubernetes", "terraform"], ["leadership", "go"])
+        for k in (1, 5, 25):
+            results = self.index.top_k(weights, k)
+            self.assertEqual(len(results), k)
+            expected = self._brute_force(weights, k)
+            for result, score in zip(results, expected):
+                self.assertAlmostEqual(result.score, score)
+            self.assertEqual(results[0].payload, int(results[0].candidate_id.split("-")[1]))
+
+    def test_rare_and_required_skills_weigh_more(self):
+        """Test that required skills outweigh preferred ones."""
+        weights = self.index.query_weights(["spark"], ["spark", "sql"])
+        self.assertGreater(weights["spark"], weights["sql"])
+
+    def test_remove_and_replace(self):
+        """Test that removed candidates are never returned and re-adding replaces them."""
+        weights = self.index.query_weights(["python"], [])
+        for candidate_id, skills in list(self.skills.items()):
+            if "python" in skills:
+                self.assertTrue(self.index.remove(candidate_id))
+                del self.skills[candidate_id]
+        self.assertEqual(self.index.top_k(weights, 10), [])
+
+        self.index.add("cand-new", ["Python", "AWS"], payload="new")
+        results = self.index.top_k(self.index.query_weights(["python"], []), 10)
+        self.assertEqual([result.candidate_id for result in results], ["cand-new"])
+        self.assertFalse(self.index.remove("missing"))
+
+
+if __name__ == '__main__':
+    unittest.main()
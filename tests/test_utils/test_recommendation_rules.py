@@ -0,0 +1,107 @@
+import unittest
+
+from resume_ats_scorer.models.schemas import (
+    JobRequirement,
+    ParsedJobDescription,
+    ParsedResume,
+    ResumeScoreResponse,
+    ResumeSection
+)
+from resume_ats_scorer.utils.recommendation_rules import (
+    RecommendationFeatures,
+    RecommendationRule,
+    RuleIndex,
+    get_rule_index
+)
+
+
+def _score(content_score=90.0, format_score=90.0, recommendations=None, requirement_matches=None):
+    return ResumeScoreResponse(
+        success=True,
+        overall_score=80.0,
+        content_score=content_score,
+        format_score=format_score,
+        section_scores={},
+        recommendations=recommendations or [],
+        requirement_matches=requirement_matches or {},
+        breakdown={}
+    )
+
+
+JOB = ParsedJobDescription(
+    title="Backend Engineer",
+    company="Acme",
+    description="Python, Kubernetes",
+    requirements=[
+        JobRequirement(category="skill", description="Python"),
+        JobRequirement(category="skill", description="Kubernetes"),
+    ]
+)
+
+
+class TestRecommendationRules(unittest.TestCase):
+    """Test trigger-indexed recommendation rules."""
+
+    def test_triggered_rules_only(self):
+        """Test that recommendations come from the triggered features, score recommendations first."""
+        resume = ParsedResume(
+            raw_text="x" * 600,
+            sections={
+                ResumeSection.SKILLS: "Python, SQL and a long list of other tools " * 3,
+                ResumeSection.EXPERIENCE: "Led the platform team and cut costs by 30% " * 5,
+                ResumeSection.EDUCATION: "B.S. Computer Science",
+            }
+        )
+        score = _score(recommendations=["Score says hi"], requirement_matches={"Python": "python"})
+        recommendations = get_rule_index().evaluate(RecommendationFeatures(resume, JOB, score), limit=10)
+        self.assertEqual(recommendations, [
+            "Score says hi",
+            "Add these missing sections for better ATS compatibility: Summary",
+            "Consider incorporating these keywords in your resume: Kubernetes",
+            "Consider highlighting these skills if you have them: Kubernetes",
+        ])
+
+    def test_bands_and_experience_wording(self):
+        """Test score-band checklists and the experience wording rules."""
+        resume = ParsedResume(raw_text="short", sections={ResumeSection.EXPERIENCE: "Responsible for servers"})
+        features = RecommendationFeatures(resume, JOB, _score(content_score=40.0, format_score=40.0))
+        recommendations = get_rule_index().evaluate(features, limit=30)
+        self.assertIn("Your resume appears too short. Consider adding more detailed content to better showcase your qualifications.", recommendations)
+        self.assertTrue(any(rec.startswith("Use strong action verbs") for rec in recommendations))
+        self.assertTrue(any(rec.startswith("Consider adding quantifiable achievements") for rec in recommendations))
+        self.assertEqual(recommendations[-4:][0], "For better keyword matching:")
+
+    def test_stops_when_filled(self):
+        """Test that evaluation stops at the limit and never renders untriggered or later rules."""
+        rendered = []
+
+        def render(name):
+            def _render(features):
+                rendered.append(name)
+                return [f"{name} first", "shared"]
+            return _render
+
+        index = RuleIndex([
+            RecommendationRule("late", "missing_sections", 5, render("late")),
+            RecommendationRule("early", "missing_sections", 1, render("early")),
+            RecommendationRule("untriggered", "length:long", 0, render("untriggered")),
+            RecommendationRule("after_limit", "missing_sections", 9, render("after_limit")),
+        ])
+        features = RecommendationFeatures(ParsedResume(raw_text="text"), JOB, _score())
+        self.assertEqual(index.evaluate(features, limit=3), ["early first", "shared", "late first"])
+        self.assertEqual(rendered, ["early", "late"])
+
+    def test_max_priority_skips_extra_rules(self):
+        """Test that rules above max_priority are not evaluated (degraded mode)."""
+        rendered = []
+        index = RuleIndex([
+            RecommendationRule("core", "missing_sections", 10, lambda features: rendered.append("core") or "core"),
+            RecommendationRule("extra", "missing_sections", 60, lambda features: rendered.append("extra") or "extra"),
+        ])
+        features = RecommendationFeatures(ParsedResume(raw_text="text"), JOB, _score())
+        self.assertEqual(index.evaluate(features, limit=10, max_priority=41), ["core"])
+        self.assertEqual(rendered, ["core"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from resume_ats_scorer.models.schemas import AnalysisLevel, JobRequirements, KeywordAnalysis, ResumeScoreResponse
+from resume_ats_scorer.utils import response_cache, scoring
+from resume_ats_scorer.utils.response_cache import ResponseCache, content_hash, response_cache_key
+
+
+def _response(score: float) -> ResumeScoreResponse:
+    return ResumeScoreResponse(
+        success=True,
+        overall_score=score,
+        content_score=score / 2,
+        format_score=10.0,
+        section_scores={"skills": 5.0},
+        recommendations=["Add metrics"],
+        breakdown={"content_match": {"keyword_matching": 0.5}}
+    )
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test memoization of scoring responses."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "responses.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_key_covers_inputs_and_scorer_version(self):
+        """Test that keys change with any input and with the scorer version."""
+        key = response_cache_key("score_resume", content_hash("resume"), content_hash("job"), "linkedin")
+        self.assertEqual(key, response_cache_key("score_resume", content_hash("resume"), content_hash("job"), "linkedin"))
+        self.assertNotEqual(key, response_cache_key("score_resume", content_hash("resume"), content_hash("job"), "naukri"))
+        self.assertNotEqual(key, response_cache_key("calculate_resume_score", content_hash("resume"), content_hash("job"), "linkedin"))
+        with patch.object(response_cache, "SCORER_VERSION", "next"):
+            self.assertNotEqual(key, response_cache_key("score_resume", content_hash("resume"), content_hash("job"), "linkedin"))
+
+    def test_lru_eviction_and_copies(self):
+        """Test that the memory tier is bounded and hits never share state with callers."""
+        cache = ResponseCache(max_size=2)
+        cache.put("a", _response(10))
+        cache.put("b", _response(20))
+        cache.get("a")
+        cache.put("c", _response(30))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+        hit = cache.get("a")
+        hit.recommendations.append("mutated")
+        self.assertEqual(cache.get("a").recommendations, ["Add metrics"])
+
+    def test_persistent_tier_survives_restart(self):
+        """Test that responses written to SQLite are served by a new cache of the current version only."""
+        ResponseCache(max_size=1, path=self.path).put("a", _response(42))
+        self.assertEqual(ResponseCache(max_size=1, path=self.path).get("a").overall_score, 42)
+
+        with patch.object(response_cache, "SCORER_VERSION", "next"):
+            self.assertIsNone(ResponseCache(max_size=1, path=self.path).get("a"))
+
+    def test_persistent_tier_is_bounded(self):
+        """Test that the SQLite tier keeps only the most recent entries."""
+        cache = ResponseCache(max_size=1, path=self.path, persistent_max_size=2)
+        for number in range(4):
+            cache.put(f"key-{number}", _response(number))
+        reopened = ResponseCache(max_size=4, path=self.path)
+        self.assertIsNone(reopened.get("key-0"))
+        self.assertIsNone(reopened.get("key-1"))
+        self.assertEqual(reopened.get("key-3").overall_score, 3)
+
+
+class TestScoringResponseCache(unittest.TestCase):
+    """Test memoization in calculate_resume_score_with_cache_status."""
+
+    def test_same_content_under_another_filename_is_a_hit(self):
+        """Test that the cache key ignores the file name and hits carry the caller's file name."""
+        arguments = dict(
+            resume_text="SUMMARY\nBackend developer\nEXPERIENCE\nBuilt Python services on AWS\nSKILLS\nPython, AWS",
+            resume_keywords=KeywordAnalysis(hard_skills=["python", "aws"]),
+            job_requirements=JobRequirements(required_skills=["python", "aws"], preferred_skills=["docker"]),
+            job_title="Backend Engineer",
+            file_type="txt",
+            analysis_level=AnalysisLevel.QUICK
+        )
+        with patch.object(scoring, "get_response_cache", return_value=ResponseCache(max_size=4)):
+            first, first_hit = scoring.calculate_resume_score_with_cache_status(resume_filename="jane.txt", **arguments)
+            second, second_hit = scoring.calculate_resume_score_with_cache_status(resume_filename="copy.txt", **arguments)
+
+        self.assertEqual((first_hit, second_hit), (False, True))
+        self.assertEqual((first.filename, second.filename), ("jane.txt", "copy.txt"))
+        self.assertEqual(second.overall_score, first.overall_score)
+        self.assertEqual(second.content_score, first.content_score)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,308 @@
+import time
+import fcntl
+import random
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from resume_ats_scorer.agents.resume_parser import identify_sections
+from resume_ats_scorer.models.schemas import ParsedResume, ResumeSection
+from resume_ats_scorer.utils.ranking import CandidateIndex
+from resume_ats_scorer.utils import resume_index
+from resume_ats_scorer.utils.resume_index import (
+    SKIP_INTERVAL,
+    PersistentCandidateIndex,
+    ResumeIndex,
+    ResumeIndexWriter,
+    _PostingsCursor,
+    _directory_lock,
+    decode_postings,
+    encode_postings
+)
+
+
+class TestPostingsEncoding(unittest.TestCase):
+    """Test the delta + varint postings encoding."""
+
+    def test_round_trip(self):
+        """Test that encoded postings decode to the same documents, sections and frequencies."""
+        postings = [(0, {"skills": 1}), (5, {"experience": 3, "keywords": 1}), (300, {"other": 200}), (70000, {"summary": 1})]
+        encoded = encode_postings(postings)
+        self.assertEqual(decode_postings(encoded, 0, len(encoded)), postings)
+        # Small gaps and counts fit in one byte each
+        self.assertEqual(len(encode_postings([(1, {"skills": 1}), (2, {"skills": 1})])), 8)
+
+    def test_skip_entries(self):
+        """Test that every SKIP_INTERVAL-th posting gets a skip entry pointing past it."""
+        postings = [(doc_id * 3, {"skills": 1}) for doc_id in range(2 * SKIP_INTERVAL + 5)]
+        skips = ([], [])
+        encoded = encode_postings(postings, skips)
+        self.assertEqual(skips[0], [postings[SKIP_INTERVAL - 1][0], postings[2 * SKIP_INTERVAL - 1][0]])
+        # Decoding resumes after the skipped posting, with ids relative to it
+        rest = decode_postings(encoded, skips[1][0], len(encoded))
+        self.assertEqual(len(rest), len(postings) - SKIP_INTERVAL)
+        self.assertEqual(rest[0][0], postings[SKIP_INTERVAL][0] - postings[SKIP_INTERVAL - 1][0])
+
+
+class TestResumeIndex(unittest.TestCase):
+    """Test the persistent, segmented resume index."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.directory = tempfile.mkdtemp()
+        self.resume = ParsedResume(
+            raw_text="Python developer",
+            sections={
+                ResumeSection.SKILLS: "Python, Docker, Kubernetes",
+                ResumeSection.EXPERIENCE: "Built Python services on AWS with Docker. Python tooling."
+            },
+            keywords=["python"]
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_postings_record_sections_and_frequency(self):
+        """Test that postings keep per-section frequencies and stored resumes round-trip."""
+        writer = ResumeIndexWriter(self.directory)
+        writer.add("r1", self.resume, keywords=["leadership"], payload={"name": "Jane"})
+        writer.commit()
+
+        index = ResumeIndex(self.directory)
+        [posting] = index.postings("python")
+        self.assertEqual(posting.resume_id, "r1")
+        self.assertEqual(posting.sections, {"experience": 2, "skills": 1, "keywords": 1})
+        self.assertEqual(index.postings("aws")[0].sections, {"experience": 1})
+        self.assertEqual(index.document_frequency("leadership"), 1)
+        self.assertEqual(index.get("r1"), {"name": "Jane"})
+        self.assertEqual(index.get_resume("r1"), self.resume)
+
+    def test_plain_text_resume_is_indexed_by_section(self):
+        """Test that a resume text segmented like an uploaded file gets per-section postings."""
+        text = "Jane Doe\nSUMMARY\nBackend developer\nEXPERIENCE\nBuilt Python services on AWS\nSKILLS\nPython, Docker"
+        writer = ResumeIndexWriter(self.directory)
+        writer.add("r1", ParsedResume(raw_text=text, sections=identify_sections(text)))
+        writer.commit()
+
+        index = ResumeIndex(self.directory)
+        self.assertEqual(index.postings("python")[0].sections, {"experience": 1, "skills": 1})
+        self.assertEqual(index.postings("aws")[0].sections, {"experience": 1})
+
+    def test_incremental_add_delete_and_compaction(self):
+        """Test that changes from other writers become visible on refresh and survive compaction."""
+        writer = ResumeIndexWriter(self.directory, merge_factor=100)
+        writer.add("r1", self.resume)
+        writer.add("r2", ParsedResume(raw_text="Java and SQL"))
+        writer.commit()
+        index = ResumeIndex(self.directory)
+        self.assertEqual(len(index), 2)
+
+        writer.add("r3", ParsedResume(raw_text="Python and SQL"))
+        writer.delete("r1")
+        writer.add("r2", ParsedResume(raw_text="Go"))
+        writer.commit()
+        self.assertEqual(len(index), 2)
+        self.assertTrue(index.refresh())
+        self.assertEqual(index.resume_ids(), ["r3", "r2"])
+        self.assertEqual([posting.resume_id for posting in index.postings("python")], ["r3"])
+        self.assertEqual(index.postings("java"), [])
+        self.assertEqual(index.segment_count, 2)
+        self.assertEqual(index.deleted_count, 2)
+
+        writer.compact()
+        index.refresh()
+        self.assertEqual(index.segment_count, 1)
+        self.assertEqual(index.deleted_count, 0)
+        self.assertEqual([posting.resume_id for posting in index.postings("sql")], ["r3"])
+        self.assertEqual(index.get_resume("r2").raw_text, "Go")
+
+    def test_refresh_waits_for_writers(self):
+        """Test that refresh does not read the manifest while a writer holds the directory lock."""
+        writer = ResumeIndexWriter(self.directory)
+        writer.add("r1", self.resume)
+        writer.commit()
+        index = ResumeIndex(self.directory)
+        writer.add("r2", self.resume)
+        writer.commit()
+
+        refreshed = threading.Event()
+        with _directory_lock(self.directory, fcntl.LOCK_EX):
+            thread = threading.Thread(target=lambda: index.refresh() and refreshed.set())
+            thread.start()
+            time.sleep(0.1)
+            self.assertFalse(refreshed.is_set())
+        thread.join(5)
+        self.assertTrue(refreshed.is_set())
+        self.assertEqual(len(index), 2)
+
+    def test_document_frequency_discounts_deleted_resumes(self):
+        """Test that document frequencies from the segment counts leave out tombstoned resumes."""
+        writer = ResumeIndexWriter(self.directory, merge_factor=100)
+        for number in range(6):
+            writer.add(f"r{number}", ParsedResume(raw_text=""), keywords=["python"] + (["java"] if number % 2 else []))
+        writer.commit()
+        writer.delete("r1")
+        writer.add("r2", ParsedResume(raw_text=""), keywords=["java"])
+        writer.commit()
+
+        index = ResumeIndex(self.directory)
+        for term in ("python", "java", "go"):
+            self.assertEqual(index.document_frequency(term), len(index.postings(term)))
+        self.assertEqual(index.document_frequency("python"), 4)
+        self.assertEqual(index.document_frequency("java"), 3)
+
+    def test_postings_cursor_skips_ahead(self):
+        """Test that seeking lands on the same posting as a linear scan, across segments, without reading every posting."""
+        writer = ResumeIndexWriter(self.directory, merge_factor=100)
+        for batch in range(3):
+            for number in range(100):
+                skills = ["python"] if number % 3 else ["python", "rust"]
+                writer.add(f"r{batch}-{number}", ParsedResume(raw_text=""), keywords=skills)
+            writer.commit()
+        index = ResumeIndex(self.directory)
+        expected = [index._doc_ids[posting.resume_id] for posting in index.postings("python")]
+        spans = [(segment, segment.terms["python"]) for segment in index._order]
+
+        rng = random.Random(3)
+        targets = sorted(rng.sample(range(expected[-1] + 10), 20))
+        cursor = _PostingsCursor(spans, 1.0)
+        skipped = 0
+        for target in targets:
+            skipped += cursor.seek(target)
+            following = [doc_id for doc_id in expected if doc_id >= target]
+            self.assertEqual(cursor.doc, following[0] if following else float("inf"))
+        self.assertGreater(skipped, 0)
+
+        cursor = _PostingsCursor(spans, 1.0)
+        walked = []
+        while cursor.doc != float("inf"):
+            walked.append(cursor.doc)
+            cursor.next()
+        self.assertEqual(walked, expected)
+
+    def test_top_k_matches_in_memory_index(self):
+        """Test that ranking over the on-disk index agrees with the in-memory candidate index."""
+        rng = random.Random(5)
+        vocabulary = ["python", "java", "aws", "docker", "kubernetes", "react", "sql", "terraform"]
+        writer = ResumeIndexWriter(self.directory, merge_factor=3)
+        memory_index = CandidateIndex()
+        for number in range(120):
+            skills = rng.sample(vocabulary, rng.randint(1, 4))
+            writer.add(f"cand-{number}", ParsedResume(raw_text=""), keywords=skills, payload=number)
+            memory_index.add(f"cand-{number}", skills, number)
+            if number % 25 == 24:
+                writer.commit()
+        writer.commit()
+
+        index = ResumeIndex(self.directory)
+        self.assertLessEqual(index.segment_count, 3)
+        weights = index.query_weights(["python", "terraform"], ["react"])
+        self.assertEqual(weights, memory_index.query_weights(["python", "terraform"], ["react"]))
+        results = index.top_k(weights, 10)
+        expected = memory_index.top_k(weights, 10)
+        self.assertEqual([result.score for result in results], [result.score for result in expected])
+        self.assertEqual(results[0].payload, int(results[0].candidate_id.split("-")[1]))
+
+    def test_commit_reads_only_new_segments(self):
+        """Test that a commit does not re-read the segments the writer already knows."""
+        writer = ResumeIndexWriter(self.directory, merge_factor=100)
+        other = ResumeIndexWriter(self.directory, merge_factor=100)
+        for number in range(5):
+            writer.add(f"r{number}", ParsedResume(raw_text=""), keywords=["python"])
+            writer.commit()
+        other.add("o1", ParsedResume(raw_text=""), keywords=["java"])
+        other.delete("r0")
+        other.commit()
+
+        with mock.patch.object(resume_index, "_segment_documents", wraps=resume_index._segment_documents) as read:
+            writer.add("r1", ParsedResume(raw_text=""), keywords=["go"])
+            writer.delete("o1")
+            writer.commit()
+        # Only the segment the other writer published
+        self.assertEqual(read.call_count, 1)
+
+        index = ResumeIndex(self.directory)
+        self.assertEqual(index.resume_ids(), ["r2", "r3", "r4", "r1"])
+        self.assertEqual(index.deleted_count, 3)
+
+    def test_tiered_merge_bounds_segment_count(self):
+        """Test that commits merge runs of similar-sized segments and leave larger segments alone."""
+        writer = ResumeIndexWriter(self.directory, merge_factor=4)
+        sizes = []
+        for number in range(70):
+            writer.add(f"r{number}", ParsedResume(raw_text=""), keywords=["python"])
+            writer.commit()
+            manifest = resume_index._read_manifest(self.directory)
+            sizes = [manifest["segment_sizes"][name] for name in manifest["segments"]]
+            # At most merge_factor - 1 segments per tier
+            self.assertLessEqual(len(sizes), 3 * 4)
+        self.assertEqual(sizes, [64, 4, 1, 1])
+
+        writer.compact()
+        index = ResumeIndex(self.directory)
+        self.assertEqual(index.segment_count, 1)
+        self.assertEqual(len(index), 70)
+        self.assertEqual(index.resume_ids(), [f"r{number}" for number in range(70)])
+
+    def test_merge_drops_tombstones_of_merged_segments(self):
+        """Test that a tiered merge drops the deleted documents of the merged segments only."""
+        writer = ResumeIndexWriter(self.directory, merge_factor=2)
+        writer.add("r0", ParsedResume(raw_text=""), keywords=["python"])
+        writer.commit()
+        writer.add("r1", ParsedResume(raw_text=""), keywords=["python"])
+        writer.delete("r0")
+        writer.commit()
+
+        index = ResumeIndex(self.directory)
+        self.assertEqual(index.segment_count, 1)
+        self.assertEqual(index.deleted_count, 0)
+        self.assertEqual(index.resume_ids(), ["r1"])
+        self.assertEqual(index.document_frequency("python"), 1)
+
+
+class TestPersistentCandidateIndex(unittest.TestCase):
+    """Test the ranking API's store over the resume index."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_adds_are_committed_together(self):
+        """Test that buffered adds become one segment, visible to this process right away."""
+        store = PersistentCandidateIndex(self.directory, commit_interval=60)
+        for number in range(5):
+            store.add(f"c{number}", ParsedResume(raw_text=""), ["python"], {"number": number})
+        self.assertEqual(len(store), 5)
+        self.assertEqual(store.reader.segment_count, 0)
+
+        self.assertEqual(store.get("c3"), {"number": 3})
+        self.assertEqual(store.reader.segment_count, 1)
+        self.assertTrue(store.remove("c3"))
+        self.assertFalse(store.remove("missing"))
+        self.assertEqual(len(store), 4)
+        self.assertIn("python", store.query_weights(["python"], []))
+        self.assertEqual(len(ResumeIndex(self.directory)), 4)
+
+    def test_add_many_and_timed_flush(self):
+        """Test that add_many commits at once and single adds are committed after the interval."""
+        store = PersistentCandidateIndex(self.directory, commit_interval=0.05)
+        store.add_many([(f"c{number}", ParsedResume(raw_text=""), ["java"], None) for number in range(3)])
+        self.assertEqual(len(ResumeIndex(self.directory)), 3)
+
+        store.add("c3", ParsedResume(raw_text=""), ["java"])
+        deadline = time.monotonic() + 5
+        # The timer's flush refreshes the store's own reader last
+        while len(store.reader) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(store.writer.pending, {})
+        self.assertEqual(len(ResumeIndex(self.directory)), 4)
+        self.assertEqual(ResumeIndex(self.directory).segment_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
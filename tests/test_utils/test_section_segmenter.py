@@ -0,0 +1,59 @@
+import unittest
+
+from resume_ats_scorer.utils.section_segmenter import SectionSegmenter
+from resume_ats_scorer.utils.scoring import identify_resume_sections
+
+
+class TestSectionSegmenter(unittest.TestCase):
+    """Test the single-pass section segmenter."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.segmenter = SectionSegmenter({
+            'experience': ['experience', 'work experience'],
+            'skills': ['skills', 'technical skills'],
+            'education': ['education'],
+        })
+        self.resume = (
+            "Jane Doe\n"
+            "WORK EXPERIENCE\n"
+            "Engineer at ABC, experience with Python\n"
+            "\n"
+            "## Technical Skills:\n"
+            "Python, SQL\n"
+            "Education: B.S. Computer Science\n"
+        )
+
+    def test_spans(self):
+        """Test that spans cover each section up to the next header."""
+        spans = self.segmenter.segment(self.resume)
+        self.assertEqual([span.name for span in spans], ['experience', 'skills', 'education'])
+
+        experience = spans[0]
+        self.assertEqual(self.resume[experience.header_start:experience.start], "WORK EXPERIENCE\n")
+        self.assertEqual(experience.end, spans[1].header_start)
+        self.assertEqual(spans[-1].end, len(self.resume))
+
+    def test_sections(self):
+        """Test section contents, including inline headers."""
+        sections = self.segmenter.sections(self.resume)
+        self.assertEqual(sections['experience'], "Engineer at ABC, experience with Python")
+        self.assertEqual(sections['skills'], "Python, SQL")
+        self.assertEqual(sections['education'], "B.S. Computer Science")
+
+    def test_header_words_in_prose_are_ignored(self):
+        """Test that lines merely starting with a header word are not headers."""
+        self.assertIsNone(self.segmenter.match_header("Experience-driven engineer"))
+        self.assertIsNone(self.segmenter.match_header("Skills in Python and SQL"))
+        self.assertEqual(self.segmenter.match_header("  Skills  "), ('skills', 10))
+
+    def test_identify_resume_sections(self):
+        """Test that scoring sections keep their headers and default to empty."""
+        sections = identify_resume_sections("SUMMARY\nBuilt things.\nSKILLS\nPython\n")
+        self.assertEqual(sections['summary'], "SUMMARY\nBuilt things.")
+        self.assertEqual(sections['skills'], "SKILLS\nPython")
+        self.assertEqual(sections['education'], "")
+
+
+if __name__ == '__main__':
+    unittest.main()
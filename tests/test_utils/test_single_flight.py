@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+
+from resume_ats_scorer.utils.single_flight import (
+    FOLLOWER,
+    LEADER,
+    REPLAYED,
+    IdempotencyKeyMismatch,
+    SingleFlight
+)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test coalescing of identical in-flight requests and idempotency-key replay."""
+
+    def test_concurrent_duplicates_share_one_computation(self):
+        """Test that concurrent calls with one key run func once and all get its result."""
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"score": 80}
+
+        async def scenario():
+            flight = SingleFlight("test_coalesce")
+            results = await asyncio.gather(*(flight.do("same", compute) for _ in range(5)), flight.do("other", compute))
+            return flight, results
+
+        flight, results = asyncio.run(scenario())
+        self.assertEqual(len(calls), 2)
+        self.assertEqual([role for _, role in results[:5]], [LEADER] + [FOLLOWER] * 4)
+        self.assertTrue(all(value == {"score": 80} for value, _ in results))
+        self.assertEqual(flight.in_flight, 0)
+
+    def test_failures_reach_every_waiter_and_are_not_kept(self):
+        """Test that an exception is raised for all waiters and the next call runs again."""
+        attempts = []
+
+        async def compute():
+            attempts.append(1)
+            await asyncio.sleep(0.01)
+            if len(attempts) == 1:
+                raise RuntimeError("parser crashed")
+            return "ok"
+
+        async def scenario():
+            flight = SingleFlight("test_failure")
+            results = await asyncio.gather(flight.do("key", compute), flight.do("key", compute), return_exceptions=True)
+            return results, await flight.do("key", compute)
+
+        results, retry = asyncio.run(scenario())
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(retry, ("ok", LEADER))
+
+    def test_idempotency_key_replay(self):
+        """Test replay within the retention window, expiry, and rejection of reused keys."""
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return len(calls)
+
+        async def scenario():
+            flight = SingleFlight("test_idempotency", retention_seconds=0.05)
+            first = await flight.do("request-a", compute, idempotency_key="retry-1")
+            replay = await flight.do("request-a", compute, idempotency_key="retry-1")
+            with self.assertRaises(IdempotencyKeyMismatch):
+                await flight.do("request-b", compute, idempotency_key="retry-1")
+            without_key = await flight.do("request-a", compute)
+            await asyncio.sleep(0.06)
+            expired = await flight.do("request-a", compute, idempotency_key="retry-1")
+            return first, replay, without_key, expired
+
+        first, replay, without_key, expired = asyncio.run(scenario())
+        self.assertEqual(first, (1, LEADER))
+        self.assertEqual(replay, (1, REPLAYED))
+        self.assertEqual(without_key, (2, LEADER))
+        self.assertEqual(expired, (3, LEADER))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from resume_ats_scorer.utils.skill_matcher import SkillMatcher
+
+
+class TestSkillMatcher(unittest.TestCase):
+    """Test the Aho-Corasick skill matcher."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.matcher = SkillMatcher(['java', 'javascript', 'react', 'react native', 'c++', 'ci/cd', 'machine learning'])
+
+    def test_find_skills(self):
+        """Test finding skills in a single scan."""
+        text = "Built React Native apps in JavaScript and Java, with CI/CD pipelines."
+
+        result = self.matcher.find_skills(text)
+
+        # Overlapping skills are all reported in order of first occurrence
+        self.assertEqual(result, ['react', 'react native', 'javascript', 'java', 'ci/cd'])
+
+    def test_word_boundaries(self):
+        """Test that skills are not matched inside longer words."""
+        self.assertEqual(self.matcher.find_skills("javas and reactive systems"), [])
+        self.assertEqual(self.matcher.find_skills("Expert in C++."), ['c++'])
+
+    def test_whitespace_normalization(self):
+        """Test that multi-word skills match across line breaks and repeated spaces."""
+        result = self.matcher.find_skills("Machine\n   Learning engineer")
+
+        self.assertEqual(result, ['machine learning'])
+
+    def test_aliases_report_canonical_skill(self):
+        """Test that aliases are reported under their canonical skill."""
+        matcher = SkillMatcher(['kubernetes', 'javascript'], aliases={'k8s': 'kubernetes', 'js': 'javascript'})
+
+        result = matcher.find_skills("Deployed JS services to K8s and Kubernetes")
+
+        self.assertEqual(result, ['javascript', 'kubernetes'])
+
+    def test_iter_matches_offsets(self):
+        """Test that match offsets point into the normalized text."""
+        text = "java and react"
+
+        matches = list(self.matcher.iter_matches(text))
+
+        self.assertEqual(matches, [(0, 4, 'java'), (9, 14, 'react')])
+        for start, end, skill in matches:
+            self.assertEqual(text[start:end], skill)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import json
+import time
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from resume_ats_scorer.core.exceptions import TaxonomyError
+from resume_ats_scorer.utils import skill_taxonomy
+from resume_ats_scorer.utils.skill_taxonomy import load_taxonomy, get_taxonomy
+
+
+class TestSkillTaxonomy(unittest.TestCase):
+    """Test the compiled skill taxonomy index."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.taxonomy = load_taxonomy()
+
+    def test_bundled_taxonomy_is_versioned(self):
+        """Test that the bundled taxonomy loads with a version."""
+        self.assertTrue(self.taxonomy.version)
+        self.assertIn('kubernetes', self.taxonomy.skills)
+
+    def test_canonicalize_aliases(self):
+        """Test alias to canonical id lookups."""
+        self.assertEqual(self.taxonomy.canonicalize('K8s'), 'kubernetes')
+        self.assertEqual(self.taxonomy.canonicalize('js'), 'javascript')
+        self.assertEqual(self.taxonomy.canonicalize('Postgres'), 'postgresql')
+        self.assertIsNone(self.taxonomy.canonicalize('underwater basket weaving'))
+
+    def test_match_tokens_prefers_longest_phrase(self):
+        """Test matching multi-token phrases in a token stream."""
+        tokens = "built react native apps with google cloud platform and k8s".split()
+
+        result = self.taxonomy.match_tokens(tokens)
+
+        self.assertEqual(result, ['react native', 'gcp', 'kubernetes'])
+
+    def test_hard_and_soft_matchers(self):
+        """Test that matchers can be restricted to a skill type."""
+        text = "Strong communication skills and Python experience"
+
+        self.assertEqual(self.taxonomy.matcher('hard').find_skills(text), ['python'])
+        self.assertEqual(self.taxonomy.matcher('soft').find_skills(text), ['communication'])
+
+    def test_conflicting_alias_rejected(self):
+        """Test that an alias mapped to two skills is rejected."""
+        document = {
+            "version": "test",
+            "skills": [
+                {"id": "go", "aliases": ["golang"]},
+                {"id": "golang tools", "aliases": ["golang"]}
+            ]
+        }
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump(document, f)
+
+        try:
+            with self.assertRaises(TaxonomyError):
+                load_taxonomy(f.name)
+        finally:
+            os.unlink(f.name)
+
+
+class TestTaxonomyHotReload(unittest.TestCase):
+    """Test hot-swapping the taxonomy when the file changes."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.path = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False).name
+        self._write("v1", [{"id": "kubernetes", "aliases": []}])
+
+        self.settings_patch = patch.multiple(
+            skill_taxonomy.settings,
+            SKILL_TAXONOMY_PATH=self.path,
+            SKILL_TAXONOMY_RELOAD_INTERVAL=0.01
+        )
+        self.settings_patch.start()
+        skill_taxonomy.reload_taxonomy()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.settings_patch.stop()
+        skill_taxonomy.reload_taxonomy()
+        os.unlink(self.path)
+
+    def _write(self, version, skills):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({"version": version, "skills": skills}, f)
+
+    def test_reload_on_file_change(self):
+        """Test that a changed file is picked up without a restart."""
+        self.assertEqual(get_taxonomy().version, "v1")
+
+        self._write("v2", [{"id": "kubernetes", "aliases": ["k8s"]}])
+        os.utime(self.path, (time.time() + 5, time.time() + 5))
+        time.sleep(0.02)
+
+        taxonomy = get_taxonomy()
+        self.assertEqual(taxonomy.version, "v2")
+        self.assertEqual(taxonomy.canonicalize('k8s'), 'kubernetes')
+
+    def test_invalid_file_keeps_previous_version(self):
+        """Test that a broken taxonomy file does not replace the active index."""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write("{not json")
+
+        taxonomy = skill_taxonomy.reload_taxonomy()
+
+        self.assertEqual(taxonomy.version, "v1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+from resume_ats_scorer.core.metrics import MetricsRegistry
+from resume_ats_scorer.utils.token_cache import TokenNormalizationCache
+
+
+class TestTokenNormalizationCache(unittest.TestCase):
+    """Test the memoized lemma/stopword cache."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.calls = []
+
+        def normalizer(token):
+            self.calls.append(token)
+            return token.rstrip('s')
+
+        self.cache = TokenNormalizationCache(normalizer, {'the', 'and'}, max_size=3)
+
+    def test_normalize_is_memoized(self):
+        """Test that each distinct token is normalized once."""
+        self.assertEqual(self.cache.normalize('skills'), ('skill', False))
+        self.assertEqual(self.cache.normalize('skills'), ('skill', False))
+        self.assertEqual(self.cache.normalize('the'), ('the', True))
+        self.assertEqual(self.calls, ['skills', 'the'])
+
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+
+    def test_cache_is_bounded(self):
+        """Test that least recently used tokens are evicted."""
+        for token in ['a', 'b', 'c', 'd']:
+            self.cache.normalize(token)
+        self.assertEqual(self.cache.stats()['size'], 3)
+        self.cache.normalize('a')
+        self.assertEqual(self.calls.count('a'), 2)
+
+    def test_warm_from_file(self):
+        """Test warming from a frequency list without affecting the hit rate."""
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write("Python 120\ndevelopers 80\n\nteams\n")
+        try:
+            self.assertEqual(self.cache.warm_from_file(f.name), 3)
+        finally:
+            os.unlink(f.name)
+
+        self.assertEqual(self.cache.stats()['hit_rate'], 0.0)
+        self.cache.normalize('developers')
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['hit_rate']), (1, 0, 1.0))
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test the in-process metrics registry."""
+
+    def test_snapshot(self):
+        """Test counters, gauges, callbacks and summaries in a snapshot."""
+        registry = MetricsRegistry()
+        registry.increment('requests')
+        registry.increment('requests', 2)
+        registry.set_gauge('queue_depth', 4)
+        registry.register_callback('hit_rate', lambda: 0.5)
+        for value in range(1, 101):
+            registry.observe('latency', value)
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot['counters']['requests'], 3)
+        self.assertEqual(snapshot['gauges'], {'queue_depth': 4, 'hit_rate': 0.5})
+        self.assertEqual(snapshot['summaries']['latency']['count'], 100)
+        self.assertEqual(snapshot['summaries']['latency']['p95'], 95)
+        self.assertEqual(registry.percentile('latency', 0.5), 50)
+
+
+if __name__ == '__main__':
+    unittest.main()